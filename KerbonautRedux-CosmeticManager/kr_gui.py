@@ -380,7 +380,7 @@ class KerbonautManager:
             return []
         meshes = set()
         for f in self.models_path.iterdir():
-            if f.suffix.lower() == '.idx':
+            if f.suffix.lower() in ('.idx', '.krm'):
                 meshes.add(f.stem)
         return sorted(list(meshes))
 
@@ -458,7 +458,7 @@ class KerbonautManager:
             shutil.rmtree(temp_extract)
             return False, f"'{mod_name}' v{mod_version} is already installed"
 
-        model_exts = {'.idx', '.vtx', '.nml', '.tex'}
+        model_exts = {'.idx', '.vtx', '.nml', '.tan', '.tex', '.srt', '.krm'}
         copied_models = []
         for file in mod_folder.iterdir():
             if file.suffix.lower() in model_exts:
@@ -226,7 +226,7 @@ class KerbonautReduxManager:
         print(f"   Author: {mod_info.author}")
         print(f"   {mod_info.description}")
 
-        model_exts = {'.idx', '.vtx', '.nml', '.tex'}
+        model_exts = {'.idx', '.vtx', '.nml', '.tan', '.tex', '.srt', '.krm'}
         copied_models = []
         for file in mod_folder.iterdir():
             if file.suffix.lower() in model_exts:
@@ -335,7 +335,7 @@ class KerbonautReduxManager:
             model_path = self.models_path / model
             if model_path.exists():
 
-                model_base = model.replace('.idx', '').replace('.vtx', '').replace('.nml', '').replace('.tex', '')
+                model_base = model.replace('.idx', '').replace('.vtx', '').replace('.nml', '').replace('.tan', '').replace('.tex', '').replace('.srt', '').replace('.krm', '')
                 if model_base in used_assets["meshes"] and model_base in meshes_to_remove:
                     print(f"   💾 Keeping model (still in use): {model}")
                 else:
@@ -596,11 +596,123 @@ class KerbonautReduxManager:
         print(f"📝 Created mod template at: {output_path}")
         print(f"   Edit pack.json and add your model/texture files, then zip and install!")
 
+    def verify_meshes(self, names: Optional[List[str]] = None) -> bool:
+
+        try:
+            import kr_mesh
+        except ImportError:
+            print("❌ verify-meshes needs numpy (pip install numpy)")
+            return False
+
+        reports = kr_mesh.verify_models(self.models_path, names)
+        if not reports:
+            print("📭 No meshes found in Models/")
+            return True
+
+        used = self.get_used_assets()["meshes"]
+        present = {r.name for r in reports}
+        missing = sorted(m for m in used if m and m not in present) if names is None else []
+
+        print(f"🔍 Verifying {len(reports)} mesh(es) in {self.models_path}")
+        print("-" * 60)
+        failed = 0
+        for report in reports:
+            if report.errors:
+                failed += 1
+                print(f"  ❌ {report.name}")
+            elif report.warnings:
+                print(f"  ⚠️  {report.name}")
+            else:
+                continue
+            for error in report.errors:
+                print(f"      - {error}")
+            for warning in report.warnings:
+                print(f"      - {warning}")
+
+        for mesh in missing:
+            failed += 1
+            print(f"  ❌ {mesh}: used in KerbonautRedux.json but not in Models/")
+
+        total_tris = sum(r.triangles for r in reports)
+        print("-" * 60)
+        print(f"   {sum(r.ok for r in reports)} ok, {failed} with errors, {total_tris} triangles total")
+        return failed == 0
+
+    def migrate_meshes(self, keep_streams: bool = False, force: bool = False) -> bool:
+
+        try:
+            import kr_mesh
+        except ImportError:
+            print("❌ migrate-meshes needs numpy (pip install numpy)")
+            return False
+
+        # Released plugin builds only read loose streams; packing would make KSP skip every mesh
+        supported = kr_mesh.plugin_supports(self.base_path, "krm")
+        if not supported and not force:
+            reason = "not found" if supported is None else "cannot load .krm files"
+            print(f"❌ {kr_mesh.PLUGIN_DLL} {reason} in {self.base_path}")
+            print("   Install a plugin built from src/ first, or pass --force to pack anyway")
+            return False
+
+        found = kr_mesh.find_meshes(self.models_path)
+        pending = sorted(name for name, exts in found.items() if ".vtx" in exts and kr_mesh.KRM_EXT not in exts)
+        if not pending:
+            print("📭 No loose .vtx/.tex/.nml/.idx meshes to migrate")
+            return True
+
+        print(f"📦 Packing {len(pending)} mesh(es) into .krm containers")
+        renamed = {}
+        failed = 0
+        bytes_before = bytes_after = 0
+        for name in pending:
+            streams = [self.models_path / f"{name}{ext}" for ext in kr_mesh.MESH_STREAMS]
+            streams = [p for p in streams if p.exists()]
+            try:
+                mesh = kr_mesh.load_mesh(self.models_path, name)
+                report = kr_mesh.validate_mesh(mesh)
+                if not report.ok:
+                    failed += 1
+                    print(f"   ❌ {name}: {'; '.join(report.errors)} (left as is)")
+                    continue
+                packed = self.models_path / f"{name}{kr_mesh.KRM_EXT}"
+                kr_mesh.write_krm(packed, mesh)
+                del mesh
+            except (OSError, ValueError) as e:
+                failed += 1
+                print(f"   ❌ {name}: {e}")
+                continue
+
+            bytes_before += sum(p.stat().st_size for p in streams)
+            bytes_after += packed.stat().st_size
+            print(f"   ✅ {name}: {len(streams)} files -> {packed.name}")
+            for p in streams:
+                renamed[p.name] = packed.name
+                if not keep_streams:
+                    p.unlink()
+
+        # Point installed-mod records at the container so uninstall still cleans up
+        if not keep_streams and renamed:
+            installed_mods = self.load_installed_mods()
+            for data in installed_mods.values():
+                models = [renamed.get(m, m) for m in data.get("models", [])]
+                data["models"] = list(dict.fromkeys(models))
+            self.save_installed_mods(installed_mods)
+
+        print("-" * 60)
+        print(f"   {len(pending) - failed} migrated, {failed} failed, {bytes_before // 1024}KB -> {bytes_after // 1024}KB")
+        return failed == 0
+
 def main():
     parser = argparse.ArgumentParser(
         description="KerbonautRedux Mod Manager - Manage KSP kerbal accessories",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=
+        epilog="""
+Examples:
+  %(prog)s list
+  %(prog)s install "packed mods/CoolHair.zip" --kerbal "Valentina Kerman"
+  %(prog)s verify-meshes
+  %(prog)s migrate-meshes
+"""
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
@@ -625,6 +737,14 @@ def main():
     create_parser = subparsers.add_parser("create", help="Create a new mod template")
     create_parser.add_argument("name", help="Name for the new mod")
 
+    verify_parser = subparsers.add_parser("verify-meshes", help="Check installed meshes in Models/ for broken data")
+    verify_parser.add_argument("names", nargs="*", help="Mesh names to check (default: all)")
+
+    migrate_parser = subparsers.add_parser("migrate-meshes", help="Repack loose mesh files in Models/ into .krm containers")
+    migrate_parser.add_argument("--keep", action="store_true", help="Keep the original .vtx/.tex/.nml/.idx files")
+    migrate_parser.add_argument("--force", action="store_true",
+                                help="Pack even if the installed plugin DLL cannot load .krm files")
+
     args = parser.parse_args()
 
     if not args.command:
@@ -647,6 +767,12 @@ def main():
         manager.edit_kerbal(args.name)
     elif args.command == "create":
         manager.create_mod_template(args.name)
+    elif args.command == "verify-meshes":
+        if not manager.verify_meshes(args.names or None):
+            sys.exit(1)
+    elif args.command == "migrate-meshes":
+        if not manager.migrate_meshes(args.keep, args.force):
+            sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+
+import os
+import struct
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+HEADER_SIZE = 4
+
+# extension -> (little-endian dtype, components per element)
+MESH_STREAMS = {
+    ".vtx": ("<f4", 3),
+    ".tex": ("<f4", 2),
+    ".nml": ("<f4", 3),
+    ".tan": ("<f4", 4),
+    ".idx": ("<i4", 1),
+    ".srt": ("<i4", 1),
+}
+
+# Packed .krm container; layout documented in mesh_converter.py / PackedMesh.cs
+KRM_EXT = ".krm"
+KRM_MAGIC = b"KRM1"
+KRM_VERSION = 1
+KRM_HEADER = struct.Struct("<4sHHIIII3f3f")
+KRM_STREAM = struct.Struct("<4sBBHIII4f4f12x")
+KRM_FLAG_BOUNDS = 1
+KRM_ALIGN = 16
+
+# stream tag -> MeshData attribute
+KRM_TAGS = {
+    b"POS ": "vertices",
+    b"UV0 ": "uvs",
+    b"NRM ": "normals",
+    b"TAN ": "tangents",
+    b"SRT ": "sorted_indices",
+    b"IDX ": "indices",
+}
+
+KRM_FLOAT32 = 1
+KRM_INT32 = 2
+KRM_UINT16 = 3
+KRM_FLOAT16 = 4
+KRM_SNORM16 = 5
+
+# format code -> little-endian dtype
+KRM_FORMATS = {
+    KRM_FLOAT32: "<f4",
+    KRM_INT32: "<i4",
+    KRM_UINT16: "<u2",
+    KRM_FLOAT16: "<f2",
+    KRM_SNORM16: "<i2",
+}
+
+KRM_IDENTITY_DECODE = (0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0)
+
+# HairConfigs.LoadMesh never sets Mesh.indexFormat, so Unity keeps 16-bit indices
+MAX_UNITY_VERTICES = 65535
+
+# Stream types the plugin loads only once rebuilt from src/, and the marker a
+# build that supports them contains (same table as mesh_converter.py)
+PLUGIN_DLL = "KerbonautRedux.dll"
+PLUGIN_FEATURES = {
+    "krm": b"PackedMesh",
+    "tan": ".tan".encode("utf-16-le"),
+}
+
+@dataclass
+class MeshData:
+    name: str
+    vertices: Optional[np.ndarray] = None
+    uvs: Optional[np.ndarray] = None
+    normals: Optional[np.ndarray] = None
+    tangents: Optional[np.ndarray] = None
+    indices: Optional[np.ndarray] = None
+    sorted_indices: Optional[np.ndarray] = None
+    bounds: Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]] = None
+
+@dataclass
+class MeshReport:
+    name: str
+    vertices: int = 0
+    triangles: int = 0
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+def read_stream(path: Path, dtype: str, width: int) -> np.ndarray:
+
+    # Count header followed by the payload; the payload is mapped, not copied
+    path = Path(path)
+    size = path.stat().st_size
+    if size < HEADER_SIZE:
+        raise ValueError(f"{path.name}: missing count header")
+
+    count = int(np.fromfile(path, dtype="<u4", count=1)[0])
+    shape = (count, width) if width > 1 else (count,)
+    needed = HEADER_SIZE + count * width * np.dtype(dtype).itemsize
+    if size < needed:
+        raise ValueError(f"{path.name}: header says {count} entries but file is truncated ({size} < {needed} bytes)")
+
+    if count == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=shape)
+
+def load_mesh(models_path: Path, name: str) -> MeshData:
+
+    mesh = MeshData(name=name)
+    attrs = {".vtx": "vertices", ".tex": "uvs", ".nml": "normals", ".tan": "tangents", ".idx": "indices",
+             ".srt": "sorted_indices"}
+    for ext, (dtype, width) in MESH_STREAMS.items():
+        path = Path(models_path) / f"{name}{ext}"
+        if path.exists():
+            setattr(mesh, attrs[ext], read_stream(path, dtype, width))
+    return mesh
+
+def read_krm(path: Path, name: Optional[str] = None) -> MeshData:
+
+    # Map the whole container once; every stream is a typed view into it
+    path = Path(path)
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    if len(data) < KRM_HEADER.size:
+        raise ValueError(f"{path.name}: too small for a .krm header")
+
+    magic, version, flags, stream_count, vertex_count, index_count, _, *bounds = KRM_HEADER.unpack_from(data, 0)
+    if magic != KRM_MAGIC:
+        raise ValueError(f"{path.name}: not a .krm file")
+    if version > KRM_VERSION:
+        raise ValueError(f"{path.name}: .krm version {version} is newer than this tool ({KRM_VERSION})")
+
+    mesh = MeshData(name=name or path.stem)
+    if flags & KRM_FLAG_BOUNDS:
+        mesh.bounds = (tuple(bounds[:3]), tuple(bounds[3:]))
+
+    table_end = KRM_HEADER.size + stream_count * KRM_STREAM.size
+    if len(data) < table_end:
+        raise ValueError(f"{path.name}: truncated stream table")
+
+    for i in range(stream_count):
+        tag, fmt, width, _, count, offset, size, *decode = KRM_STREAM.unpack_from(data, KRM_HEADER.size + i * KRM_STREAM.size)
+        if tag not in KRM_TAGS:
+            continue
+        if fmt not in KRM_FORMATS:
+            raise ValueError(f"{path.name}: stream {tag.decode()} has unknown format {fmt}")
+        dtype = np.dtype(KRM_FORMATS[fmt])
+        if size != count * width * dtype.itemsize or offset % KRM_ALIGN or offset + size > len(data):
+            raise ValueError(f"{path.name}: stream {tag.decode()} is out of bounds or misaligned")
+        shape = (count, width) if width > 1 else (count,)
+        stored = data[offset:offset + size].view(dtype).reshape(shape)
+        setattr(mesh, KRM_TAGS[tag], decode_stream(stored, fmt, tuple(decode)))
+
+    if mesh.vertices is not None and len(mesh.vertices) != vertex_count:
+        raise ValueError(f"{path.name}: header says {vertex_count} vertices, stream has {len(mesh.vertices)}")
+    if mesh.indices is not None and len(mesh.indices) != index_count:
+        raise ValueError(f"{path.name}: header says {index_count} indices, stream has {len(mesh.indices)}")
+    return mesh
+
+def decode_stream(stored: np.ndarray, fmt: int, decode: Tuple[float, ...] = KRM_IDENTITY_DECODE) -> np.ndarray:
+
+    # Raw 32-bit streams stay zero-copy views; 16-bit ones are expanded the
+    # way PackedMesh.DecodeStream does it: offset + scale * value in float32
+    if fmt in (KRM_INT32, KRM_UINT16) or (fmt == KRM_FLOAT32 and decode == KRM_IDENTITY_DECODE):
+        return stored
+    width = stored.shape[1] if stored.ndim > 1 else 1
+    offset = np.asarray(decode[:width], dtype=np.float32)
+    scale = np.asarray(decode[4:4 + width], dtype=np.float32)
+    if fmt == KRM_SNORM16:
+        values = np.maximum(stored.astype(np.float32) / np.float32(32767), np.float32(-1))
+    else:
+        values = stored.astype(np.float32)
+    return (offset + scale * values).reshape(stored.shape)
+
+def write_krm(path: Path, mesh: MeshData):
+
+    streams = []
+    for tag, attr in KRM_TAGS.items():
+        values = getattr(mesh, attr)
+        if values is None:
+            continue
+        fmt = KRM_INT32 if attr in ("indices", "sorted_indices") else KRM_FLOAT32
+        values = np.ascontiguousarray(values, dtype=KRM_FORMATS[fmt])
+        width = values.shape[1] if values.ndim > 1 else 1
+        streams.append((tag, fmt, width, values))
+
+    vertices = np.asarray(mesh.vertices, dtype=np.float32).reshape(-1, 3)
+    if len(vertices):
+        bounds = (*vertices.min(axis=0).tolist(), *vertices.max(axis=0).tolist())
+    else:
+        bounds = (0.0,) * 6
+    index_count = 0 if mesh.indices is None else len(mesh.indices)
+
+    table = b""
+    offset = _align(KRM_HEADER.size + KRM_STREAM.size * len(streams))
+    layout = []
+    for tag, fmt, width, values in streams:
+        table += KRM_STREAM.pack(tag, fmt, width, 0, len(values), offset, values.nbytes, 0, 0, 0, 0, 1, 1, 1, 1)
+        layout.append((offset, values))
+        offset = _align(offset + values.nbytes)
+
+    header = KRM_HEADER.pack(KRM_MAGIC, KRM_VERSION, KRM_FLAG_BOUNDS, len(streams), len(vertices), index_count, 0, *bounds)
+
+    # Write to a temp file first so an interrupted migration never leaves half a mesh
+    path = Path(path)
+    temp = path.with_name(path.name + ".tmp")
+    with open(temp, "wb") as f:
+        f.write(header + table)
+        for start, values in layout:
+            f.write(b"\0" * (start - f.tell()))
+            f.write(values)
+    os.replace(temp, path)
+
+def _align(offset: int) -> int:
+    return (offset + KRM_ALIGN - 1) // KRM_ALIGN * KRM_ALIGN
+
+def validate_mesh(mesh: MeshData) -> MeshReport:
+
+    report = MeshReport(name=mesh.name)
+
+    if mesh.vertices is None:
+        report.errors.append("missing .vtx")
+        return report
+    if mesh.indices is None:
+        report.errors.append("missing .idx")
+        return report
+
+    n = len(mesh.vertices)
+    report.vertices = n
+    report.triangles = len(mesh.indices) // 3
+
+    if mesh.uvs is None:
+        report.warnings.append("no .tex (UVs); textures will not map")
+    elif len(mesh.uvs) != n:
+        report.errors.append(f".tex has {len(mesh.uvs)} UVs for {n} vertices")
+
+    if mesh.normals is not None and len(mesh.normals) != n:
+        report.errors.append(f".nml has {len(mesh.normals)} normals for {n} vertices")
+
+    if mesh.tangents is not None and len(mesh.tangents) != n:
+        report.errors.append(f".tan has {len(mesh.tangents)} tangents for {n} vertices")
+
+    if len(mesh.indices) % 3:
+        report.errors.append(f".idx has {len(mesh.indices)} indices (not a multiple of 3)")
+    if len(mesh.indices):
+        low, high = int(mesh.indices.min()), int(mesh.indices.max())
+        if low < 0 or high >= n:
+            report.errors.append(f".idx references vertices {low}..{high} but mesh has {n}")
+
+    # Per-view translucency orders: whole copies of the index buffer, back to back
+    if mesh.sorted_indices is not None:
+        if not len(mesh.indices) or len(mesh.sorted_indices) % len(mesh.indices):
+            report.errors.append(f".srt has {len(mesh.sorted_indices)} indices, not a multiple of {len(mesh.indices)}")
+        elif int(mesh.sorted_indices.min()) < 0 or int(mesh.sorted_indices.max()) >= n:
+            report.errors.append(f".srt references vertices outside the mesh's {n}")
+
+    for label, data in (("vertices", mesh.vertices), ("UVs", mesh.uvs), ("normals", mesh.normals),
+                        ("tangents", mesh.tangents)):
+        if data is not None and len(data) and not np.isfinite(data).all():
+            bad = int((~np.isfinite(data)).any(axis=1).sum())
+            report.errors.append(f"{bad} of {len(data)} {label} contain NaN/Inf")
+
+    if mesh.bounds is not None and n and np.isfinite(mesh.vertices).all():
+        lo, hi = np.asarray(mesh.bounds[0]), np.asarray(mesh.bounds[1])
+        if (mesh.vertices.min(axis=0) < lo).any() or (mesh.vertices.max(axis=0) > hi).any():
+            report.errors.append("stored bounds do not contain all vertices")
+
+    if n > MAX_UNITY_VERTICES:
+        report.errors.append(f"{n} vertices exceeds Unity's 16-bit index limit ({MAX_UNITY_VERTICES})")
+
+    return report
+
+def verify_mesh(models_path: Path, name: str) -> MeshReport:
+
+    try:
+        packed = Path(models_path) / f"{name}{KRM_EXT}"
+        if packed.exists():
+            return validate_mesh(read_krm(packed))
+        return validate_mesh(load_mesh(models_path, name))
+    except (OSError, ValueError) as e:
+        return MeshReport(name=name, errors=[str(e)])
+
+def plugin_supports(mod_dir: Path, feature: str) -> Optional[bool]:
+
+    # None when no plugin DLL is installed to check
+    for dll in (mod_dir / PLUGIN_DLL, mod_dir / "Plugins" / PLUGIN_DLL):
+        if dll.exists():
+            return PLUGIN_FEATURES[feature] in dll.read_bytes()
+    return None
+
+def find_meshes(models_path: Path) -> Dict[str, List[str]]:
+
+    # mesh name -> stream extensions present on disk
+    found: Dict[str, List[str]] = {}
+    for file in Path(models_path).iterdir():
+        ext = file.suffix.lower()
+        if (ext in MESH_STREAMS or ext == KRM_EXT) and file.is_file():
+            found.setdefault(file.stem, []).append(ext)
+    return found
+
+def verify_models(models_path: Path, names: Optional[List[str]] = None) -> List[MeshReport]:
+
+    found = find_meshes(models_path)
+    if names is None:
+        names = sorted(found)
+
+    reports = []
+    for name in names:
+        if name not in found:
+            reports.append(MeshReport(name=name, errors=["no mesh files found"]))
+            continue
+        if ".vtx" not in found[name] and KRM_EXT not in found[name]:
+            # KSP only picks up meshes by their .vtx or .krm file
+            reports.append(MeshReport(name=name, warnings=["orphaned streams without .vtx: " + ", ".join(sorted(found[name]))]))
+            continue
+        reports.append(verify_mesh(models_path, name))
+    return reports
@@ -3,8 +3,8 @@ bl_info = {
     "author": "Your Name",
     "version": (1, 0, 0),
     "blender": (3, 0, 0),
-    "location": "File > Export > Kerbal Redux Mesh (.vtx/.tex/.nml/.idx)",
-    "description": "Export meshes for Kerbal Redux mod directly to KSP format",
+    "location": "File > Import/Export > Kerbal Redux Mesh (.vtx/.tex/.nml/.idx)",
+    "description": "Export meshes for Kerbal Redux mod directly to KSP format, and import them back",
     "category": "Import-Export",
     "support": "COMMUNITY",
     "doc_url": "",
@@ -12,146 +12,776 @@ bl_info = {
 }
 
 import bpy
+import hashlib
+import json
 import struct
 import os
+import shutil
+import tempfile
+import threading
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from bpy.props import StringProperty, BoolProperty, EnumProperty
 from bpy.types import Operator, Panel
-from bpy_extras.io_utils import ExportHelper
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+
+# Packed .krm container layout (see mesh_converter.py / PackedMesh.cs)
+KRM_MAGIC = b'KRM1'
+KRM_VERSION = 1
+KRM_HEADER = struct.Struct('<4sHHIIII3f3f')
+KRM_STREAM = struct.Struct('<4sBBHIII4f4f12x')
+KRM_FLAG_BOUNDS = 1
+KRM_FLOAT32 = 1
+KRM_INT32 = 2
+
+# Vertex cache optimization (same as mesh_converter.py --optimize-cache)
+VERTEX_CACHE_SIZE = 16
+
+FILE_FORMAT_ITEMS = [
+    ('STREAMS', "Separate Streams", "Write .vtx/.tex/.nml/.idx files"),
+    ('KRM', "Packed (.krm)", "Write one packed .krm container (one file open per mesh in KSP; needs the plugin built from src/)"),
+]
+
+BATCH_MODE_ITEMS = [
+    ('SINGLE', "Single Mesh", "Export one mesh under Mesh Name"),
+    ('SELECTED', "Selected Meshes", "Export every selected mesh, each named after its object"),
+    ('COLLECTION', "Collection", "Export every mesh in a collection, each named after its object"),
+]
+
+# Stage timings of the last modal export, shown in the sidebar panel
+EXPORT_STAGES = ("Depsgraph eval", "Triangulation", "Change check", "Dedupe", "Write")
+EXPORT_TICK_SECONDS = 0.02            # main-thread work per timer tick before the UI gets control back
+TRIANGULATE_FACES_PER_STEP = 20000
+last_export_stats = {}
+
+# Quick-export manifest, kept in the output folder
+EXPORT_MANIFEST_NAME = '.kr_export_manifest.json'
+EXPORT_MANIFEST_VERSION = 1
+
+
+# Vendored verbatim from mesh_converter.py, which owns this code: the add-on is
+# installed as a single file and cannot import the converter. Copy changes over
+# unedited; KerbonautRedux-Mod/tests checks that the two stay identical.
+
+def generate_tangents(vertices, uvs, normals, indices):
+    """Per-vertex tangents (x, y, z, w) for normal mapping, MikkTSpace style.
+    
+    Each triangle's UV-space tangent is projected onto the tangent plane of
+    each corner's normal, weighted by the corner angle in that plane and
+    summed per vertex. w is the bitangent sign Unity's bumped shaders
+    expect (bitangent = cross(normal, tangent) * w), taken by majority when
+    mirrored UVs share a vertex. Triangles with degenerate UVs add nothing;
+    vertices left without a tangent get one perpendicular to their normal.
+    """
+    # Axis-major float32 (3, N) arrays: per-axis rows are much faster than
+    # strided columns, and the sums are accumulated in float64 by bincount
+    pos = np.array(vertices, np.float32).reshape(-1, 3).T.copy()
+    nrm = np.array(normals, np.float32).reshape(-1, 3).T.copy()
+    u, v = np.array(uvs, np.float32).reshape(-1, 2).T.copy()
+    ids = np.asarray(indices, np.int64).reshape(-1, 3).T.copy()
+    n = pos.shape[1]
+    
+    p = [pos.take(i, axis=1) for i in ids]
+    d1, d2 = p[1] - p[0], p[2] - p[0]
+    u1, u2 = u[ids[1]] - u[ids[0]], u[ids[2]] - u[ids[0]]
+    v1, v2 = v[ids[1]] - v[ids[0]], v[ids[2]] - v[ids[0]]
+    # Twice the signed UV area; negative where the UVs are mirrored
+    uv_area = u1 * v2 - v1 * u2
+    orient = np.sign(uv_area)
+    face = (v2 * d1 - v1 * d2) * np.where(uv_area < 0, np.float32(-1), np.float32(1))
+    winding = _cross_axes(d1, d2)
+    
+    sums = np.zeros((3, n))
+    handedness = np.zeros(n)
+    for k in range(3):
+        nk = nrm.take(ids[k], axis=1)
+        # Tangent and both edges flattened onto the plane of this corner's normal
+        t, e, f = (w - nk * (w * nk).sum(axis=0)
+                   for w in (face, p[(k + 1) % 3] - p[k], p[(k + 2) % 3] - p[k]))
+        length = np.sqrt((t * t).sum(axis=0))
+        angle = np.arctan2(np.sqrt((_cross_axes(e, f) ** 2).sum(axis=0)), (e * f).sum(axis=0))
+        weight = np.where((orient != 0) & (length > 0), angle, np.float32(0))
+        scale = np.divide(weight, length, out=np.zeros_like(weight), where=length > 0)
+        for c in range(3):
+            sums[c] += np.bincount(ids[k], weights=t[c] * scale, minlength=n)
+        # Handedness from the geometry, so it holds whatever the winding convention
+        handedness += np.bincount(ids[k], weights=orient * np.sign((winding * nk).sum(axis=0)) * weight, minlength=n)
+    
+    # Vertices no usable triangle reached: any vector perpendicular to the normal
+    length = np.sqrt((sums * sums).sum(axis=0))
+    missing = ~(length > 1e-12)
+    if missing.any():
+        nm = nrm[:, missing]
+        axis = np.where(np.abs(nm[0]) < 0.9, [[1.0], [0.0], [0.0]], [[0.0], [1.0], [0.0]])
+        fallback = axis - nm * (axis * nm).sum(axis=0)
+        fallback_length = np.sqrt((fallback * fallback).sum(axis=0))
+        fallback[:, ~(fallback_length > 1e-12)] = [[1.0], [0.0], [0.0]]
+        fallback_length[~(fallback_length > 1e-12)] = 1.0
+        sums[:, missing] = fallback
+        length[missing] = fallback_length
+    
+    result = np.empty((n, 4), np.float32)
+    result[:, :3] = (sums / length).T
+    result[:, 3] = np.where(handedness < 0, -1.0, 1.0)
+    return result
+
+
+def _cross_axes(a, b):
+    """Cross products of axis-major (3, N) vector arrays."""
+    return np.array([a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]])
+
+
+def optimize_vertex_cache(indices, vertex_count, cache_size=VERTEX_CACHE_SIZE):
+    """Reorder triangles for post-transform vertex cache reuse.
+    
+    Tipsify (Sander, Nehab and Barczak 2007): emit every remaining triangle
+    around one vertex, then fan around the vertex of those triangles that
+    stays longest in the simulated FIFO cache, falling back to recently
+    emitted vertices and then to the next vertex in index order. Work is
+    constant per triangle; corners keep their order, so winding is kept.
+    """
+    n_triangles = len(indices) // 3
+    if n_triangles == 0:
+        return indices
+    
+    # Vertex -> triangles it is used by; live[v] counts those not emitted yet
+    if np is not None:
+        flat = np.asarray(indices, np.int64).reshape(-1)
+        valence = np.bincount(flat, minlength=vertex_count)
+        starts = np.concatenate([[0], np.cumsum(valence)]).tolist()
+        adjacency = (np.argsort(flat, kind='stable') // 3).tolist()
+        triangles, live = flat.tolist(), valence.tolist()
+    else:
+        triangles = list(indices)
+        live = [0] * vertex_count
+        for v in triangles:
+            live[v] += 1
+        starts = [0]
+        for k in live:
+            starts.append(starts[-1] + k)
+        adjacency = [0] * len(triangles)
+        fill = starts[:-1]
+        for i, v in enumerate(triangles):
+            adjacency[fill[v]] = i // 3
+            fill[v] += 1
+    
+    # A vertex is cached while fewer than `cache_size` misses happened since it was loaded
+    loaded = [-cache_size] * vertex_count
+    misses = 0
+    emitted = bytearray(n_triangles)
+    dead_end = []
+    output = []
+    cursor = 0
+    fan = triangles[0]
+    
+    while fan >= 0:
+        fanned = []
+        for t in adjacency[starts[fan]:starts[fan + 1]]:
+            if emitted[t]:
+                continue
+            emitted[t] = 1
+            corner = triangles[3 * t:3 * t + 3]
+            fanned += corner
+            for v in corner:
+                live[v] -= 1
+                if misses - loaded[v] >= cache_size:
+                    loaded[v] = misses
+                    misses += 1
+        output += fanned
+        dead_end += fanned
+        
+        # Prefer the oldest cached vertex whose remaining fan still fits in the cache
+        fan, priority = -1, -1
+        for v in fanned:
+            if live[v]:
+                age = misses - loaded[v]
+                p = age if age + 2 * live[v] <= cache_size else 0
+                if p > priority:
+                    fan, priority = v, p
+        while fan < 0 and dead_end:
+            v = dead_end.pop()
+            if live[v]:
+                fan = v
+        if fan < 0:
+            while cursor < vertex_count and not live[cursor]:
+                cursor += 1
+            fan = cursor if cursor < vertex_count else -1
+    
+    if np is not None:
+        return np.array(output, np.int32)
+    return output
 
 
 class KSPMeshExporter:
     """Handles the actual mesh conversion."""
     
     @staticmethod
-    def write_vector3_array(data, filepath):
-        """Write Vector3 array to binary file."""
+    def write_stream(data, filepath, dtype, width=1):
+        """Write count header + packed little-endian payload in two writes."""
+        payload = np.ascontiguousarray(data, dtype).reshape(-1, width)
         with open(filepath, 'wb') as f:
-            f.write(struct.pack('I', len(data)))
-            for v in data:
-                f.write(struct.pack('fff', v[0], v[1], v[2]))
+            f.write(struct.pack('<I', len(payload)))
+            f.write(payload)
     
-    @staticmethod
-    def write_vector2_array(data, filepath):
+    @classmethod
+    def write_vector3_array(cls, data, filepath):
+        """Write Vector3 array to binary file."""
+        cls.write_stream(data, filepath, '<f4', 3)
+    
+    @classmethod
+    def write_vector2_array(cls, data, filepath):
         """Write Vector2 array to binary file."""
-        with open(filepath, 'wb') as f:
-            f.write(struct.pack('I', len(data)))
-            for v in data:
-                f.write(struct.pack('ff', v[0], v[1]))
+        cls.write_stream(data, filepath, '<f4', 2)
     
-    @staticmethod
-    def write_int_array(data, filepath):
+    @classmethod
+    def write_vector4_array(cls, data, filepath):
+        """Write Vector4 array to binary file."""
+        cls.write_stream(data, filepath, '<f4', 4)
+    
+    @classmethod
+    def write_int_array(cls, data, filepath):
         """Write int array to binary file."""
+        cls.write_stream(data, filepath, '<i4')
+    
+    @staticmethod
+    def write_krm(filepath, vertices, uvs, normals, indices, tangents=None):
+        """Write all streams into one packed .krm container (16-byte aligned sections)."""
+        streams = [
+            (b'POS ', KRM_FLOAT32, np.ascontiguousarray(vertices, '<f4').reshape(-1, 3)),
+            (b'UV0 ', KRM_FLOAT32, np.ascontiguousarray(uvs, '<f4').reshape(-1, 2)),
+            (b'NRM ', KRM_FLOAT32, np.ascontiguousarray(normals, '<f4').reshape(-1, 3)),
+        ]
+        if tangents is not None:
+            streams.append((b'TAN ', KRM_FLOAT32, np.ascontiguousarray(tangents, '<f4').reshape(-1, 4)))
+        streams.append((b'IDX ', KRM_INT32, np.ascontiguousarray(indices, '<i4').reshape(-1, 1)))
+        positions = streams[0][2]
+        bounds_min = positions.min(axis=0) if len(positions) else np.zeros(3)
+        bounds_max = positions.max(axis=0) if len(positions) else np.zeros(3)
+        
+        def align(offset):
+            return (offset + 15) // 16 * 16
+        
+        offset = align(KRM_HEADER.size + KRM_STREAM.size * len(streams))
+        table = []
+        for tag, fmt, data in streams:
+            table.append(KRM_STREAM.pack(tag, fmt, data.shape[1], 0, len(data), offset, data.nbytes,
+                                         0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0))
+            offset = align(offset + data.nbytes)
+        
+        header = KRM_HEADER.pack(KRM_MAGIC, KRM_VERSION, KRM_FLAG_BOUNDS, len(streams),
+                                 len(positions), len(streams[-1][2]), 0, *bounds_min, *bounds_max)
+        
         with open(filepath, 'wb') as f:
-            f.write(struct.pack('I', len(data)))
-            for idx in data:
-                f.write(struct.pack('i', idx))
+            f.write(header)
+            f.write(b''.join(table))
+            for _, _, data in streams:
+                f.write(b'\0' * (align(f.tell()) - f.tell()))
+                f.write(data)
+    
+    @classmethod
+    def triangulate_mesh(cls, mesh):
+        """Triangulate mesh and return data.
+        
+        Returns float32 vertices (N, 3), normals (N, 3) and UVs (N, 2) plus
+        int32 indices, converted to KSP space and deduplicated in first-use
+        order (read_mesh, then build_streams).
+        """
+        return cls.build_streams(*cls.read_mesh(mesh))
     
     @staticmethod
-    def triangulate_mesh(mesh):
-        """Triangulate mesh and return data."""
-        import bmesh
+    def read_mesh(mesh):
+        """Triangulate `mesh` and bulk-read it with foreach_get (main thread only).
         
-        # Create BMesh from mesh
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
+        Returns the Blender-space float32 vertex positions and normals, the
+        vertex of every triangle corner and the corner UVs (None without a
+        UV map). Quads and n-gons still go through bmesh's triangulation so
+        the triangles match earlier exports byte for byte. `mesh` must be a
+        temporary mesh (Object.to_mesh), since it is triangulated in place.
+        """
+        steps = KSPMeshExporter.read_mesh_steps(mesh)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+    
+    @staticmethod
+    def read_mesh_steps(mesh, faces_per_step=TRIANGULATE_FACES_PER_STEP):
+        """read_mesh as a generator that yields the fraction done between slices.
         
-        # Triangulate
-        bmesh.ops.triangulate(bm, faces=bm.faces[:])
+        Quads and n-gons are triangulated `faces_per_step` at a time and every
+        array is read in its own slice, so a modal caller can run one slice
+        per timer tick. The read_mesh result is the generator's return value.
+        """
+        # Vertex normals before triangulating: bmesh keeps these, it does not recompute them
+        n_vertices = len(mesh.vertices)
+        co = np.empty(n_vertices * 3, np.float32)
+        vertex_normals = np.empty(n_vertices * 3, np.float32)
+        mesh.vertices.foreach_get("co", co)
+        yield 0.05
+        mesh.vertices.foreach_get("normal", vertex_normals)
+        yield 0.1
         
-        # Ensure face indices
-        bm.faces.ensure_lookup_table()
+        loop_totals = np.empty(len(mesh.polygons), np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        if len(loop_totals) and loop_totals.max() > 3:
+            import bmesh
+            bm = bmesh.new()
+            try:
+                bm.from_mesh(mesh)
+                yield 0.15
+                # Faces are triangulated in order and new triangles appended, so slices
+                # give the same triangles in the same order as one call over all faces
+                faces = bm.faces[:]
+                for start in range(0, len(faces), faces_per_step):
+                    bmesh.ops.triangulate(bm, faces=faces[start:start + faces_per_step])
+                    yield 0.15 + 0.5 * min(start + faces_per_step, len(faces)) / len(faces)
+                bm.to_mesh(mesh)
+            finally:
+                bm.free()
+            yield 0.7
         
-        # Extract data
-        vertices = []
-        normals = []
-        uvs = []
-        indices = []
+        # Every polygon is a triangle now, so loop triangles follow the faces loop by loop
+        mesh.calc_loop_triangles()
+        yield 0.8
+        loops = np.empty(len(mesh.loop_triangles) * 3, np.int32)
+        mesh.loop_triangles.foreach_get("loops", loops)
+        loop_vertices = np.empty(len(mesh.loops), np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_vertices)
+        yield 0.9
         
-        # Create a dictionary to track unique vertex/uv/normal combinations
-        vertex_map = {}
-        unique_vertices = []
+        corner_uvs = None
+        uv_layer = mesh.uv_layers.active
+        if uv_layer:
+            uvs = np.empty(len(mesh.loops) * 2, np.float32)
+            uv_layer.data.foreach_get("uv", uvs)
+            corner_uvs = uvs.reshape(-1, 2)[loops]
+        return co.reshape(-1, 3), vertex_normals.reshape(-1, 3), loop_vertices[loops], corner_uvs
+    
+    @staticmethod
+    def transform_mesh(co, vertex_normals, corner_vertices, corner_uvs, matrix):
+        """Apply a 4x4 object matrix to read_mesh output, like Ctrl+A → All Transforms.
         
-        uv_layer = bm.loops.layers.uv.active
+        Positions take the full matrix, normals the inverse-transpose of its 3x3
+        part (renormalized), and a mirroring matrix reverses the triangle winding
+        so the faces keep pointing outward.
+        """
+        matrix = np.asarray(matrix, np.float64)
+        if (matrix == np.eye(4)).all():
+            return co, vertex_normals, corner_vertices, corner_uvs
         
-        for face in bm.faces:
-            for loop in face.loops:
-                vert = loop.vert
-                
-                # COORDINATE SYSTEM CONVERSION
-                # Blender: Z-up, -Y-forward (right-handed)
-                # Unity/KSP: Y-up, Z-forward (left-handed)
-                # 
-                # Position: (Y, Z, -X) - tested and correct
-                # Normal: (Y, Z, -X) with inversion to face outward
-                # Smooth shading: use vertex normal instead of loop normal
-                
-                pos = (vert.co.y, vert.co.z, -vert.co.x)
-                
-                # Get smooth vertex normal (not flat face normal)
-                # Invert to face outward
-                normal = (vert.normal.y, vert.normal.z, -vert.normal.x)
-                
-                # Get UV
-                if uv_layer:
-                    uv = (loop[uv_layer].uv.x, loop[uv_layer].uv.y)
-                else:
-                    uv = (0.0, 0.0)
-                
-                # Create unique key
-                key = (pos, normal, uv)
-                
-                if key not in vertex_map:
-                    vertex_map[key] = len(unique_vertices)
-                    unique_vertices.append({
-                        'pos': pos,
-                        'normal': normal,
-                        'uv': uv
-                    })
-                
-                indices.append(vertex_map[key])
+        linear = matrix[:3, :3]
+        determinant = np.linalg.det(linear)
+        co = (co @ linear.T + matrix[:3, 3]).astype(np.float32)
+        if determinant:
+            normals = vertex_normals @ np.linalg.inv(linear)
+            lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+            vertex_normals = (normals / np.where(lengths > 0, lengths, 1)).astype(np.float32)
         
-        # Build final arrays
-        for v in unique_vertices:
-            vertices.append(v['pos'])
-            normals.append(v['normal'])
-            uvs.append(v['uv'])
+        if determinant < 0:
+            corner_vertices = corner_vertices.reshape(-1, 3)[:, ::-1].reshape(-1)
+            if corner_uvs is not None:
+                corner_uvs = corner_uvs.reshape(-1, 3, 2)[:, ::-1].reshape(-1, 2)
+        return co, vertex_normals, corner_vertices, corner_uvs
+    
+    @staticmethod
+    def build_streams(co, vertex_normals, corner_vertices, corner_uvs):
+        """Convert read_mesh output to KSP space and dedupe it (pure NumPy, thread-safe)."""
+        # COORDINATE SYSTEM CONVERSION
+        # Blender: Z-up, -Y-forward (right-handed)
+        # Unity/KSP: Y-up, Z-forward (left-handed)
+        #
+        # Position: (Y, Z, -X) - tested and correct
+        # Normal: (Y, Z, -X), smooth vertex normal rather than the loop normal
+        corners = np.zeros((len(corner_vertices), 8), np.float32)
+        for start, data in ((0, co), (3, vertex_normals)):
+            xyz = data[corner_vertices]
+            corners[:, start] = xyz[:, 1]
+            corners[:, start + 1] = xyz[:, 2]
+            corners[:, start + 2] = -xyz[:, 0]
+        if corner_uvs is not None:
+            corners[:, 6:8] = corner_uvs
         
-        reversed_indices = []
-        for i in range(0, len(indices), 3):
-            reversed_indices.append(indices[i])
-            reversed_indices.append(indices[i+2])  # Swap these two
-            reversed_indices.append(indices[i+1])  # to reverse winding
-        indices = reversed_indices
-
-        bm.free()
+        # Unique (pos, normal, uv) corners in first-use order. Vertices with the same
+        # position and normal, and equal UVs, share an id first, so a corner is one
+        # int64 key; adding 0 folds -0.0 into 0.0, which compared equal as dictionary keys
+        vertex_rows = np.concatenate([co, vertex_normals], axis=1) + np.float32(0)
+        _, vertex_ids = np.unique(vertex_rows.view(np.dtype((np.void, 24))).ravel(), return_inverse=True)
+        _, uv_ids = np.unique(np.ascontiguousarray(corners[:, 6:8] + np.float32(0)).view(np.uint64).ravel(),
+                              return_inverse=True)
+        keys = vertex_ids.reshape(-1)[corner_vertices].astype(np.int64) * (len(corners) + 1) + uv_ids.reshape(-1)
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        unique = corners[first[order]]
+        
+        # Swap the last two corners to reverse the winding for Unity
+        indices = rank[inverse.reshape(-1)].astype(np.int32).reshape(-1, 3)[:, [0, 2, 1]].reshape(-1)
         
-        return vertices, normals, uvs, indices
+        return unique[:, 0:3], unique[:, 3:6], unique[:, 6:8], indices
+    
+    generate_tangents = staticmethod(generate_tangents)
+    optimize_vertex_cache = staticmethod(optimize_vertex_cache)
+    
+    @staticmethod
+    def optimize_vertex_fetch(indices, vertex_count):
+        """Renumber vertices in first-use order; returns (indices, order[new] = old)."""
+        indices = np.asarray(indices, np.int32)
+        used, first = np.unique(indices, return_index=True)
+        first_use = np.full(vertex_count, len(indices), np.int64)
+        first_use[used] = first
+        order = np.argsort(first_use, kind='stable')
+        remap = np.empty(vertex_count, np.int32)
+        remap[order] = np.arange(vertex_count, dtype=np.int32)
+        return remap[indices].tolist(), order.tolist()
+    
+    @staticmethod
+    def vertex_cache_stats(indices, vertex_count, cache_size=VERTEX_CACHE_SIZE):
+        """Simulate a FIFO post-transform cache and return (ACMR, ATVR)."""
+        loaded = [-cache_size] * vertex_count
+        misses = 0
+        for v in indices:
+            if misses - loaded[v] >= cache_size:
+                loaded[v] = misses
+                misses += 1
+        return misses / max(len(indices) // 3, 1), misses / max(vertex_count, 1)
     
     @classmethod
-    def export_mesh(cls, obj, filepath_base):
+    def export_mesh(cls, obj, filepath_base, file_format='STREAMS', optimize_cache=False, export_tangents=False,
+                    apply_transforms=False):
         """Export mesh to KSP format."""
-        # Get mesh with modifiers applied
-        depsgraph = bpy.context.evaluated_depsgraph_get()
+        return cls.write_export(cls.evaluate_object(obj, apply_transforms=apply_transforms), filepath_base,
+                                file_format, optimize_cache, export_tangents)
+    
+    @classmethod
+    def evaluate_object(cls, obj, depsgraph=None, apply_transforms=False):
+        """Read `obj` with modifiers applied (read_mesh output); main thread only.
+        
+        With apply_transforms the object's world matrix is baked into the
+        arrays; the object itself is left untouched.
+        """
+        if depsgraph is None:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
         obj_eval = obj.evaluated_get(depsgraph)
         mesh = obj_eval.to_mesh()
-        
         try:
-            # Triangulate and get data (with coordinate conversion)
-            vertices, normals, uvs, indices = cls.triangulate_mesh(mesh)
-            
-            if not vertices:
-                return (False, "Mesh has no vertices!")
-            
-            # Write files
+            data = cls.read_mesh(mesh)
+        finally:
+            obj_eval.to_mesh_clear()
+        if apply_transforms:
+            data = cls.transform_mesh(*data, obj_eval.matrix_world)
+        return data
+    
+    @classmethod
+    def write_export(cls, data, filepath_base, file_format='STREAMS', optimize_cache=False, export_tangents=False):
+        """Dedupe, optimize and write evaluate_object output; safe in a worker thread.
+        
+        Returns (success, message).
+        """
+        return cls.write_streams(cls.build_streams(*data), data[3] is not None, filepath_base, file_format,
+                                 optimize_cache, export_tangents)
+    
+    @classmethod
+    def optimize_streams(cls, streams):
+        """Reorder build_streams output for the GPU vertex cache.
+        
+        Mostly pure Python, so it holds the GIL; a worker thread only helps
+        to keep the UI responsive. Returns (streams, note for the message).
+        """
+        vertices, normals, uvs, indices = streams
+        indices = indices.tolist()
+        acmr, _ = cls.vertex_cache_stats(indices, len(vertices))
+        indices = cls.optimize_vertex_cache(indices, len(vertices))
+        indices, order = cls.optimize_vertex_fetch(indices, len(vertices))
+        new_acmr, new_atvr = cls.vertex_cache_stats(indices, len(vertices))
+        streams = vertices[order], normals[order], uvs[order], indices
+        return streams, f", ACMR {acmr:.2f} -> {new_acmr:.2f} (ATVR {new_atvr:.2f})"
+    
+    @classmethod
+    def write_streams(cls, streams, has_uv, filepath_base, file_format='STREAMS', optimize_cache=False,
+                      export_tangents=False, cache_note=""):
+        """Optimize and write build_streams output; safe in a worker thread.
+        
+        `cache_note` is the optimize_streams note for streams the caller
+        already optimized. Returns (success, message).
+        """
+        if not len(streams[0]):
+            return (False, "Mesh has no vertices!")
+        
+        # Reorder triangles and vertices for the GPU vertex cache
+        if optimize_cache:
+            streams, cache_note = cls.optimize_streams(streams)
+        vertices, normals, uvs, indices = streams
+        
+        # Tangents for bumped shaders, computed on the final (KSP space) data
+        tangents = None
+        tangent_note = ""
+        if export_tangents:
+            if has_uv:
+                tangents = cls.generate_tangents(vertices, uvs, normals, indices)
+                tangent_note = ", tangents"
+            else:
+                tangent_note = ", no UV map so no tangents"
+        
+        # Write files
+        if file_format == 'KRM':
+            cls.write_krm(filepath_base + ".krm", vertices, uvs, normals, indices, tangents)
+        else:
             cls.write_vector3_array(vertices, filepath_base + ".vtx")
             cls.write_vector2_array(uvs, filepath_base + ".tex")
             cls.write_vector3_array(normals, filepath_base + ".nml")
+            if tangents is not None:
+                cls.write_vector4_array(tangents, filepath_base + ".tan")
             cls.write_int_array(indices, filepath_base + ".idx")
+        
+        return (True, f"Exported {len(vertices)} vertices, {len(indices)//3} triangles{tangent_note}{cache_note}")
+    
+    @staticmethod
+    def output_files(filepath_base, file_format, tangents):
+        """Paths write_export writes for these options (tangents: a .tan is written)."""
+        if file_format == 'KRM':
+            return [filepath_base + ".krm"]
+        extensions = [".vtx", ".tex", ".nml"] + ([".tan"] if tangents else []) + [".idx"]
+        return [filepath_base + ext for ext in extensions]
+    
+    @staticmethod
+    def hash_file(path):
+        """SHA-256 hex digest of a file's contents, or None if it is missing."""
+        digest = hashlib.sha256()
+        try:
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+        except FileNotFoundError:
+            return None
+        return digest.hexdigest()
+    
+    @staticmethod
+    def load_manifest(folder):
+        """Read the quick-export manifest in `folder`; a missing or unreadable one starts empty."""
+        try:
+            with open(os.path.join(folder, EXPORT_MANIFEST_NAME)) as f:
+                manifest = json.load(f)
+            if manifest.get('version') == EXPORT_MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {'version': EXPORT_MANIFEST_VERSION, 'entries': {}}
+    
+    @staticmethod
+    def save_manifest(folder, manifest):
+        """Write the manifest to a temporary file next to it, then swap it in."""
+        path = os.path.join(folder, EXPORT_MANIFEST_NAME)
+        fd, tmp = tempfile.mkstemp(prefix=f"{EXPORT_MANIFEST_NAME}.", dir=folder)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    
+    @classmethod
+    def export_incremental(cls, obj, filepath_base, file_format='STREAMS', optimize_cache=False,
+                           export_tangents=False, apply_transforms=False):
+        """export_mesh that skips the write when nothing changed since the last run.
+        
+        The evaluated arrays are hashed together with the options and this
+        exporter's own source; a manifest in the output folder keeps that hash
+        and the hash of every file written per output name. The mesh is still
+        evaluated, but the dedupe and writes are skipped when the hash matches
+        and the files on disk are untouched. Returns (success, message, skipped).
+        """
+        data = cls.evaluate_object(obj, apply_transforms=apply_transforms)
+        mesh_hash = cls.export_hash(data, file_format, optimize_cache, export_tangents, apply_transforms)
+        if cls.is_unchanged(filepath_base, mesh_hash):
+            return (True, "Unchanged, skipped writing", True)
+        
+        success, message = cls.write_export(data, filepath_base, file_format, optimize_cache, export_tangents)
+        cls.record_export(filepath_base, mesh_hash, success, file_format, export_tangents and data[3] is not None)
+        return (success, message, False)
+    
+    @classmethod
+    def export_hash(cls, data, file_format, optimize_cache, export_tangents, apply_transforms):
+        """Hash of evaluate_object output, the options and this exporter's source."""
+        digest = hashlib.sha256(json.dumps([file_format, optimize_cache, export_tangents, apply_transforms,
+                                            cls.hash_file(__file__)]).encode())
+        for array in data:
+            digest.update(b'-' if array is None else array.tobytes())
+        return digest.hexdigest()
+    
+    @classmethod
+    def is_unchanged(cls, filepath_base, mesh_hash):
+        """True if the manifest has `mesh_hash` for this output and its files are untouched."""
+        folder, name = os.path.split(filepath_base)
+        previous = cls.load_manifest(folder)['entries'].get(name)
+        return bool(previous and previous['mesh_hash'] == mesh_hash
+                    and all(cls.hash_file(os.path.join(folder, f)) == h for f, h in previous['outputs'].items()))
+    
+    @classmethod
+    def record_export(cls, filepath_base, mesh_hash, success, file_format, tangents):
+        """Update the manifest after a write (tangents: a .tan was written)."""
+        folder, name = os.path.split(filepath_base)
+        manifest = cls.load_manifest(folder)
+        previous = manifest['entries'].pop(name, None)
+        if success:
+            paths = cls.output_files(filepath_base, file_format, tangents)
+            outputs = {os.path.basename(path): cls.hash_file(path) for path in paths}
+            # Drop files an earlier run wrote with other options (e.g. .vtx after switching to .krm)
+            for f in (previous or {}).get('outputs', {}):
+                if f not in outputs and os.path.exists(os.path.join(folder, f)):
+                    os.remove(os.path.join(folder, f))
+            manifest['entries'][name] = {'mesh_hash': mesh_hash, 'outputs': outputs}
+        cls.save_manifest(folder, manifest)
+    
+    @classmethod
+    def export_batch(cls, objects, folder, file_format='STREAMS', optimize_cache=False, export_tangents=False,
+                     apply_transforms=False):
+        """Export every object in `objects` to `folder`, each named after itself.
+        
+        bpy reads and the pure-Python cache optimizer run on the calling
+        thread, one object after another (bpy is not thread-safe, and the
+        optimizer holds the GIL); a thread pool overlaps them with the NumPy
+        dedupe, the tangents and the file writes, which release it.
+        Returns (name, success, message, evaluate seconds, write seconds)
+        per object, in order.
+        """
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        
+        def timed(function, *args):
+            start = time.perf_counter()
+            return function(*args), time.perf_counter() - start
+        
+        jobs = []
+        names = set()
+        with ThreadPoolExecutor() as pool:
+            for obj in objects:
+                # File-safe and unique, so no two workers write the same files
+                name = base = bpy.path.clean_name(obj.name)
+                suffix = 1
+                while name.lower() in names:
+                    suffix += 1
+                    name = f"{base}_{suffix}"
+                names.add(name.lower())
+                
+                start = time.perf_counter()
+                try:
+                    data = cls.evaluate_object(obj, depsgraph, apply_transforms)
+                except Exception as e:
+                    jobs.append((name, time.perf_counter() - start, None, None, f"Export failed: {str(e)}"))
+                    continue
+                jobs.append((name, time.perf_counter() - start, data[3] is not None,
+                             pool.submit(timed, cls.build_streams, *data), None))
             
-            return (True, f"Exported {len(vertices)} vertices, {len(indices)//3} triangles")
+            # Optimize here as each dedupe finishes, then hand the write back to the pool
+            writes = []
+            for name, evaluate_time, has_uv, dedupe, error in jobs:
+                if dedupe is None:
+                    writes.append((name, evaluate_time, None, 0.0, error))
+                    continue
+                try:
+                    streams, seconds = dedupe.result()
+                    cache_note = ""
+                    if optimize_cache and len(streams[0]):
+                        (streams, cache_note), optimize_time = timed(cls.optimize_streams, streams)
+                        seconds += optimize_time
+                except Exception as e:
+                    writes.append((name, evaluate_time, None, 0.0, f"Export failed: {str(e)}"))
+                    continue
+                write = pool.submit(timed, cls.write_streams, streams, has_uv, os.path.join(folder, name),
+                                    file_format, False, export_tangents, cache_note)
+                writes.append((name, evaluate_time, write, seconds, None))
             
-        finally:
-            obj_eval.to_mesh_clear()
+            results = []
+            for name, evaluate_time, write, seconds, error in writes:
+                if write is None:
+                    results.append((name, False, error, evaluate_time, 0.0))
+                    continue
+                try:
+                    (success, message), write_time = write.result()
+                except Exception as e:
+                    success, message, write_time = False, f"Export failed: {str(e)}", 0.0
+                results.append((name, success, message, evaluate_time, seconds + write_time))
+        return results
+
+
+class KSPMeshImporter:
+    """Reads exported streams back into Blender."""
+    
+    @staticmethod
+    def read_stream(filepath, dtype, width=1):
+        """Read a count header + packed payload written by write_stream, as (count, width)."""
+        with open(filepath, 'rb') as f:
+            header = np.fromfile(f, '<u4', 1)
+            if not len(header):
+                raise ValueError(f"{os.path.basename(filepath)} is empty")
+            count = int(header[0])
+            data = np.fromfile(f, dtype, count * width)
+        if len(data) != count * width:
+            raise ValueError(f"{os.path.basename(filepath)} is truncated ({len(data) // width} of {count} items)")
+        return data.reshape(-1, width)
+    
+    @classmethod
+    def read_streams(cls, filepath_base):
+        """Read .vtx/.idx (required) and .tex/.nml (optional) back to Blender space.
+        
+        Returns float32 positions (N, 3), normals (N, 3) or None, UVs (N, 2)
+        or None, and int32 triangle indices (T, 3) in Blender's winding.
+        """
+        vertices = cls.read_stream(filepath_base + ".vtx", '<f4', 3)
+        indices = cls.read_stream(filepath_base + ".idx", '<i4')
+        if len(indices) % 3:
+            raise ValueError(f"Index count {len(indices)} is not a multiple of 3")
+        if len(indices) and (indices.min() < 0 or indices.max() >= len(vertices)):
+            raise ValueError(f"Indices point past the {len(vertices)} vertices")
+        # Undo the winding flip done for Unity
+        triangles = indices.reshape(-1, 3)[:, [0, 2, 1]]
+        
+        optional = {}
+        for ext, width in ((".nml", 3), (".tex", 2)):
+            if os.path.exists(filepath_base + ext):
+                data = cls.read_stream(filepath_base + ext, '<f4', width)
+                if len(data) != len(vertices):
+                    raise ValueError(f"{os.path.basename(filepath_base + ext)} has {len(data)} items "
+                                     f"for {len(vertices)} vertices")
+                optional[ext] = data
+        
+        # Undo the (Y, Z, -X) conversion: Blender (x, y, z) = KSP (-z, x, y)
+        def to_blender(xyz):
+            return np.ascontiguousarray(np.stack([-xyz[:, 2], xyz[:, 0], xyz[:, 1]], axis=1), np.float32)
+        
+        normals = optional.get(".nml")
+        return (to_blender(vertices), None if normals is None else to_blender(normals),
+                optional.get(".tex"), np.ascontiguousarray(triangles, np.int32))
+    
+    @classmethod
+    def build_mesh(cls, name, vertices, normals, uvs, triangles):
+        """Bulk-load the arrays into a new mesh with foreach_set."""
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(vertices))
+        mesh.vertices.foreach_set("co", vertices.ravel())
+        mesh.loops.add(triangles.size)
+        mesh.loops.foreach_set("vertex_index", triangles.ravel())
+        mesh.polygons.add(len(triangles))
+        mesh.polygons.foreach_set("loop_start", np.arange(0, triangles.size, 3, dtype=np.int32))
+        if bpy.app.version < (4, 0, 0):
+            mesh.polygons.foreach_set("loop_total", np.full(len(triangles), 3, np.int32))
+        
+        if uvs is not None:
+            uv_layer = mesh.uv_layers.new(name="UVMap")
+            uv_layer.data.foreach_set("uv", uvs[triangles.ravel()].ravel())
+        
+        mesh.update(calc_edges=True)
+        
+        # The exported normals are the smooth vertex normals; keep them as custom normals
+        if normals is not None:
+            mesh.polygons.foreach_set("use_smooth", np.ones(len(triangles), bool))
+            if bpy.app.version < (4, 1, 0):
+                mesh.use_auto_smooth = True
+            mesh.normals_split_custom_set_from_vertices(normals)
+        return mesh
 
 
 class EXPORT_OT_kerbal_redux(Operator, ExportHelper):
@@ -183,8 +813,8 @@ class EXPORT_OT_kerbal_redux(Operator, ExportHelper):
     
     apply_transforms: BoolProperty(
         name="Apply Transforms",
-        description="Apply object transforms (Ctrl+A in Blender). If this fails, apply manually before export.",
-        default=False,
+        description="Export with the object's location, rotation and scale baked in, as after Ctrl+A (the object is not changed)",
+        default=True,
     )
     
     open_folder: BoolProperty(
@@ -193,10 +823,50 @@ class EXPORT_OT_kerbal_redux(Operator, ExportHelper):
         default=False,
     )
     
+    file_format: EnumProperty(
+        name="Format",
+        description="How the mesh is written to disk",
+        items=FILE_FORMAT_ITEMS,
+        default='STREAMS',
+    )
+    
+    optimize_cache: BoolProperty(
+        name="Optimize Vertex Cache",
+        description="Reorder triangles and vertices for GPU vertex cache reuse (slower export)",
+        default=False,
+    )
+    
+    export_tangents: BoolProperty(
+        name="Export Tangents",
+        description="Write per-vertex tangents (.tan / TAN section) for bumped shaders such as KSP/Bumped Specular; needs the plugin built from src/",
+        default=False,
+    )
+    
+    batch_mode: EnumProperty(
+        name="Batch",
+        description="Export one mesh, or several in one run with each named after its object",
+        items=BATCH_MODE_ITEMS,
+        default='SINGLE',
+    )
+    
+    collection_name: StringProperty(
+        name="Collection",
+        description="Collection whose meshes are exported in Collection mode",
+        default="",
+    )
+    
     def draw(self, context):
         layout = self.layout
-        layout.prop(self, "mesh_name")
-        layout.prop(self, "export_selected")
+        layout.prop(self, "batch_mode")
+        if self.batch_mode == 'COLLECTION':
+            layout.prop_search(self, "collection_name", bpy.data, "collections")
+        if self.batch_mode == 'SINGLE':
+            layout.prop(self, "mesh_name")
+        layout.prop(self, "file_format")
+        layout.prop(self, "optimize_cache")
+        layout.prop(self, "export_tangents")
+        if self.batch_mode == 'SINGLE':
+            layout.prop(self, "export_selected")
         layout.prop(self, "apply_transforms")
         layout.prop(self, "open_folder")
         
@@ -204,12 +874,28 @@ class EXPORT_OT_kerbal_redux(Operator, ExportHelper):
         layout.separator()
         box = layout.box()
         box.label(text="Output files:", icon='FILE')
-        box.label(text=f"  {self.mesh_name}.vtx - Vertices")
-        box.label(text=f"  {self.mesh_name}.tex - UV coordinates")
-        box.label(text=f"  {self.mesh_name}.nml - Normals")
-        box.label(text=f"  {self.mesh_name}.idx - Triangle indices")
+        name = self.mesh_name if self.batch_mode == 'SINGLE' else "<object name>"
+        if self.file_format == 'KRM':
+            box.label(text=f"  {name}.krm - Packed mesh")
+            return
+        box.label(text=f"  {name}.vtx - Vertices")
+        box.label(text=f"  {name}.tex - UV coordinates")
+        box.label(text=f"  {name}.nml - Normals")
+        if self.export_tangents:
+            box.label(text=f"  {name}.tan - Tangents")
+        box.label(text=f"  {name}.idx - Triangle indices")
+    
+    def open_output_folder(self, folder):
+        import subprocess
+        if os.name == 'nt':
+            subprocess.Popen(f'explorer "{folder}"')
+        else:
+            subprocess.Popen(['xdg-open', folder])
     
     def execute(self, context):
+        if self.batch_mode != 'SINGLE':
+            return self.execute_batch(context)
+        
         # Get object to export
         if self.export_selected:
             obj = context.active_object
@@ -227,43 +913,19 @@ class EXPORT_OT_kerbal_redux(Operator, ExportHelper):
             self.report({'ERROR'}, f"Selected object '{obj.name}' is not a mesh!")
             return {'CANCELLED'}
         
-        # Apply transforms if requested
-        if self.apply_transforms:
-            try:
-                # Store current mode
-                original_mode = obj.mode
-                
-                # Switch to object mode if needed
-                if original_mode != 'OBJECT':
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                
-                # Apply transforms
-                bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-                
-                # Restore original mode if needed
-                if original_mode == 'EDIT':
-                    bpy.ops.object.mode_set(mode='EDIT')
-                    
-            except RuntimeError as e:
-                self.report({'WARNING'}, f"Could not auto-apply transforms: {str(e)}")
-                self.report({'INFO'}, "Please apply manually: Ctrl+A → All Transforms")
-        
         # Export
         filepath_base = os.path.join(os.path.dirname(self.filepath), self.mesh_name)
         
         try:
-            success, message = KSPMeshExporter.export_mesh(obj, filepath_base)
+            success, message = KSPMeshExporter.export_mesh(obj, filepath_base, self.file_format,
+                                                           self.optimize_cache, self.export_tangents,
+                                                           self.apply_transforms)
             
             if success:
                 self.report({'INFO'}, f"Exported {self.mesh_name}: {message}")
                 
                 if self.open_folder:
-                    import subprocess
-                    folder = os.path.dirname(filepath_base)
-                    if os.name == 'nt':
-                        subprocess.Popen(f'explorer "{folder}"')
-                    else:
-                        subprocess.Popen(['xdg-open', folder])
+                    self.open_output_folder(os.path.dirname(filepath_base))
                 
                 return {'FINISHED'}
             else:
@@ -273,6 +935,100 @@ class EXPORT_OT_kerbal_redux(Operator, ExportHelper):
         except Exception as e:
             self.report({'ERROR'}, f"Export failed: {str(e)}")
             return {'CANCELLED'}
+    
+    def execute_batch(self, context):
+        # Get objects to export
+        if self.batch_mode == 'COLLECTION':
+            collection = bpy.data.collections.get(self.collection_name)
+            if not collection:
+                self.report({'ERROR'}, f"Collection '{self.collection_name}' not found!")
+                return {'CANCELLED'}
+            objects = collection.all_objects
+        else:
+            objects = context.selected_objects
+        mesh_objects = [o for o in objects if o.type == 'MESH']
+        if not mesh_objects:
+            self.report({'ERROR'}, "No mesh objects found!")
+            return {'CANCELLED'}
+        
+        folder = os.path.dirname(self.filepath)
+        start = time.perf_counter()
+        try:
+            results = KSPMeshExporter.export_batch(mesh_objects, folder, self.file_format,
+                                                   self.optimize_cache, self.export_tangents,
+                                                   self.apply_transforms)
+        except Exception as e:
+            self.report({'ERROR'}, f"Export failed: {str(e)}")
+            return {'CANCELLED'}
+        total = time.perf_counter() - start
+        
+        # Per-object timings: evaluation on the main thread, dedupe and writes in the pool
+        failed = 0
+        for name, success, message, evaluate_time, write_time in results:
+            timing = f"(evaluate {evaluate_time * 1000:.0f} ms, write {write_time * 1000:.0f} ms)"
+            if success:
+                self.report({'INFO'}, f"Exported {name}: {message} {timing}")
+            else:
+                failed += 1
+                self.report({'ERROR'}, f"{name}: {message} {timing}")
+        
+        exported = len(results) - failed
+        summary = f"Exported {exported} of {len(results)} meshes in {total:.2f} s"
+        if not exported:
+            self.report({'ERROR'}, summary)
+            return {'CANCELLED'}
+        self.report({'WARNING'} if failed else {'INFO'}, summary)
+        
+        if self.open_folder:
+            self.open_output_folder(folder)
+        
+        return {'FINISHED'}
+
+
+class IMPORT_OT_kerbal_redux(Operator, ImportHelper):
+    """Import a Kerbal Redux mesh (.vtx/.tex/.nml/.idx)"""
+    bl_idname = "import.kerbal_redux"
+    bl_label = "Import Kerbal Redux Mesh"
+    bl_options = {'PRESET', 'UNDO'}
+    
+    filename_ext = ".vtx"
+    
+    filter_glob: StringProperty(
+        default="*.vtx;*.tex;*.nml;*.idx",
+        options={'HIDDEN'},
+        maxlen=255,
+    )
+    
+    import_normals: BoolProperty(
+        name="Import Normals",
+        description="Keep the exported normals (.nml) as custom split normals",
+        default=True,
+    )
+    
+    def execute(self, context):
+        # Any of the four streams selects the mesh
+        filepath_base = os.path.splitext(self.filepath)[0]
+        name = os.path.basename(filepath_base)
+        
+        start = time.perf_counter()
+        try:
+            vertices, normals, uvs, triangles = KSPMeshImporter.read_streams(filepath_base)
+            mesh = KSPMeshImporter.build_mesh(name, vertices, normals if self.import_normals else None,
+                                              uvs, triangles)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Import failed: {str(e)}")
+            return {'CANCELLED'}
+        
+        obj = bpy.data.objects.new(name, mesh)
+        context.collection.objects.link(obj)
+        for selected in context.selected_objects:
+            selected.select_set(False)
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
+        
+        self.report({'INFO'}, f"Imported {name}: {len(vertices)} vertices, {len(triangles)} triangles "
+                              f"in {time.perf_counter() - start:.2f} s")
+        return {'FINISHED'}
 
 
 class KERBAL_REDUX_PT_panel(Panel):
@@ -294,6 +1050,12 @@ class KERBAL_REDUX_PT_panel(Panel):
         # Quick export section
         box = layout.box()
         box.label(text="Quick Export Settings:", icon='SETTINGS')
+        settings = context.scene.kerbal_redux_settings
+        box.prop(settings, "output_path")
+        box.prop(settings, "mesh_name")
+        row = box.row()
+        row.operator("kerbal_redux.quick_export", icon='FILE_TICK')
+        row.operator("kerbal_redux.modal_export", icon='TIME')
         
         # Show current object info
         obj = context.active_object
@@ -306,6 +1068,14 @@ class KERBAL_REDUX_PT_panel(Panel):
         else:
             box.label(text="Select a mesh object", icon='ERROR')
         
+        # Stage timings of the last Export (Responsive) run
+        if last_export_stats:
+            layout.separator()
+            box = layout.box()
+            box.label(text=f"Last Export: {last_export_stats['name']} ({last_export_stats['status']})", icon='TIME')
+            for stage, seconds in last_export_stats['timings'].items():
+                box.label(text=f"  {stage}: {seconds * 1000:.0f} ms")
+        
         layout.separator()
         
         # Instructions
@@ -336,13 +1106,15 @@ class KERBAL_REDUX_OT_quick_export(Operator):
             self.report({'ERROR'}, "No mesh selected!")
             return {'CANCELLED'}
         
-        filepath_base = os.path.join(settings.output_path, settings.mesh_name)
+        filepath_base = os.path.join(bpy.path.abspath(settings.output_path), settings.mesh_name)
         
         try:
-            success, message = KSPMeshExporter.export_mesh(obj, filepath_base)
+            success, message, skipped = KSPMeshExporter.export_incremental(
+                obj, filepath_base, settings.file_format, settings.optimize_cache,
+                settings.export_tangents, settings.apply_transforms)
             
             if success:
-                self.report({'INFO'}, f"Exported: {message}")
+                self.report({'INFO'}, f"{settings.mesh_name}: {message}" if skipped else f"Exported: {message}")
                 return {'FINISHED'}
             else:
                 self.report({'ERROR'}, message)
@@ -353,6 +1125,189 @@ class KERBAL_REDUX_OT_quick_export(Operator):
             return {'CANCELLED'}
 
 
+class KERBAL_REDUX_OT_modal_export(Operator):
+    """Quick export in timed steps so Blender stays responsive"""
+    bl_idname = "kerbal_redux.modal_export"
+    bl_label = "Export (Responsive)"
+    bl_description = "Quick export in steps on a timer, with progress in the status bar (ESC cancels)"
+    
+    def invoke(self, context, event):
+        # Get settings from scene
+        settings = context.scene.kerbal_redux_settings
+        
+        if not settings.output_path:
+            self.report({'ERROR'}, "No output path set! Use Export dialog first.")
+            return {'CANCELLED'}
+        
+        obj = context.active_object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "No mesh selected!")
+            return {'CANCELLED'}
+        
+        filepath_base = os.path.join(bpy.path.abspath(settings.output_path), settings.mesh_name)
+        self.mesh_name = settings.mesh_name
+        self.timings = {}
+        self.message = None
+        self.stage = 0
+        self.fraction = 0.0
+        self.future = None
+        self.cancel = threading.Event()
+        self.pool = ThreadPoolExecutor(max_workers=1)
+        self.steps = self.export_steps(context, obj, filepath_base, settings)
+        
+        wm = context.window_manager
+        self.timer = wm.event_timer_add(0.05, window=context.window)
+        wm.progress_begin(0, len(EXPORT_STAGES))
+        wm.modal_handler_add(self)
+        self.show_progress(context)
+        return {'RUNNING_MODAL'}
+    
+    def export_steps(self, context, obj, filepath_base, settings):
+        """The export as a generator of (stage, fraction of the stage, future) slices.
+        
+        The modal handler runs main-thread slices until a tick's budget is
+        used. The evaluated mesh is first copied into a mesh datablock owned
+        by the export, so scene edits between ticks cannot free it, and is
+        then triangulated and read in slices (read_mesh_steps). The NumPy
+        stages run on the worker thread; the generator yields their future
+        and the handler keeps the UI running until it is done.
+        """
+        def timed(stage, function, *args):
+            start = time.perf_counter()
+            result = function(*args)
+            self.timings[stage] = time.perf_counter() - start
+            return result
+        
+        start = time.perf_counter()
+        depsgraph = context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh = bpy.data.meshes.new_from_object(obj_eval, preserve_all_data_layers=True, depsgraph=depsgraph)
+        matrix = np.array(obj_eval.matrix_world)
+        self.timings["Depsgraph eval"] = time.perf_counter() - start
+        try:
+            yield 1, 0.0, None
+            
+            reading = KSPMeshExporter.read_mesh_steps(mesh)
+            self.timings["Triangulation"] = 0.0
+            while True:
+                start = time.perf_counter()
+                try:
+                    fraction = next(reading)
+                except StopIteration as done:
+                    data = done.value
+                    break
+                finally:
+                    self.timings["Triangulation"] += time.perf_counter() - start
+                yield 1, fraction, None
+        finally:
+            try:
+                bpy.data.meshes.remove(mesh)
+            except ReferenceError:
+                pass  # already gone, e.g. after an undo
+        if settings.apply_transforms:
+            data = KSPMeshExporter.transform_mesh(*data, matrix)
+        
+        # Same manifest as quick export, so both agree on what is current
+        options = (settings.file_format, settings.optimize_cache, settings.export_tangents)
+        future = self.pool.submit(timed, "Change check", KSPMeshExporter.export_hash, data, *options,
+                                  settings.apply_transforms)
+        yield 2, 0.0, future
+        mesh_hash = future.result()
+        future = self.pool.submit(KSPMeshExporter.is_unchanged, filepath_base, mesh_hash)
+        yield 2, 0.5, future
+        if future.result():
+            self.message = "Unchanged, skipped writing"
+            return
+        
+        future = self.pool.submit(timed, "Dedupe", KSPMeshExporter.build_streams, *data)
+        yield 3, 0.0, future
+        streams = future.result()
+        
+        cancel = self.cancel
+        
+        def write():
+            # Written to a scratch folder and only moved into place if ESC was not pressed meanwhile
+            if cancel.is_set():
+                return (False, "Export cancelled")
+            folder, name = os.path.split(filepath_base)
+            scratch = tempfile.mkdtemp(prefix=".kr_export_", dir=folder)
+            try:
+                success, message = KSPMeshExporter.write_streams(streams, data[3] is not None,
+                                                                 os.path.join(scratch, name), *options)
+                if cancel.is_set():
+                    return (False, "Export cancelled")
+                for f in os.listdir(scratch):
+                    os.replace(os.path.join(scratch, f), os.path.join(folder, f))
+                if cancel.is_set():
+                    return (False, "Export cancelled")
+                KSPMeshExporter.record_export(filepath_base, mesh_hash, success, settings.file_format,
+                                              settings.export_tangents and data[3] is not None)
+                return (success, message)
+            finally:
+                shutil.rmtree(scratch, ignore_errors=True)
+        
+        future = self.pool.submit(timed, "Write", write)
+        yield 4, 0.0, future
+        success, message = future.result()
+        if not success:
+            raise RuntimeError(message)
+        self.message = message
+    
+    def show_progress(self, context):
+        context.window_manager.progress_update(self.stage + self.fraction)
+        percent = f" {self.fraction:.0%}" if self.fraction else ""
+        context.workspace.status_text_set(
+            f"Kerbal Redux: exporting {self.mesh_name}, {EXPORT_STAGES[self.stage]}{percent} "
+            f"({self.stage + 1}/{len(EXPORT_STAGES)}), ESC to cancel")
+    
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            return self.finish(context, 'cancelled')
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        # Main-thread slices until this tick's budget is used or a worker stage is still running
+        deadline = time.perf_counter() + EXPORT_TICK_SECONDS
+        while self.future is None or self.future.done():
+            try:
+                self.stage, self.fraction, self.future = next(self.steps)
+            except StopIteration:
+                return self.finish(context, 'done')
+            except Exception as e:
+                self.message = f"Export failed: {str(e)}"
+                return self.finish(context, 'failed')
+            if time.perf_counter() >= deadline:
+                break
+        self.show_progress(context)
+        return {'RUNNING_MODAL'}
+    
+    def finish(self, context, status):
+        # A write still on the worker thread sees this and leaves the files alone
+        self.cancel.set()
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        self.steps.close()
+        self.pool.shutdown(wait=False)
+        
+        last_export_stats.clear()
+        last_export_stats.update(name=self.mesh_name, status=status, timings=dict(self.timings))
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        
+        total = sum(self.timings.values())
+        if status == 'done':
+            self.report({'INFO'}, f"{self.mesh_name}: {self.message} ({total:.2f} s)")
+            return {'FINISHED'}
+        if status == 'failed':
+            self.report({'ERROR'}, self.message)
+        else:
+            self.report({'WARNING'}, f"Export cancelled during {EXPORT_STAGES[self.stage]}; nothing was written")
+        return {'CANCELLED'}
+
+
 class KerbalReduxSettings(bpy.types.PropertyGroup):
     """Settings for the addon"""
     output_path: StringProperty(
@@ -374,13 +1329,40 @@ class KerbalReduxSettings(bpy.types.PropertyGroup):
         default="",
         subtype='DIR_PATH',
     )
+    
+    file_format: EnumProperty(
+        name="Format",
+        description="How the mesh is written to disk",
+        items=FILE_FORMAT_ITEMS,
+        default='STREAMS',
+    )
+    
+    optimize_cache: BoolProperty(
+        name="Optimize Vertex Cache",
+        description="Reorder triangles and vertices for GPU vertex cache reuse (slower export)",
+        default=False,
+    )
+    
+    export_tangents: BoolProperty(
+        name="Export Tangents",
+        description="Write per-vertex tangents (.tan / TAN section) for bumped shaders such as KSP/Bumped Specular; needs the plugin built from src/",
+        default=False,
+    )
+    
+    apply_transforms: BoolProperty(
+        name="Apply Transforms",
+        description="Export with the object's location, rotation and scale baked in, as after Ctrl+A (the object is not changed)",
+        default=True,
+    )
 
 
 classes = (
     KerbalReduxSettings,
     EXPORT_OT_kerbal_redux,
+    IMPORT_OT_kerbal_redux,
     KERBAL_REDUX_PT_panel,
     KERBAL_REDUX_OT_quick_export,
+    KERBAL_REDUX_OT_modal_export,
 )
 
 
@@ -388,15 +1370,21 @@ def menu_func_export(self, context):
     self.layout.operator(EXPORT_OT_kerbal_redux.bl_idname, text="Kerbal Redux Mesh (.vtx/.tex/.nml/.idx)")
 
 
+def menu_func_import(self, context):
+    self.layout.operator(IMPORT_OT_kerbal_redux.bl_idname, text="Kerbal Redux Mesh (.vtx/.tex/.nml/.idx)")
+
+
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     
     bpy.types.Scene.kerbal_redux_settings = bpy.props.PointerProperty(type=KerbalReduxSettings)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
+    bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
 
 
 def unregister():
+    bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
     
     for cls in reversed(classes):
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+KerbalRedux Mesh Converter Benchmark
+====================================
+
+Times each stage of mesh_converter on synthetic OBJ files and compares
+runs against each other to catch performance regressions.
+
+Usage:
+    python mesh_benchmark.py run [options]
+    python mesh_benchmark.py compare <baseline.json> <results.json>
+
+Examples:
+    # Full suite (1k to 5M triangles, every variant)
+    python mesh_benchmark.py run -o bench.json
+
+    # Quick check against an earlier run
+    python mesh_benchmark.py run --sizes 1k 10k 100k -o new.json --baseline bench.json
+
+    # Compare two saved runs, flagging anything 20% slower
+    python mesh_benchmark.py compare bench.json new.json --threshold 20
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import multiprocessing
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import mesh_converter
+
+
+RESULTS_VERSION = 1
+
+DEFAULT_SIZES = ['1k', '10k', '100k', '1M', '5M']
+
+# Variant -> (face arity: 3, 4 or 'mixed', has UVs, has normals)
+VARIANTS = {
+    'tris': (3, False, False),
+    'tris-uv-nml': (3, True, True),
+    'quads-uv': (4, True, False),
+    'ngons-uv': ('mixed', True, False),
+}
+
+STAGES = ['parse', 'triangulate', 'weld', 'normals', 'gather', 'write_streams', 'write_krm']
+
+# Stage times below this many seconds are too noisy to call a regression
+NOISE_FLOOR = 0.005
+
+
+def parse_size(text):
+    """Triangle count from '5000', '10k' or '5M'."""
+    scale = {'k': 1000, 'm': 1000000}.get(text[-1:].lower(), 1)
+    try:
+        count = int(float(text[:-1] if scale > 1 else text) * scale)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a triangle count: {text}")
+    if count < 2:
+        raise argparse.ArgumentTypeError(f"need at least 2 triangles, got {text}")
+    return count
+
+
+def size_label(count):
+    """Short label for a triangle count (1000 -> '1k')."""
+    for suffix, scale in (('M', 1000000), ('k', 1000)):
+        if count >= scale and count % scale == 0:
+            return f"{count // scale}{suffix}"
+    return str(count)
+
+
+def generate_obj(filepath, triangles, variant):
+    """Write a wavy grid OBJ with about `triangles` triangles.
+
+    Every grid cell is two triangles, a quad, or half of a hexagon spanning
+    two cells, so all variants triangulate to the same count. 'mixed'
+    arity cycles rows of triangles, quads and hexagons, which forces the
+    converter's ragged-face path.
+    """
+    arity, with_uvs, with_normals = VARIANTS[variant]
+    cells = max(triangles // 2, 1)
+    width = max(int(math.sqrt(cells)), 1)
+    height = -(-cells // width)
+
+    x, y = np.meshgrid(np.arange(width + 1, dtype=np.float64), np.arange(height + 1, dtype=np.float64))
+    x, y = x.ravel(), y.ravel()
+    z = 0.25 * np.sin(x * 0.3) * np.cos(y * 0.2)
+    grid = lambda i, j: (j * (width + 1) + i + 1).ravel()
+
+    # Cell corners, counter-clockwise from the lower left
+    i, j = np.meshgrid(np.arange(width), np.arange(height))
+    a, b, c, d = grid(i, j), grid(i + 1, j), grid(i + 1, j + 1), grid(i, j + 1)
+    rows = j.ravel()
+
+    polygons = []
+    if arity == 3:
+        polygons.append(np.concatenate([np.stack([a, b, c], 1), np.stack([a, c, d], 1)]))
+    elif arity == 4:
+        polygons.append(np.stack([a, b, c, d], 1))
+    else:
+        kind = rows % 3
+        tri = kind == 0
+        polygons.append(np.concatenate([np.stack([a[tri], b[tri], c[tri]], 1), np.stack([a[tri], c[tri], d[tri]], 1)]))
+        # Hexagons cover cell pairs; an odd cell at the end of a row stays a quad
+        col = np.arange(len(a)) % width
+        hexagon = (kind == 2) & (col % 2 == 0) & (col + 1 < width)
+        quad = (kind == 1) | ((kind == 2) & (col % 2 == 0) & ~hexagon)
+        polygons.append(np.stack([a[quad], b[quad], c[quad], d[quad]], 1))
+        h = np.flatnonzero(hexagon)
+        polygons.append(np.stack([a[h], b[h], b[h + 1], c[h + 1], c[h], d[h]], 1))
+
+    with open(filepath, 'w') as f:
+        f.write(f"# mesh_benchmark {variant} {width}x{height} grid\n")
+        np.savetxt(f, np.stack([x, y, z], 1), fmt='v %.6f %.6f %.6f')
+        if with_uvs:
+            np.savetxt(f, np.stack([x / width, y / height], 1), fmt='vt %.6f %.6f')
+        if with_normals:
+            nx = -0.075 * np.cos(x * 0.3) * np.cos(y * 0.2)
+            ny = 0.05 * np.sin(x * 0.3) * np.sin(y * 0.2)
+            normals = np.stack([nx, ny, np.ones_like(nx)], 1)
+            np.savetxt(f, normals / np.linalg.norm(normals, axis=1)[:, None], fmt='vn %.6f %.6f %.6f')
+
+        # Every attribute shares the position's index
+        fields = 1 + with_uvs + with_normals
+        corner = '/'.join(['%d'] * fields) if with_uvs else '%d//%d' if with_normals else '%d'
+        for faces in polygons:
+            if len(faces):
+                fmt = 'f ' + ' '.join([corner] * faces.shape[1])
+                np.savetxt(f, np.repeat(faces, fields, axis=1), fmt=fmt)
+
+    return sum(len(p) * (p.shape[1] - 2) for p in polygons)
+
+
+def run_pipeline(obj_path, out_dir):
+    """Run every converter stage once.
+
+    Returns ({stage: seconds}, triangle count, welded vertex count).
+    """
+    timings = {}
+    clock = time.perf_counter
+
+    start = clock()
+    vertices, normals, uvs, faces = mesh_converter.parse_obj(obj_path)
+    timings['parse'] = clock() - start
+
+    start = clock()
+    corners = mesh_converter.triangulate_faces(faces)
+    timings['triangulate'] = clock() - start
+
+    start = clock()
+    welded, triangles = mesh_converter.weld_vertices(corners)
+    timings['weld'] = clock() - start
+
+    # Always generated, even when the OBJ has normals, so every variant times it
+    start = clock()
+    smooth = mesh_converter.generate_normals(vertices, mesh_converter._column(corners, 0))
+    timings['normals'] = clock() - start
+
+    start = clock()
+    vertex_ids, uv_ids = mesh_converter._column(welded, 0), mesh_converter._column(welded, 1)
+    out_vertices = mesh_converter.gather_attribute(vertices, vertex_ids, 3)
+    out_normals = mesh_converter.gather_attribute(smooth, vertex_ids, 3)
+    out_uvs = mesh_converter.gather_attribute(uvs, uv_ids, 2) if len(uvs) else []
+    timings['gather'] = clock() - start
+
+    base = Path(out_dir) / 'bench'
+    start = clock()
+    mesh_converter.write_stream(out_vertices, f"{base}.vtx", 'f', 3)
+    if len(out_uvs):
+        mesh_converter.write_stream(out_uvs, f"{base}.tex", 'f', 2)
+    mesh_converter.write_stream(out_normals, f"{base}.nml", 'f', 3)
+    mesh_converter.write_stream(triangles, f"{base}.idx", 'i')
+    timings['write_streams'] = clock() - start
+
+    start = clock()
+    mesh_converter.write_krm(f"{base}.krm", out_vertices, out_uvs, out_normals, triangles)
+    timings['write_krm'] = clock() - start
+
+    return timings, len(corners) // 3, len(welded)
+
+
+def _benchmark_case(obj_path, repeat):
+    """Child-process entry point: best-of-`repeat` stage times plus peak RSS."""
+    best = {}
+    with tempfile.TemporaryDirectory(prefix='kr_bench_') as out_dir, contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            timings, triangle_count, vertex_count = run_pipeline(obj_path, out_dir)
+            for stage, seconds in timings.items():
+                best[stage] = min(seconds, best.get(stage, seconds))
+    return best, triangle_count, vertex_count, peak_rss_mb()
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def run_benchmarks(sizes, variants, repeat, work_dir):
+    """Benchmark every size/variant pair and return the results document."""
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    cases = {}
+
+    # A fresh process per case keeps peak RSS from carrying over between cases
+    context = multiprocessing.get_context('spawn')
+    for size in sizes:
+        for variant in variants:
+            key = f"{variant}/{size_label(size)}"
+            obj_path = work_dir / f"{variant}_{size_label(size)}.obj"
+            if not obj_path.exists():
+                print(f"🧱 Generating {obj_path.name}...")
+                partial = obj_path.with_suffix('.obj.part')
+                generate_obj(partial, size, variant)
+                partial.replace(obj_path)
+
+            print(f"⏱️  {key:<22}", end='', flush=True)
+            with ProcessPoolExecutor(1, mp_context=context) as pool:
+                stages, triangle_count, vertex_count, rss = pool.submit(_benchmark_case, str(obj_path), repeat).result()
+            total = sum(stages.values())
+            cases[key] = {
+                'variant': variant,
+                'triangles': triangle_count,
+                'vertices': vertex_count,
+                'obj_bytes': obj_path.stat().st_size,
+                'stages': stages,
+                'total': total,
+                'peak_rss_mb': rss,
+            }
+            rss_note = f", peak RSS {rss:.0f}MB" if rss is not None else ''
+            print(f"{total:8.3f}s  ({', '.join(f'{s} {stages[s]:.3f}' for s in STAGES if s in stages)}){rss_note}")
+
+    return {
+        'version': RESULTS_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'machine': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+        },
+        'repeat': repeat,
+        'cases': cases,
+    }
+
+
+def compare_results(baseline, current, threshold=10.0, noise_floor=NOISE_FLOOR):
+    """Print a per-case comparison and return the list of regressions.
+
+    A stage (or the total, or peak RSS) regresses when it got more than
+    `threshold` percent worse and, for times, by more than `noise_floor`
+    seconds.
+    """
+    limit = 1 + threshold / 100
+    regressions = []
+
+    def check(key, label, old, new, unit, floor):
+        if old is None or new is None:
+            return
+        ratio = new / old if old > 0 else float('inf') if new > 0 else 1.0
+        flag = ''
+        if ratio > limit and new - old > floor:
+            flag = '  ❌ REGRESSION'
+            regressions.append((key, label, old, new))
+        elif ratio < 1 / limit and old - new > floor:
+            flag = '  ✅ faster' if unit == 's' else '  ✅ smaller'
+        digits = 3 if unit == 's' else 1
+        print(f"   {label:<14} {old:10.{digits}f}{unit} -> {new:10.{digits}f}{unit}  ({(ratio - 1) * 100:+6.1f}%){flag}")
+
+    old_cases, new_cases = baseline['cases'], current['cases']
+    for key in sorted(new_cases, key=lambda k: (new_cases[k]['triangles'], k)):
+        new = new_cases[key]
+        old = old_cases.get(key)
+        if old is None:
+            print(f"\n🆕 {key}: not in baseline")
+            continue
+        print(f"\n📊 {key}")
+        for stage in STAGES:
+            check(key, stage, old['stages'].get(stage), new['stages'].get(stage), 's', noise_floor)
+        check(key, 'total', old['total'], new['total'], 's', noise_floor)
+        check(key, 'peak RSS', old.get('peak_rss_mb'), new.get('peak_rss_mb'), 'MB', 1.0)
+
+    missing = sorted(set(old_cases) - set(new_cases))
+    if missing:
+        print(f"\n⚠️  Not benchmarked this run: {', '.join(missing)}")
+    if baseline.get('machine') != current.get('machine'):
+        print("\n⚠️  Results come from different machines or library versions")
+
+    print("\n" + "=" * 50)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) over {threshold:g}%:")
+        for key, label, old, new in regressions:
+            print(f"   • {key} {label}: {old:.3f} -> {new:.3f}")
+    else:
+        print(f"✅ No regressions over {threshold:g}%")
+    return regressions
+
+
+def load_results(path):
+    """Read a results file written by `run`."""
+    with open(path) as f:
+        results = json.load(f)
+    if results.get('version') != RESULTS_VERSION:
+        raise ValueError(f"{path}: unsupported results version {results.get('version')}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the OBJ to KSP mesh conversion pipeline',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s run -o bench.json
+  %(prog)s run --sizes 1k 100k --variants tris quads-uv -o new.json --baseline bench.json
+  %(prog)s compare bench.json new.json --threshold 20
+        """
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Generate test meshes and time every conversion stage')
+    run_parser.add_argument('--sizes', type=parse_size, nargs='+', metavar='N',
+                            default=[parse_size(s) for s in DEFAULT_SIZES],
+                            help=f"Triangle counts, e.g. 1k 250k 5M (default: {' '.join(DEFAULT_SIZES)})")
+    run_parser.add_argument('--variants', choices=VARIANTS, nargs='+', default=list(VARIANTS),
+                            help='Face layouts to test (default: all)')
+    run_parser.add_argument('--repeat', type=int, default=3, help='Runs per case; the fastest time counts (default: 3)')
+    run_parser.add_argument('--work-dir', default=Path(tempfile.gettempdir()) / 'kr_mesh_benchmark',
+                            help='Where generated OBJ files are kept between runs')
+    run_parser.add_argument('-o', '--output', help='Write results to this JSON file')
+    run_parser.add_argument('--baseline', help='Compare against an earlier results file')
+    run_parser.add_argument('--threshold', type=float, default=10.0,
+                            help='Percent slowdown reported as a regression (default: 10)')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two results files')
+    compare_parser.add_argument('baseline', help='Earlier results file')
+    compare_parser.add_argument('results', help='Newer results file')
+    compare_parser.add_argument('--threshold', type=float, default=10.0,
+                                help='Percent slowdown reported as a regression (default: 10)')
+
+    args = parser.parse_args()
+
+    if args.command == 'compare':
+        regressions = compare_results(load_results(args.baseline), load_results(args.results), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    if np is None:
+        print("❌ Error: The benchmark needs NumPy (pip install numpy)")
+        sys.exit(1)
+
+    baseline = load_results(args.baseline) if args.baseline else None
+    results = run_benchmarks(sorted(set(args.sizes)), args.variants, max(args.repeat, 1), args.work_dir)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results written to {args.output}")
+
+    if baseline is not None:
+        regressions = compare_results(baseline, results, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
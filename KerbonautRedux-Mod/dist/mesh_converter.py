@@ -3,7 +3,7 @@
 KerbalRedux Mesh Converter
 ==========================
 
-Converts OBJ files to KSP mesh format (.vtx, .tex, .nml, .idx)
+Converts OBJ (or binary glTF/GLB, PLY and STL) files to KSP mesh format (.vtx, .tex, .nml, .idx)
 
 Usage:
     python mesh_converter.py <input.obj> [options]
@@ -22,136 +22,2671 @@ Interactive Mode (no arguments):
     python mesh_converter.py
 """
 
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
 import struct
 import sys
+import tempfile
+import time
+import zipfile
 import argparse
+import warnings
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain, product
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Record prefix -> (prefix length, number of values kept per record)
+OBJ_RECORDS = {
+    'v': (1, 3),
+    'vt': (2, 2),
+    'vn': (2, 3),
+    'f': (1, None),
+}
+
+OBJ_BLOCK_SIZE = 16 * 1024 * 1024
+
+# Records that start a new part for --split: object, group and material names
+OBJ_PART_RECORDS = ('o', 'g', 'usemtl')
+
+MESH_EXTENSIONS = ['.vtx', '.tex', '.nml', '.tan', '.idx', '.srt', '.krm']
+
+# .krm packed mesh container, all little-endian:
+#   header  magic "KRM1", u16 version, u16 flags, u32 stream count,
+#           u32 vertex count, u32 index count, u32 reserved,
+#           f32[3] bounds min, f32[3] bounds max               (48 bytes)
+#   table   one entry per stream: char[4] tag, u8 format, u8 components,
+#           u16 reserved, u32 element count, u32 offset, u32 byte size,
+#           f32[4] decode offset, f32[4] decode scale          (64 bytes each)
+#   data    stream payloads, each starting on a 16-byte boundary
+# A decoded component is offset + scale * stored value; float32 and int32
+# streams are stored as-is with the identity decode.
+KRM_MAGIC = b'KRM1'
+KRM_VERSION = 1
+KRM_HEADER = struct.Struct('<4sHHIIII3f3f')
+KRM_STREAM = struct.Struct('<4sBBHIII4f4f12x')
+KRM_FLAG_BOUNDS = 1
+
+KRM_TAG_POSITION = b'POS '
+KRM_TAG_UV = b'UV0 '
+KRM_TAG_NORMAL = b'NRM '
+KRM_TAG_TANGENT = b'TAN '    # xyz tangent, w = bitangent sign
+KRM_TAG_INDEX = b'IDX '
+KRM_TAG_SORTED = b'SRT '     # one back-to-front index order per SORT_VIEWS entry, concatenated
+
+KRM_FLOAT32 = 1
+KRM_INT32 = 2
+KRM_UINT16 = 3
+KRM_FLOAT16 = 4
+KRM_SNORM16 = 5     # int16 / 32767, clamped to -1
+
+# Attribute encodings for compact .krm output (positions are always snorm16)
+COMPACT_ENCODINGS = ('snorm16', 'float16')
+
+KRM_IDENTITY_DECODE = (0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0)
+
+# HairConfigs.LoadMesh never sets Mesh.indexFormat, so Unity keeps 16-bit indices
+# (same limit as kr_mesh.MAX_UNITY_VERTICES, which verify-meshes checks)
+MAX_UNITY_VERTICES = 65535
+
+# The KSP plugin only loads the newer stream types once it is rebuilt from src/.
+# A build that can load one contains its marker: the .krm reader's class name,
+# the .tan path literal (C# strings are stored as UTF-16).
+PLUGIN_DLL = 'KerbonautRedux.dll'
+PLUGIN_FEATURES = {
+    'krm': b'PackedMesh',
+    'tan': '.tan'.encode('utf-16-le'),
+}
+
+
+def plugin_supports(feature, dll_path=None):
+    """Whether the plugin DLL can load `feature` (a PLUGIN_FEATURES key).
+    
+    Checks `dll_path`, by default the DLL shipped next to this script.
+    Returns None when there is no DLL to check.
+    """
+    dll_path = Path(dll_path) if dll_path is not None else Path(__file__).resolve().parent / PLUGIN_DLL
+    try:
+        return PLUGIN_FEATURES[feature] in dll_path.read_bytes()
+    except OSError:
+        return None
+
 
 def parse_obj(filepath):
     """Parse OBJ file and return vertices, normals, uvs, and faces."""
+    print(f"📂 Reading {filepath}...")
+    
+    result = None
+    if np is not None:
+        groups = ObjGroups()
+        result = _parse_obj_numpy(filepath, groups)
+        if result is None:
+            print("   ⚠️  Irregular OBJ layout, falling back to slow parser")
+    if result is None:
+        groups = ObjGroups()
+        result = _parse_obj_python(filepath, groups)
+        if np is not None:
+            result = result[:3] + (FaceArrays.from_faces(result[3]),)
+    
+    vertices, normals, uvs, faces = result
+    print(f"   ✅ Loaded {len(vertices)} vertices, {len(normals)} normals, {len(uvs)} UVs, {len(faces)} faces")
+    if np is not None and len(groups.keys) > 1:
+        faces.parts = np.asarray(groups.face_parts, np.int32)
+        faces.part_keys = groups.keys
+        print(f"   🧩 {len(groups.keys)} parts (o/g/usemtl)")
+    return result
+
+
+class ObjGroups:
+    """The o/g/usemtl state of an OBJ being parsed, numbering the parts faces use.
+    
+    A part is one (object, group, material) combination; `keys` lists them
+    in order of first use and `face_parts` holds the part id of every face.
+    A new object starts without a group; the material carries over.
+    """
+    __slots__ = ('state', 'keys', 'ids', 'face_parts')
+    
+    def __init__(self):
+        self.state = ('', '', '')
+        self.keys = []
+        self.ids = {}
+        self.face_parts = array('i')
+    
+    def set(self, record, name):
+        """Apply an `o`, `g` or `usemtl` record."""
+        obj, group, material = self.state
+        if record == 'o':
+            self.state = (name, '', material)
+        elif record == 'g':
+            self.state = (obj, name, material)
+        else:
+            self.state = (obj, group, name)
+    
+    def part_id(self, state=None):
+        """Id of the part for `state` (default: the current one)."""
+        state = self.state if state is None else state
+        part = self.ids.get(state)
+        if part is None:
+            part = self.ids[state] = len(self.keys)
+            self.keys.append(state)
+        return part
+
+
+class FaceArrays:
+    """Polygons in CSR form: face i owns corners[offsets[i]:offsets[i + 1]].
+    
+    `corners` is an (N, 3) int32 array of (v, vt, vn) rows (-1 = none) and
+    `offsets` an int64 array with one more entry than there are faces.
+    `shared_index` marks indexed inputs (glTF, PLY, STL) where vt and vn
+    are either the vertex index or -1, so there is nothing to weld.
+    `parts`/`part_keys` split an OBJ by object, group and material (see
+    ObjGroups).
+    """
+    __slots__ = ('offsets', 'corners', 'shared_index', 'parts', 'part_keys')
+    
+    def __init__(self, offsets, corners, shared_index=False):
+        self.offsets = offsets
+        self.corners = corners
+        self.shared_index = shared_index
+        self.parts = None       # part id per face, for OBJs with several parts
+        self.part_keys = None   # (object, group, material) per part id
+    
+    @classmethod
+    def from_counts(cls, corners, counts, shared_index=False):
+        """Build from faces stored back to back with `counts` corners each."""
+        offsets = np.zeros(len(counts) + 1, np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(offsets, corners, shared_index)
+    
+    @classmethod
+    def from_indices(cls, indices, has_uvs, has_normals, arity=3, offsets=None):
+        """Build shared-index faces from one flat vertex index per corner.
+        
+        Faces are `arity` corners each unless explicit `offsets` are given.
+        """
+        v = np.asarray(indices).astype(np.int32).reshape(-1)
+        corners = np.full((len(v), 3), -1, np.int32)
+        corners[:, 0] = v
+        if has_uvs:
+            corners[:, 1] = v
+        if has_normals:
+            corners[:, 2] = v
+        if offsets is None:
+            offsets = np.arange(0, len(v) + 1, arity, dtype=np.int64)
+        return cls(offsets, corners, True)
+    
+    @classmethod
+    def from_faces(cls, faces):
+        """Build from a list of (v, vt, vn) corner lists."""
+        corners = np.array([c for face in faces for c in face], np.int32).reshape(-1, 3)
+        return cls.from_counts(corners, [len(face) for face in faces])
+    
+    def __len__(self):
+        return len(self.offsets) - 1
+    
+    def arities(self):
+        """Corner count of every face."""
+        return np.diff(self.offsets)
+
+
+def _parse_obj_python(filepath, groups=None):
+    """Parse OBJ file line by line (fallback when NumPy is unavailable)."""
+    with open(filepath, 'r') as f:
+        vertices, normals, uvs, faces = _parse_obj_lines(f, groups=groups)
+    
+    # Keep values at the float32 precision they are written with, like the bulk parser
+    vertices = _round_float32(vertices, 3)
+    normals = _round_float32(normals, 3)
+    uvs = _round_float32(uvs, 2)
+    return vertices, normals, uvs, faces
+
+
+def _parse_obj_lines(lines, first_line=1, groups=None):
+    """Parse OBJ text lines into vertex, normal, UV and face lists.
+    
+    `groups` (an ObjGroups) also records the part of every face.
+    """
     vertices = []
     normals = []
     uvs = []
     faces = []
     
-    print(f"📂 Reading {filepath}...")
+    for line_num, line in enumerate(lines, first_line):
+        # Comments may also follow a record on the same line
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+            
+        parts = line.split()
+        cmd = parts[0]
+        
+        try:
+            if cmd == 'v':
+                vertices.append((float(parts[1]), float(parts[2]), float(parts[3])))
+            elif cmd == 'vn':
+                normals.append((float(parts[1]), float(parts[2]), float(parts[3])))
+            elif cmd == 'vt':
+                uvs.append((float(parts[1]), float(parts[2])))
+            elif cmd == 'f':
+                face = []
+                for part in parts[1:]:
+                    face.append(_parse_corner(part))
+                faces.append(face)
+                if groups is not None:
+                    groups.face_parts.append(groups.part_id())
+            elif groups is not None and cmd in OBJ_PART_RECORDS:
+                groups.set(cmd, line.split(None, 1)[1] if len(parts) > 1 else '')
+        except (ValueError, IndexError) as e:
+            print(f"⚠️  Warning: Line {line_num} malformed: {line[:50]}...")
+            continue
+    
+    return vertices, normals, uvs, faces
+
+
+def _parse_corner(part):
+    """Parse a `v`, `v/vt`, `v//vn` or `v/vt/vn` face corner into 0-based indices (-1 = none)."""
+    fields = part.split('/')
+    v = int(fields[0]) - 1
+    vt = int(fields[1]) - 1 if len(fields) > 1 and fields[1] else -1
+    vn = int(fields[2]) - 1 if len(fields) > 2 and fields[2] else -1
+    return (v, vt, vn)
+
+
+def _round_float32(rows, width):
+    """Round a list of float tuples to float32 precision."""
+    flat = array('f', [x for row in rows for x in row])
+    return list(zip(*(flat[i::width] for i in range(width))))
+
+
+def _parse_obj_numpy(filepath, groups=None):
+    """Bulk-parse an OBJ file into float32/int32 arrays.
+    
+    Returns None if the file contains anything the bulk path can't handle
+    exactly (malformed records, inline comments, mixed face formats), so the
+    caller can fall back to the line-by-line parser. `groups` (an
+    ObjGroups) also records the part of every face.
+    """
+    records = {kind: [] for kind in OBJ_RECORDS}
+    
+    with open(filepath, 'rb') as f:
+        for block in _read_obj_blocks(f):
+            if not _parse_obj_block(block, records, groups):
+                return None
+    
+    vertices = _concat_records(records['v'], 3, np.float32)
+    uvs = _concat_records(records['vt'], 2, np.float32)
+    normals = _concat_records(records['vn'], 3, np.float32)
+    
+    corners = [c for c, _ in records['f']]
+    counts = [n for _, n in records['f']]
+    corners = np.concatenate(corners) if corners else np.empty((0, 3), np.int32)
+    counts = np.concatenate(counts) if counts else np.empty(0, np.int32)
+    
+    return vertices, normals, uvs, FaceArrays.from_counts(corners, counts)
+
+
+def _read_obj_blocks(f):
+    """Yield newline-terminated blocks of about OBJ_BLOCK_SIZE bytes."""
+    tail = b''
+    while True:
+        block = f.read(OBJ_BLOCK_SIZE)
+        if not block:
+            break
+        block = tail + block
+        cut = block.rfind(b'\n') + 1
+        tail = block[cut:]
+        if cut:
+            yield block[:cut]
+    if tail.strip():
+        yield tail + b'\n'
+
+
+def _concat_records(chunks, width, dtype):
+    """Join per-block record arrays into one contiguous array."""
+    if not chunks:
+        return np.empty((0, width), dtype)
+    return np.concatenate(chunks).astype(dtype, copy=False)
+
+
+def _parse_obj_block(block, records, groups=None):
+    """Sort the lines of one newline-terminated block by record type and parse them."""
+    a = np.frombuffer(block, np.uint8)
+    ends = np.flatnonzero(a == 10)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    
+    last = len(a) - 1
+    c0 = a[starts]
+    c1 = a[np.minimum(starts + 1, last)]
+    c2 = a[np.minimum(starts + 2, last)]
+    sep1 = (c1 == 32) | (c1 == 9)
+    sep2 = (c2 == 32) | (c2 == 9)
+    
+    # Indented records would be misclassified; leave those files to the slow path
+    indented = np.flatnonzero((c0 == 32) | (c0 == 9))
+    for i in indented:
+        if block[starts[i]:ends[i]].strip():
+            return False
+    
+    kinds = {
+        'v': (c0 == ord('v')) & sep1,
+        'vt': (c0 == ord('v')) & (c1 == ord('t')) & sep2,
+        'vn': (c0 == ord('v')) & (c1 == ord('n')) & sep2,
+        'f': (c0 == ord('f')) & sep1,
+    }
+    line_lengths = ends - starts + 1
+    
+    for kind, selected in kinds.items():
+        if not selected.any():
+            continue
+        prefix_len, width = OBJ_RECORDS[kind]
+        
+        # Gather the selected lines into one buffer and blank out their prefixes
+        chunk = a[np.repeat(selected, line_lengths)]
+        lengths = line_lengths[selected]
+        chunk_starts = np.cumsum(lengths) - lengths
+        for j in range(prefix_len):
+            chunk[chunk_starts + j] = 32
+        
+        if kind == 'f':
+            parsed = _parse_face_chunk(chunk, chunk_starts)
+        else:
+            parsed = _parse_float_chunk(chunk, chunk_starts, width)
+        if parsed is None:
+            return False
+        records[kind].append(parsed)
+    
+    if groups is not None:
+        _track_obj_groups(block, starts, ends, c0, sep1, kinds['f'], groups)
+    return True
+
+
+def _track_obj_groups(block, starts, ends, c0, sep1, faces, groups):
+    """Add the part id of every face line in a block to `groups`."""
+    # o/g/usemtl lines are rare, so they are read one by one
+    candidates = np.flatnonzero((((c0 == ord('o')) | (c0 == ord('g'))) & sep1) | (c0 == ord('u')))
+    marks, states = [], [groups.state]
+    for i in candidates.tolist():
+        fields = block[starts[i]:ends[i]].split(None, 1)
+        record = fields[0].decode('ascii', 'replace')
+        if record not in OBJ_PART_RECORDS:
+            continue
+        groups.set(record, fields[1].strip().decode('utf-8', 'replace') if len(fields) > 1 else '')
+        marks.append(i)
+        states.append(groups.state)
+    
+    # Faces between two records share a part; only parts with faces get an id
+    segment = np.searchsorted(np.array(marks, np.int64), np.flatnonzero(faces), 'right')
+    used = np.bincount(segment, minlength=len(states)) > 0
+    ids = np.array([groups.part_id(state) if use else -1 for state, use in zip(states, used.tolist())], np.int32)
+    groups.face_parts.frombytes(ids[segment].tobytes())
+
+
+def _token_positions(chunk):
+    """Offsets of the first byte of every whitespace-separated token."""
+    space = chunk <= 32
+    starts = ~space
+    starts[1:] &= space[:-1]
+    return np.flatnonzero(starts)
+
+
+def _count_between(positions, boundaries):
+    """Count sorted `positions` falling into each [boundary, next boundary) range."""
+    return np.diff(np.searchsorted(positions, boundaries), append=len(positions))
+
+
+def _fromstring(chunk, dtype):
+    """Parse whitespace-separated numbers; returns None on unparseable data."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            return np.fromstring(chunk.tobytes(), dtype=dtype, sep=' ')
+        except (ValueError, DeprecationWarning):
+            return None
+
+
+def _parse_float_chunk(chunk, line_starts, width):
+    """Parse `v`/`vt`/`vn` records, keeping the first `width` values of each line."""
+    counts = _count_between(_token_positions(chunk), line_starts)
+    if counts.min() < width:
+        return None
+    
+    values = _fromstring(chunk, np.float64)
+    if values is None or len(values) != counts.sum():
+        return None
+    
+    if counts.max() == width:
+        return values.reshape(-1, width).astype(np.float32)
+    offsets = np.cumsum(counts) - counts
+    return values[offsets[:, None] + np.arange(width)].astype(np.float32)
+
+
+def _parse_face_chunk(chunk, line_starts):
+    """Parse `f` records into (v, vt, vn) corner rows plus corner counts per face."""
+    tokens = _token_positions(chunk)
+    counts = _count_between(tokens, line_starts)
+    n_corners = int(counts.sum())
+    
+    # Every corner must use the same v, v/vt, v//vn or v/vt/vn layout
+    slash = chunk == ord('/')
+    n_slashes = int(slash.sum())
+    if n_slashes % max(n_corners, 1):
+        return None
+    per_corner = n_slashes // max(n_corners, 1)
+    if per_corner:
+        token_slashes = _count_between(np.flatnonzero(slash), tokens)
+        if token_slashes.min() != per_corner or token_slashes.max() != per_corner:
+            return None
+    n_fields = per_corner + 1
+    columns = [0, 1, 2][:n_fields]
+    if per_corner == 2:
+        empty_vt = int((slash[:-1] & slash[1:]).sum())
+        if empty_vt == n_corners:
+            n_fields = 2
+            columns = [0, 2]
+        elif empty_vt:
+            return None
+    
+    chunk[slash] = 32
+    values = _fromstring(chunk, np.int64)
+    if values is None or len(values) != n_corners * n_fields:
+        return None
+    
+    corners = np.full((n_corners, 3), -1, np.int32)
+    corners[:, columns] = values.reshape(n_corners, n_fields) - 1
+    return corners, counts.astype(np.int32)
+
+
+# Binary importers. Each returns (vertices, normals, uvs, FaceArrays) like
+# parse_obj; attribute arrays are views into a read-only memory map of the
+# file wherever the source layout allows it.
+MESH_INPUT_EXTENSIONS = ('.obj', '.glb', '.gltf', '.ply', '.stl')
+
+GLB_MAGIC = b'glTF'
+GLB_CHUNK_JSON = 0x4E4F534A
+GLB_CHUNK_BIN = 0x004E4942
+GLTF_TRIANGLES = 4
+
+# accessor componentType -> dtype, accessor type -> components
+GLTF_COMPONENT_TYPES = {5120: '<i1', 5121: '<u1', 5122: '<i2', 5123: '<u2', 5125: '<u4', 5126: '<f4'}
+GLTF_TYPE_WIDTHS = {'SCALAR': 1, 'VEC2': 2, 'VEC3': 3, 'VEC4': 4}
+
+PLY_TYPES = {
+    'char': 'i1', 'int8': 'i1', 'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2', 'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4', 'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4', 'double': 'f8', 'float64': 'f8',
+}
+PLY_UV_NAMES = (('u', 'v'), ('s', 't'), ('texture_u', 'texture_v'), ('texture_s', 'texture_t'))
+
+STL_HEADER_SIZE = 84
+STL_FACET_SIZE = 50
+
+
+def load_mesh(filepath):
+    """Read any supported input (see MESH_INPUT_EXTENSIONS) by file extension.
+
+    Raises ValueError for files the importers cannot read.
+    """
+    suffix = Path(filepath).suffix.lower()
+    if suffix == '.obj':
+        return parse_obj(filepath)
+    if np is None:
+        raise ValueError(f"Reading {suffix} files needs NumPy (pip install numpy)")
+    
+    print(f"📂 Reading {filepath}...")
+    if suffix in ('.glb', '.gltf'):
+        result = parse_gltf(filepath)
+    elif suffix == '.ply':
+        result = parse_ply(filepath)
+    elif suffix == '.stl':
+        result = parse_stl(filepath)
+    else:
+        raise ValueError(f"Unsupported input format {suffix} (use {', '.join(MESH_INPUT_EXTENSIONS)})")
+    
+    vertices, normals, uvs, faces = result
+    print(f"   ✅ Loaded {len(vertices)} vertices, {len(normals)} normals, {len(uvs)} UVs, {len(faces)} faces")
+    return result
+
+
+def parse_gltf(filepath):
+    """Read every triangle primitive of a .glb or .gltf scene.
+
+    Node transforms are applied (which costs a copy of those vertices), and
+    a mirroring one reverses the triangle winding so faces keep pointing
+    outward; texture coordinates are flipped to the bottom-left origin OBJ uses.
+    Primitives without normals make the converter generate all of them.
+    """
+    filepath = Path(filepath)
+    data = np.memmap(filepath, np.uint8, 'r')
+    if filepath.suffix.lower() == '.glb':
+        gltf, binary = _read_glb(data)
+    else:
+        gltf, binary = json.loads(bytes(data).decode('utf-8')), None
+    buffers = [_gltf_buffer(filepath, buffer, binary) for buffer in gltf.get('buffers', [])]
+    
+    primitives = []
+    for mesh_index, matrix in _gltf_mesh_instances(gltf):
+        for primitive in gltf['meshes'][mesh_index].get('primitives', []):
+            if primitive.get('mode', GLTF_TRIANGLES) != GLTF_TRIANGLES:
+                print(f"   ⚠️  Skipping non-triangle primitive (mode {primitive['mode']}) in mesh {mesh_index}")
+                continue
+            attributes = primitive.get('attributes', {})
+            if 'POSITION' not in attributes:
+                continue
+            positions = _gltf_accessor(gltf, buffers, attributes['POSITION'])
+            normals = _gltf_accessor(gltf, buffers, attributes['NORMAL']) if 'NORMAL' in attributes else None
+            uvs = _gltf_accessor(gltf, buffers, attributes['TEXCOORD_0']) if 'TEXCOORD_0' in attributes else None
+            if 'indices' in primitive:
+                indices = _gltf_accessor(gltf, buffers, primitive['indices']).reshape(-1)
+            else:
+                indices = np.arange(len(positions), dtype=np.int32)
+            
+            if matrix is not None:
+                positions = positions @ matrix[:3, :3].T.astype(np.float32) + matrix[:3, 3].astype(np.float32)
+                if normals is not None:
+                    normals = _normalize_rows(normals @ np.linalg.inv(matrix[:3, :3]).astype(np.float32))
+                if np.linalg.det(matrix[:3, :3]) < 0:
+                    indices = indices.reshape(-1, 3)[:, [0, 2, 1]].reshape(-1)
+            if uvs is not None:
+                uvs = np.column_stack([uvs[:, 0], 1 - uvs[:, 1]])
+            primitives.append((positions, normals, uvs, indices))
+    
+    if not primitives:
+        return np.empty((0, 3), np.float32), [], [], FaceArrays.from_indices([], False, False)
+    return _merge_indexed(primitives)
+
+
+def _read_glb(data):
+    """Split a GLB container into its JSON document and binary chunk."""
+    if len(data) < 20 or bytes(data[:4]) != GLB_MAGIC:
+        raise ValueError("Not a GLB file")
+    version, length = struct.unpack_from('<II', data, 4)
+    if version != 2:
+        raise ValueError(f"Unsupported glTF version {version}")
+    gltf, binary = None, None
+    offset = 12
+    while offset + 8 <= min(length, len(data)):
+        chunk_length, chunk_type = struct.unpack_from('<II', data, offset)
+        chunk = data[offset + 8:offset + 8 + chunk_length]
+        if chunk_type == GLB_CHUNK_JSON:
+            gltf = json.loads(bytes(chunk).decode('utf-8'))
+        elif chunk_type == GLB_CHUNK_BIN and binary is None:
+            binary = chunk
+        offset += 8 + chunk_length
+    if gltf is None:
+        raise ValueError("GLB file has no JSON chunk")
+    return gltf, binary
+
+
+def _gltf_buffer(filepath, buffer, binary):
+    """Bytes of one glTF buffer: the GLB chunk, a data: URI or a mapped file."""
+    uri = buffer.get('uri')
+    if uri is None:
+        if binary is None:
+            raise ValueError("glTF buffer without a URI outside a GLB file")
+        return binary
+    if uri.startswith('data:'):
+        import base64
+        return np.frombuffer(base64.b64decode(uri.split(',', 1)[1]), np.uint8)
+    from urllib.parse import unquote
+    return np.memmap(filepath.parent / unquote(uri), np.uint8, 'r')
+
+
+def _gltf_accessor(gltf, buffers, index):
+    """(count, components) view of an accessor; normalized integers become floats."""
+    accessor = gltf['accessors'][index]
+    if 'sparse' in accessor:
+        raise ValueError(f"Sparse glTF accessors are not supported (accessor {index})")
+    dtype = np.dtype(GLTF_COMPONENT_TYPES[accessor['componentType']])
+    width = GLTF_TYPE_WIDTHS[accessor['type']]
+    count = accessor['count']
+    if 'bufferView' not in accessor:
+        return np.zeros((count, width), dtype)
+    
+    view = gltf['bufferViews'][accessor['bufferView']]
+    stride = view.get('byteStride') or dtype.itemsize * width
+    offset = view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+    buffer = buffers[view['buffer']]
+    if count and offset + stride * (count - 1) + dtype.itemsize * width > len(buffer):
+        raise ValueError(f"glTF accessor {index} runs past the end of its buffer")
+    values = np.ndarray((count, width), dtype, buffer=buffer, offset=offset, strides=(stride, dtype.itemsize))
+    if accessor.get('normalized') and dtype.kind in 'iu':
+        # Signed values use the full range minus one so -1.0 is exact
+        return np.maximum(values / np.float32(np.iinfo(dtype).max), np.float32(-1))
+    return values
+
+
+def _gltf_mesh_instances(gltf):
+    """Yield (mesh index, world matrix or None for identity) for the default scene."""
+    nodes = gltf.get('nodes', [])
+    if not nodes:
+        for i in range(len(gltf.get('meshes', []))):
+            yield i, None
+        return
+    
+    scenes = gltf.get('scenes')
+    if scenes:
+        roots = scenes[gltf.get('scene', 0)].get('nodes', [])
+    else:
+        children = {c for node in nodes for c in node.get('children', [])}
+        roots = [i for i in range(len(nodes)) if i not in children]
+    
+    stack = [(i, np.eye(4)) for i in reversed(roots)]
+    while stack:
+        index, parent = stack.pop()
+        node = nodes[index]
+        world = parent @ _gltf_node_matrix(node)
+        if 'mesh' in node:
+            yield node['mesh'], None if np.array_equal(world, np.eye(4)) else world
+        stack.extend((c, world) for c in reversed(node.get('children', [])))
+
+
+def _gltf_node_matrix(node):
+    """Local 4x4 transform of a glTF node from `matrix` or translation/rotation/scale."""
+    if 'matrix' in node:
+        return np.array(node['matrix'], np.float64).reshape(4, 4).T
+    x, y, z, w = node.get('rotation', (0, 0, 0, 1))
+    rotation = np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+    ])
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation * np.array(node.get('scale', (1, 1, 1)), np.float64)
+    matrix[:3, 3] = node.get('translation', (0, 0, 0))
+    return matrix
+
+
+def _merge_indexed(primitives):
+    """Join (positions, normals, uvs, indices) parts into one shared-index mesh.
+
+    A single part is returned without copying. Normals are only kept when
+    every part has them; missing UVs are filled with zeros.
+    """
+    has_normals = all(p[1] is not None for p in primitives)
+    has_uvs = any(p[2] is not None for p in primitives)
+    if len(primitives) == 1:
+        positions, normals, uvs, indices = primitives[0]
+    else:
+        positions = np.concatenate([p[0] for p in primitives]).astype(np.float32, copy=False)
+        normals = np.concatenate([p[1] for p in primitives]) if has_normals else None
+        uvs = np.concatenate([p[2] if p[2] is not None else np.zeros((len(p[0]), 2), np.float32)
+                              for p in primitives]) if has_uvs else None
+        starts = np.cumsum([0] + [len(p[0]) for p in primitives[:-1]])
+        indices = np.concatenate([p[3].astype(np.int64) + start for p, start in zip(primitives, starts)])
+    
+    faces = FaceArrays.from_indices(indices, has_uvs, has_normals)
+    return (positions, normals if has_normals else np.empty((0, 3), np.float32),
+            uvs if has_uvs else np.empty((0, 2), np.float32), faces)
+
+
+def parse_ply(filepath):
+    """Read a binary (little- or big-endian) PLY file.
+
+    Vertex properties are read as views of the mapped file. Faces with one
+    polygon size throughout are read as a fixed-size record array too;
+    mixed polygon sizes fall back to walking the face records one by one.
+    """
+    data = np.memmap(filepath, np.uint8, 'r')
+    header_end = bytes(data[:65536]).find(b'end_header')
+    if bytes(data[:3]) != b'ply' or header_end < 0:
+        raise ValueError("Not a PLY file")
+    offset = bytes(data[:65536]).index(b'\n', header_end) + 1
+    
+    byte_order, elements = None, []
+    for line in bytes(data[:header_end]).decode('ascii', 'replace').splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        if parts[0] == 'format':
+            if parts[1] == 'ascii':
+                raise ValueError("ASCII PLY is not supported; save it as binary")
+            byte_order = '<' if parts[1] == 'binary_little_endian' else '>'
+        elif parts[0] == 'element':
+            elements.append((parts[1], int(parts[2]), []))
+        elif parts[0] == 'property' and elements:
+            if parts[1] == 'list':
+                elements[-1][2].append((parts[4], byte_order + PLY_TYPES[parts[2]], byte_order + PLY_TYPES[parts[3]]))
+            else:
+                elements[-1][2].append((parts[2], byte_order + PLY_TYPES[parts[1]], None))
+    
+    vertices = faces = None
+    for name, count, properties in elements:
+        if name == 'face':
+            faces, offset = _read_ply_faces(data, offset, count, properties)
+        elif all(item is None for _, _, item in properties):
+            dtype = np.dtype([(prop, t) for prop, t, _ in properties])
+            records = np.frombuffer(data, dtype, count, offset)
+            offset += dtype.itemsize * count
+            if name == 'vertex':
+                vertices = records
+        elif vertices is not None and faces is not None:
+            break
+        else:
+            raise ValueError(f"Cannot skip variable-size PLY element '{name}'")
+    if vertices is None:
+        raise ValueError("PLY file has no vertex element")
+    
+    names = vertices.dtype.names
+    positions = _ply_columns(vertices, ('x', 'y', 'z'))
+    normals = _ply_columns(vertices, ('nx', 'ny', 'nz')) if {'nx', 'ny', 'nz'} <= set(names) else None
+    uv_names = next((pair for pair in PLY_UV_NAMES if set(pair) <= set(names)), None)
+    uvs = _ply_columns(vertices, uv_names) if uv_names else None
+    
+    indices, offsets = faces if faces is not None else ([], None)
+    faces = FaceArrays.from_indices(indices, uvs is not None, normals is not None, offsets=offsets)
+    return (positions, normals if normals is not None else np.empty((0, 3), np.float32),
+            uvs if uvs is not None else np.empty((0, 2), np.float32), faces)
+
+
+def _ply_columns(records, names):
+    """Named fields of a record array as (n, k) columns, as a view when adjacent."""
+    fields = [records.dtype.fields[name] for name in names]
+    dtype, first = fields[0]
+    if all(f[0] == dtype and f[1] == first + i * dtype.itemsize for i, f in enumerate(fields)):
+        return np.ndarray((len(records), len(names)), dtype, buffer=records, offset=first,
+                          strides=(records.dtype.itemsize, dtype.itemsize))
+    return np.column_stack([records[name] for name in names])
+
+
+def _read_ply_faces(data, offset, count, properties):
+    """Read the PLY face element at `offset`.
+    
+    Returns ((flat corner indices, face offsets), end offset).
+    """
+    index_names = ('vertex_indices', 'vertex_index')
+    if not any(prop in index_names for prop, _, _ in properties):
+        raise ValueError("PLY face element has no vertex_indices list")
+    if count == 0:
+        return (np.empty(0, np.int32), np.zeros(1, np.int64)), offset
+    
+    # Guess every list is as long as in the first face, then check the guess
+    layout = []
+    position = offset
+    for prop, count_type, item_type in properties:
+        size = np.dtype(count_type).itemsize
+        if item_type is None:
+            layout.append((prop, count_type))
+        else:
+            n = int(np.frombuffer(data, count_type, 1, position)[0])
+            layout += [(prop + '_count', count_type), (prop, item_type, (n,))]
+            size += n * np.dtype(item_type).itemsize
+        position += size
+    dtype = np.dtype(layout)
+    if offset + dtype.itemsize * count <= len(data):
+        records = np.frombuffer(data, dtype, count, offset)
+        uniform = all((records[prop + '_count'] == dtype.fields[prop][0].shape[0]).all()
+                      for prop, _, item_type in properties if item_type is not None)
+        if uniform:
+            index_name = next(prop for prop, _, _ in properties if prop in index_names)
+            indices = records[index_name]
+            offsets = np.arange(0, indices.size + 1, indices.shape[1], dtype=np.int64)
+            return (indices, offsets), offset + dtype.itemsize * count
+    
+    print("   ⚠️  Mixed polygon sizes, reading PLY faces one by one")
+    buffer = memoryview(data)
+    counts = np.empty(count, np.int64)
+    chunks = []
+    for face in range(count):
+        for prop, count_type, item_type in properties:
+            count_dtype = np.dtype(count_type)
+            if item_type is None:
+                offset += count_dtype.itemsize
+                continue
+            n = int(np.frombuffer(buffer, count_dtype, 1, offset)[0])
+            offset += count_dtype.itemsize
+            item_size = np.dtype(item_type).itemsize
+            if prop in index_names:
+                counts[face] = n
+                chunks.append(np.frombuffer(buffer, item_type, n, offset))
+            offset += n * item_size
+    indices = np.concatenate(chunks) if chunks else np.empty(0, np.int32)
+    offsets = np.zeros(count + 1, np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return (indices, offsets), offset
+
+
+def parse_stl(filepath):
+    """Read a binary STL file, welding corners that share a position.
+
+    STL stores three unshared corners and a flat facet normal per triangle;
+    corners are merged by exact position so smooth normals can be
+    generated, and the facet normals are ignored.
+    """
+    data = np.memmap(filepath, np.uint8, 'r')
+    if len(data) < STL_HEADER_SIZE:
+        raise ValueError("File too short for a binary STL")
+    count = int(np.frombuffer(data, '<u4', 1, 80)[0])
+    if len(data) != STL_HEADER_SIZE + STL_FACET_SIZE * count:
+        raise ValueError("Not a binary STL (ASCII STL is not supported; save it as binary)")
+    
+    facets = np.frombuffer(data, np.dtype([('normal', '<f4', 3), ('corners', '<f4', (3, 3)), ('attribute', '<u2')]),
+                           count, STL_HEADER_SIZE)
+    corners = facets['corners'].reshape(-1, 3)
+    if not len(corners):
+        return corners, [], [], FaceArrays.from_indices([], False, False)
+    
+    # Number welded positions in first-use order, like weld_vertices
+    _, first, inverse = np.unique(_row_keys(corners), return_index=True, return_inverse=True)
+    order = np.argsort(first, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    vertices = corners[first[order]]
+    return (vertices, np.empty((0, 3), np.float32), np.empty((0, 2), np.float32),
+            FaceArrays.from_indices(rank[inverse.reshape(-1)], False, False))
+
+
+def triangulate_faces(faces):
+    """Convert polygons to triangles.
+    
+    Faces are a FaceArrays or lists of (v, vt, vn) corners; the result is
+    the flat list of triangle corners (an (N, 3) array when NumPy is
+    available). Every face is fanned from its first corner, in face order.
+    """
+    if np is not None and isinstance(faces, FaceArrays):
+        return _triangulate_csr(faces)
+    
+    triangles = []
+    for face in faces:
+        if len(face) == 3:
+            triangles.extend(face)
+        elif len(face) == 4:
+            triangles.extend([face[0], face[1], face[2], face[0], face[2], face[3]])
+        elif len(face) > 4:
+            for i in range(1, len(face) - 1):
+                triangles.extend([face[0], face[i], face[i + 1]])
+    if np is not None:
+        return np.array(triangles, np.int32).reshape(-1, 3)
+    return triangles
+
+
+def _triangulate_csr(faces):
+    """Fan-triangulate CSR faces with one gather per distinct face arity."""
+    arity = faces.arities()
+    if not len(arity):
+        return np.empty((0, 3), np.int32)
+    
+    # Uniform meshes need no grouping: gather straight into the output
+    k = int(arity[0])
+    if k >= 3 and arity.min() == arity.max():
+        fan = [c for i in range(1, k - 1) for c in (0, i, i + 1)]
+        return faces.corners.reshape(-1, k, 3)[:, fan].reshape(-1, 3)
+    
+    fans = np.maximum(arity - 2, 0)
+    kinds = np.unique(arity[fans > 0])
+    triangles = np.empty((int(fans.sum()) * 3, 3), np.int32)
+    first_triangle = np.cumsum(fans) - fans
+    for k in kinds.tolist():
+        group = np.flatnonzero(arity == k)
+        fan = np.array([c for i in range(1, k - 1) for c in (0, i, i + 1)])
+        # Output rows keep face order, so the result matches the list path
+        rows = (first_triangle[group] * 3)[:, None] + np.arange(3 * (k - 2))
+        triangles[rows] = faces.corners[faces.offsets[group][:, None] + fan]
+    return triangles
+
+
+def weld_vertices(corners):
+    """Merge identical (v, vt, vn) corners into shared output vertices.
+    
+    Returns the unique corners in order of first use and the triangle
+    indices into them.
+    """
+    if np is not None and isinstance(corners, np.ndarray):
+        if len(corners) == 0:
+            return corners, np.empty(0, np.int32)
+        keys = _corner_keys(corners)
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        # np.unique sorts by key; renumber by first use to match the fallback
+        order = np.argsort(first, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        indices = rank[inverse.reshape(-1)].astype(np.int32)
+        return corners[first[order]], indices
+    
+    table = {}
+    unique = []
+    indices = []
+    for corner in corners:
+        idx = table.get(corner)
+        if idx is None:
+            idx = table[corner] = len(unique)
+            unique.append(corner)
+        indices.append(idx)
+    return unique, indices
+
+
+def _corner_keys(corners):
+    """One sortable key per (v, vt, vn) row for np.unique."""
+    shifted = corners.astype(np.int64) + 1
+    spans = [int(x) + 1 for x in shifted.max(axis=0)]
+    if spans[0] * spans[1] * spans[2] < 2 ** 62:
+        # Pack the triplet into a single int64 (sorts ~3x faster than raw rows)
+        return (shifted[:, 0] * spans[1] + shifted[:, 1]) * spans[2] + shifted[:, 2]
+    # Otherwise compare the rows as structured 12-byte records
+    return np.ascontiguousarray(corners, np.int32).view(np.dtype((np.void, 12))).ravel()
+
+
+def gather_attribute(data, ids, width):
+    """Look up `data[id]` for every id, using zeros where the id is -1."""
+    if np is not None:
+        ids = np.asarray(ids, np.int64).reshape(-1)
+        out = np.zeros((len(ids), width), np.float32)
+        used = ids >= 0
+        if len(data):
+            out[used] = np.asarray(data, np.float32)[ids[used]]
+        return out
+    zero = (0.0,) * width
+    return [data[i] if i >= 0 else zero for i in ids]
+
+
+def _column(corners, i):
+    """One index column (v, vt or vn) of a corner list."""
+    if np is not None and isinstance(corners, np.ndarray):
+        return corners[:, i]
+    return [c[i] for c in corners]
+
+
+def _has_missing(ids):
+    """True if any id is -1 (attribute not given for that corner)."""
+    if np is not None and isinstance(ids, np.ndarray):
+        return bool((ids < 0).any())
+    return any(i < 0 for i in ids)
+
+
+def check_corner_indices(corners, n_vertices, n_uvs, n_normals):
+    """Return an error message if any face corner points outside its array."""
+    if np is not None:
+        corners = np.asarray(corners, np.int64).reshape(-1, 3)
+        columns = [corners[:, 0], corners[:, 1], corners[:, 2]]
+    else:
+        columns = [[c[i] for c in corners] for i in range(3)]
+    
+    limits = (("vertex", n_vertices, 0), ("UV", n_uvs, -1), ("normal", n_normals, -1))
+    for column, (label, count, lowest) in zip(columns, limits):
+        if not len(column):
+            continue
+        if np is not None:
+            low, high = column.min(), column.max()
+        else:
+            low, high = min(column), max(column)
+        if low < lowest or high >= count:
+            return f"Face references a missing {label} (have {count})"
+    return None
+
+
+NORMAL_WEIGHTINGS = ('area', 'angle', 'uniform')
+
+
+def generate_normals(vertices, triangles, weighting='area'):
+    """Generate smooth normals from geometry.
+    
+    Face normals are accumulated on their corners weighted by triangle area
+    (the default), by the corner angle, or uniformly, then normalized.
+    """
+    if np is not None:
+        return _generate_normals_numpy(vertices, triangles, weighting)
+    
+    import math
+    normals = [(0.0, 0.0, 0.0) for _ in vertices]
+    counts = [0 for _ in vertices]
+    
+    for i in range(0, len(triangles), 3):
+        i0, i1, i2 = triangles[i], triangles[i+1], triangles[i+2]
+        v0 = vertices[i0]
+        v1 = vertices[i1]
+        v2 = vertices[i2]
+        
+        # Cross product (length is twice the triangle area)
+        ax, ay, az = v1[0]-v0[0], v1[1]-v0[1], v1[2]-v0[2]
+        bx, by, bz = v2[0]-v0[0], v2[1]-v0[1], v2[2]-v0[2]
+        nx, ny, nz = ay*bz-az*by, az*bx-ax*bz, ax*by-ay*bx
+        
+        weights = (1.0, 1.0, 1.0)
+        if weighting != 'area':
+            length = math.sqrt(nx*nx + ny*ny + nz*nz)
+            if length > 0:
+                nx, ny, nz = nx/length, ny/length, nz/length
+            if weighting == 'angle':
+                weights = tuple(_corner_angle(a, b, c) for a, b, c in ((v0, v1, v2), (v1, v2, v0), (v2, v0, v1)))
+        
+        for idx, w in zip((i0, i1, i2), weights):
+            normals[idx] = (normals[idx][0]+nx*w, normals[idx][1]+ny*w, normals[idx][2]+nz*w)
+            counts[idx] += 1
+    
+    # Average and normalize
+    result = []
+    for i, (n, c) in enumerate(zip(normals, counts)):
+        if c > 0:
+            x, y, z = n[0]/c, n[1]/c, n[2]/c
+            length = math.sqrt(x*x + y*y + z*z)
+            if length > 0:
+                result.append((x/length, y/length, z/length))
+            else:
+                result.append((0, 1, 0))
+        else:
+            result.append((0, 1, 0))
+    return result
+
+
+def _corner_angle(a, b, c):
+    """Angle at corner `a` of triangle (a, b, c)."""
+    import math
+    ex, ey, ez = b[0]-a[0], b[1]-a[1], b[2]-a[2]
+    fx, fy, fz = c[0]-a[0], c[1]-a[1], c[2]-a[2]
+    cx, cy, cz = ey*fz-ez*fy, ez*fx-ex*fz, ex*fy-ey*fx
+    return math.atan2(math.sqrt(cx*cx + cy*cy + cz*cz), ex*fx + ey*fy + ez*fz)
+
+
+def _generate_normals_numpy(vertices, triangles, weighting):
+    """Vectorized generate_normals: bulk face normals scatter-added with bincount.
+    
+    About 10x faster than the Python loop for area weighting and 25x for
+    angle weighting (1M triangles). What is left is the per-corner index
+    gathers and the bincount scatter-adds, which are memory-bound.
+    """
+    # Work on one contiguous array per axis; strided columns are much slower
+    x, y, z = np.array(vertices, np.float64).reshape(-1, 3).T.copy()
+    tris = np.asarray(triangles, np.int64).reshape(-1, 3)
+    i0, i1, i2 = tris.T.copy()
+    n = len(x)
+    
+    # Same operation order as the fallback so area weighting matches it bit for bit
+    ax, ay, az = x[i1] - x[i0], y[i1] - y[i0], z[i1] - z[i0]
+    bx, by, bz = x[i2] - x[i0], y[i2] - y[i0], z[i2] - z[i0]
+    face = [ay*bz - az*by, az*bx - ax*bz, ax*by - ay*bx]
+    
+    if weighting != 'area':
+        length = np.sqrt(face[0]*face[0] + face[1]*face[1] + face[2]*face[2])
+        if weighting == 'angle':
+            # |e x f| is twice the area at every corner, so each angle only needs its dot product
+            cx, cy, cz = bx - ax, by - ay, bz - az
+            dots = np.empty((len(length), 3))
+            dots[:, 0] = ax*bx + ay*by + az*bz
+            dots[:, 1] = -(cx*ax + cy*ay + cz*az)
+            dots[:, 2] = cx*bx + cy*by + cz*bz
+            weights = np.arctan2(length[:, None], dots).ravel()
+        for f in face:
+            np.divide(f, length, out=f, where=length > 0)
+    
+    corner_ids = tris.ravel()
+    if weighting == 'angle':
+        corner_normals = [np.repeat(f, 3) * weights for f in face]
+    else:
+        corner_normals = [np.repeat(f, 3) for f in face]
+    
+    # bincount adds in input order, exactly like the fallback's loop
+    sums = [np.bincount(corner_ids, weights=c, minlength=n) for c in corner_normals]
+    counts = np.bincount(corner_ids, minlength=n)
+    
+    # Average and normalize in one pass
+    used = counts > 0
+    for total in sums:
+        np.divide(total, counts, out=total, where=used)
+    length = np.sqrt(sums[0]*sums[0] + sums[1]*sums[1] + sums[2]*sums[2])
+    valid = used & (length > 0)
+    
+    result = np.zeros((n, 3), np.float32)
+    result[:, 1] = 1.0
+    for k, total in enumerate(sums):
+        result[valid, k] = total[valid] / length[valid]
+    return result
+
+
+def _corner_angles(a, b, c):
+    """Angle at corner `a` for every triangle (a, b, c)."""
+    e = b - a
+    f = c - a
+    return np.arctan2(np.linalg.norm(np.cross(e, f), axis=1), (e * f).sum(axis=1))
+
+
+def generate_tangents(vertices, uvs, normals, indices):
+    """Per-vertex tangents (x, y, z, w) for normal mapping, MikkTSpace style.
+    
+    Each triangle's UV-space tangent is projected onto the tangent plane of
+    each corner's normal, weighted by the corner angle in that plane and
+    summed per vertex. w is the bitangent sign Unity's bumped shaders
+    expect (bitangent = cross(normal, tangent) * w), taken by majority when
+    mirrored UVs share a vertex. Triangles with degenerate UVs add nothing;
+    vertices left without a tangent get one perpendicular to their normal.
+    """
+    # Axis-major float32 (3, N) arrays: per-axis rows are much faster than
+    # strided columns, and the sums are accumulated in float64 by bincount
+    pos = np.array(vertices, np.float32).reshape(-1, 3).T.copy()
+    nrm = np.array(normals, np.float32).reshape(-1, 3).T.copy()
+    u, v = np.array(uvs, np.float32).reshape(-1, 2).T.copy()
+    ids = np.asarray(indices, np.int64).reshape(-1, 3).T.copy()
+    n = pos.shape[1]
+    
+    p = [pos.take(i, axis=1) for i in ids]
+    d1, d2 = p[1] - p[0], p[2] - p[0]
+    u1, u2 = u[ids[1]] - u[ids[0]], u[ids[2]] - u[ids[0]]
+    v1, v2 = v[ids[1]] - v[ids[0]], v[ids[2]] - v[ids[0]]
+    # Twice the signed UV area; negative where the UVs are mirrored
+    uv_area = u1 * v2 - v1 * u2
+    orient = np.sign(uv_area)
+    face = (v2 * d1 - v1 * d2) * np.where(uv_area < 0, np.float32(-1), np.float32(1))
+    winding = _cross_axes(d1, d2)
+    
+    sums = np.zeros((3, n))
+    handedness = np.zeros(n)
+    for k in range(3):
+        nk = nrm.take(ids[k], axis=1)
+        # Tangent and both edges flattened onto the plane of this corner's normal
+        t, e, f = (w - nk * (w * nk).sum(axis=0)
+                   for w in (face, p[(k + 1) % 3] - p[k], p[(k + 2) % 3] - p[k]))
+        length = np.sqrt((t * t).sum(axis=0))
+        angle = np.arctan2(np.sqrt((_cross_axes(e, f) ** 2).sum(axis=0)), (e * f).sum(axis=0))
+        weight = np.where((orient != 0) & (length > 0), angle, np.float32(0))
+        scale = np.divide(weight, length, out=np.zeros_like(weight), where=length > 0)
+        for c in range(3):
+            sums[c] += np.bincount(ids[k], weights=t[c] * scale, minlength=n)
+        # Handedness from the geometry, so it holds whatever the winding convention
+        handedness += np.bincount(ids[k], weights=orient * np.sign((winding * nk).sum(axis=0)) * weight, minlength=n)
+    
+    # Vertices no usable triangle reached: any vector perpendicular to the normal
+    length = np.sqrt((sums * sums).sum(axis=0))
+    missing = ~(length > 1e-12)
+    if missing.any():
+        nm = nrm[:, missing]
+        axis = np.where(np.abs(nm[0]) < 0.9, [[1.0], [0.0], [0.0]], [[0.0], [1.0], [0.0]])
+        fallback = axis - nm * (axis * nm).sum(axis=0)
+        fallback_length = np.sqrt((fallback * fallback).sum(axis=0))
+        fallback[:, ~(fallback_length > 1e-12)] = [[1.0], [0.0], [0.0]]
+        fallback_length[~(fallback_length > 1e-12)] = 1.0
+        sums[:, missing] = fallback
+        length[missing] = fallback_length
+    
+    result = np.empty((n, 4), np.float32)
+    result[:, :3] = (sums / length).T
+    result[:, 3] = np.where(handedness < 0, -1.0, 1.0)
+    return result
+
+
+def _cross_axes(a, b):
+    """Cross products of axis-major (3, N) vector arrays."""
+    return np.array([a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]])
+
+
+# Lint-and-clean pass
+CLEAN_WELD_EPSILON = 1e-6     # weld distance as a fraction of the mesh's largest dimension
+CLEAN_UV_EPSILON = 1e-5       # welded vertices must also share UVs (seams stay split)
+CLEAN_NORMAL_COS = 0.9998     # ... and normals within about a degree (hard edges stay split)
+CLEAN_GRID_CELLS = 2 ** 20    # grid cells per axis at most, so a cell key fits in an int64
+
+
+def clean_mesh(vertices, uvs, normals, indices, epsilon=CLEAN_WELD_EPSILON):
+    """Weld near-coincident vertices and drop degenerate, duplicate and unused geometry.
+    
+    Vertices closer than `epsilon` times the largest bounding-box dimension
+    merge into the lowest-numbered one when their UVs and normals match too;
+    candidates are found through a hashed grid of weld-distance cells.
+    Triangles that lose a corner to the weld or have no area are removed,
+    and so are repeats of a triangle with the same winding (flipped copies
+    of double-sided cards stay). Vertices no triangle uses are dropped.
+    Prints a before/after report and returns (vertices, uvs, normals,
+    indices).
+    """
+    positions = np.asarray(vertices, np.float64).reshape(-1, 3)
+    triangles = np.asarray(indices, np.int64).reshape(-1, 3)
+    n_vertices, n_triangles = len(positions), len(triangles)
+    if not n_vertices:
+        return vertices, uvs, normals, indices
+    distance = epsilon * float((positions.max(axis=0) - positions.min(axis=0)).max())
+    
+    # Weld: every vertex maps to the lowest id among the close vertices it matches
+    i, j = _close_pairs(positions, distance)
+    unit = np.asarray(normals, np.float64).reshape(-1, 3)
+    unit = unit / np.maximum(np.linalg.norm(unit, axis=1, keepdims=True), 1e-30)
+    same = (unit[i] * unit[j]).sum(axis=1) >= CLEAN_NORMAL_COS
+    if len(uvs):
+        same &= (np.abs(uvs[i] - uvs[j]) <= CLEAN_UV_EPSILON).all(axis=1)
+    label = _component_labels(np.stack([i[same], j[same]], axis=1), n_vertices)
+    welded = int((label != np.arange(n_vertices)).sum())
+    triangles = label[triangles]
+    
+    # Degenerate: a repeated corner (usually from the weld) or no area to speak of
+    p = positions[triangles]
+    doubled_area = np.linalg.norm(np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0]), axis=1)
+    degenerate = ((triangles[:, 0] == triangles[:, 1]) | (triangles[:, 1] == triangles[:, 2]) |
+                  (triangles[:, 2] == triangles[:, 0]) | (doubled_area <= distance * distance))
+    triangles = triangles[~degenerate]
+    
+    # Duplicates: rotate the lowest id to the front, which keeps the winding
+    rotation = (triangles.argmin(axis=1)[:, None] + np.arange(3)) % 3
+    rotated = np.take_along_axis(triangles, rotation, axis=1)
+    _, first = np.unique(_corner_keys(rotated), return_index=True)
+    duplicates = len(triangles) - len(first)
+    triangles = triangles[np.sort(first)]
+    
+    # Compact: keep the used vertices in their original order
+    used, remapped = np.unique(triangles, return_inverse=True)
+    unused = n_vertices - welded - len(used)
+    
+    def stream_bytes(n_verts, n_tris):
+        return n_verts * (24 + (8 if len(uvs) else 0)) + n_tris * 12
+    print(f"   🧹 Clean: welded {welded} near-coincident vertices, removed {int(degenerate.sum())} degenerate "
+          f"and {duplicates} duplicate triangles, dropped {unused} unreferenced vertices")
+    print(f"      {n_vertices} -> {len(used)} vertices, {n_triangles} -> {len(triangles)} triangles, "
+          f"streams {stream_bytes(n_vertices, n_triangles)//1024}KB -> {stream_bytes(len(used), len(triangles))//1024}KB")
+    return (np.asarray(vertices)[used], np.asarray(uvs)[used] if len(uvs) else uvs, np.asarray(normals)[used],
+            remapped.reshape(-1).astype(np.int32))
+
+
+def _close_pairs(positions, distance):
+    """(i, j) arrays with i < j for every two points at most `distance` apart.
+    
+    Points are bucketed into cubic cells at least `distance` wide, keyed by
+    their packed cell coordinates; each point only meets the points in its
+    own cell and the 13 neighbouring cells with a larger key, so every
+    pair is seen once.
+    """
+    lo = positions.min(axis=0)
+    span = float((positions.max(axis=0) - lo).max())
+    cell = max(distance, span / (CLEAN_GRID_CELLS - 3), 1e-30)
+    cells = np.floor((positions - lo) / cell).astype(np.int64) + 1    # +1 leaves room for the -1 neighbour
+    keys = (cells[:, 0] * CLEAN_GRID_CELLS + cells[:, 1]) * CLEAN_GRID_CELLS + cells[:, 2]
+    order = np.argsort(keys, kind='stable')
+    keys, positions = keys[order], positions[order]
+    
+    pairs = ([], [])
+    for dx, dy, dz in product((-1, 0, 1), repeat=3):
+        delta = (dx * CLEAN_GRID_CELLS + dy) * CLEAN_GRID_CELLS + dz
+        if delta < 0:
+            continue
+        # Targets are sorted like the keys, which keeps the binary searches cache-friendly
+        stop = np.searchsorted(keys, keys + delta, 'right')
+        start = np.arange(1, len(keys) + 1) if delta == 0 else np.searchsorted(keys, keys + delta, 'left')
+        count = np.maximum(stop - start, 0)
+        i = np.repeat(np.arange(len(keys)), count)
+        j = np.repeat(start - (np.cumsum(count) - count), count) + np.arange(len(i))
+        close = ((positions[i] - positions[j]) ** 2).sum(axis=1) <= distance * distance
+        i, j = order[i[close]], order[j[close]]
+        pairs[0].append(np.minimum(i, j))
+        pairs[1].append(np.maximum(i, j))
+    return np.concatenate(pairs[0]), np.concatenate(pairs[1])
+
+
+def _component_labels(groups, n):
+    """Lowest id in the connected component of each of 0..n-1; each row of `groups` is connected."""
+    label = np.arange(n)
+    if not len(groups):
+        return label
+    while True:
+        # Hook every root a group touches onto the smallest of them, then flatten the trees
+        roots = label[groups]
+        new = label.copy()
+        np.minimum.at(new, roots.reshape(-1), np.repeat(roots.min(axis=1), groups.shape[1]))
+        while True:
+            jumped = new[new]
+            if np.array_equal(jumped, new):
+                break
+            new = jumped
+        if np.array_equal(new, label):
+            return label
+        label = new
+
+
+# Post-transform vertex cache modelled by the optimizer and the ACMR/ATVR report
+VERTEX_CACHE_SIZE = 16
+
+
+def optimize_vertex_order(indices, vertex_count):
+    """Reorder triangles and vertices for the GPU vertex cache.
+    
+    Runs optimize_vertex_cache then optimize_vertex_fetch and prints ACMR
+    (transformed vertices per triangle) and ATVR (per vertex) before and
+    after. Returns (indices, order); gather every vertex attribute through
+    `order` to match the new indices.
+    """
+    acmr, atvr = vertex_cache_stats(indices, vertex_count)
+    indices = optimize_vertex_cache(indices, vertex_count)
+    indices, order = optimize_vertex_fetch(indices, vertex_count)
+    new_acmr, new_atvr = vertex_cache_stats(indices, vertex_count)
+    print(f"   ⚡ Vertex cache: ACMR {acmr:.3f} -> {new_acmr:.3f}, ATVR {atvr:.3f} -> {new_atvr:.3f}")
+    return indices, order
+
+
+def optimize_vertex_cache(indices, vertex_count, cache_size=VERTEX_CACHE_SIZE):
+    """Reorder triangles for post-transform vertex cache reuse.
+    
+    Tipsify (Sander, Nehab and Barczak 2007): emit every remaining triangle
+    around one vertex, then fan around the vertex of those triangles that
+    stays longest in the simulated FIFO cache, falling back to recently
+    emitted vertices and then to the next vertex in index order. Work is
+    constant per triangle; corners keep their order, so winding is kept.
+    """
+    n_triangles = len(indices) // 3
+    if n_triangles == 0:
+        return indices
+    
+    # Vertex -> triangles it is used by; live[v] counts those not emitted yet
+    if np is not None:
+        flat = np.asarray(indices, np.int64).reshape(-1)
+        valence = np.bincount(flat, minlength=vertex_count)
+        starts = np.concatenate([[0], np.cumsum(valence)]).tolist()
+        adjacency = (np.argsort(flat, kind='stable') // 3).tolist()
+        triangles, live = flat.tolist(), valence.tolist()
+    else:
+        triangles = list(indices)
+        live = [0] * vertex_count
+        for v in triangles:
+            live[v] += 1
+        starts = [0]
+        for k in live:
+            starts.append(starts[-1] + k)
+        adjacency = [0] * len(triangles)
+        fill = starts[:-1]
+        for i, v in enumerate(triangles):
+            adjacency[fill[v]] = i // 3
+            fill[v] += 1
+    
+    # A vertex is cached while fewer than `cache_size` misses happened since it was loaded
+    loaded = [-cache_size] * vertex_count
+    misses = 0
+    emitted = bytearray(n_triangles)
+    dead_end = []
+    output = []
+    cursor = 0
+    fan = triangles[0]
+    
+    while fan >= 0:
+        fanned = []
+        for t in adjacency[starts[fan]:starts[fan + 1]]:
+            if emitted[t]:
+                continue
+            emitted[t] = 1
+            corner = triangles[3 * t:3 * t + 3]
+            fanned += corner
+            for v in corner:
+                live[v] -= 1
+                if misses - loaded[v] >= cache_size:
+                    loaded[v] = misses
+                    misses += 1
+        output += fanned
+        dead_end += fanned
+        
+        # Prefer the oldest cached vertex whose remaining fan still fits in the cache
+        fan, priority = -1, -1
+        for v in fanned:
+            if live[v]:
+                age = misses - loaded[v]
+                p = age if age + 2 * live[v] <= cache_size else 0
+                if p > priority:
+                    fan, priority = v, p
+        while fan < 0 and dead_end:
+            v = dead_end.pop()
+            if live[v]:
+                fan = v
+        if fan < 0:
+            while cursor < vertex_count and not live[cursor]:
+                cursor += 1
+            fan = cursor if cursor < vertex_count else -1
+    
+    if np is not None:
+        return np.array(output, np.int32)
+    return output
+
+
+def optimize_vertex_fetch(indices, vertex_count):
+    """Renumber vertices in first-use order so fetches walk memory forward.
+    
+    Returns (indices, order) where order[new id] = old id. Vertices no
+    triangle uses keep their relative order at the end.
+    """
+    if np is not None:
+        indices = np.asarray(indices, np.int32)
+        used, first = np.unique(indices, return_index=True)
+        first_use = np.full(vertex_count, len(indices), np.int64)
+        first_use[used] = first
+        order = np.argsort(first_use, kind='stable')
+        remap = np.empty(vertex_count, np.int32)
+        remap[order] = np.arange(vertex_count, dtype=np.int32)
+        return remap[indices], order
+    
+    remap = {}
+    for v in indices:
+        if v not in remap:
+            remap[v] = len(remap)
+    for v in range(vertex_count):
+        if v not in remap:
+            remap[v] = len(remap)
+    order = [0] * vertex_count
+    for old, new in remap.items():
+        order[new] = old
+    return [remap[v] for v in indices], order
+
+
+def vertex_cache_stats(indices, vertex_count, cache_size=VERTEX_CACHE_SIZE):
+    """Simulate a FIFO post-transform cache and return (ACMR, ATVR)."""
+    indices = indices.tolist() if hasattr(indices, 'tolist') else indices
+    # A vertex is cached while fewer than `cache_size` misses happened since it was loaded
+    loaded = [-cache_size] * vertex_count
+    misses = 0
+    for v in indices:
+        if misses - loaded[v] >= cache_size:
+            loaded[v] = misses
+            misses += 1
+    return misses / max(len(indices) // 3, 1), misses / max(vertex_count, 1)
+
+
+
+# Translucency sorting: view directions (where the camera looks) that get
+# their own back-to-front index order, in the order they are stored
+SORT_VIEWS = {
+    '+x': (1.0, 0.0, 0.0), '-x': (-1.0, 0.0, 0.0),
+    '+y': (0.0, 1.0, 0.0), '-y': (0.0, -1.0, 0.0),
+    '+z': (0.0, 0.0, 1.0), '-z': (0.0, 0.0, -1.0),
+}
+SORT_CLUSTER_SIZE = 32        # triangles moved as one unit; keeps most vertex cache reuse
+OVERDRAW_GRID = 256           # pixels across the mesh for the overdraw estimate
+OVERDRAW_CHUNK = 1 << 22      # candidate pixels rasterized per batch
+
+
+def sort_for_translucency(vertices, normals, indices, cache_ordered=False):
+    """Triangle orders for alpha-blended meshes.
+    
+    Triangles are grouped into small clusters that never cross from one
+    connected piece (a card, a shell) into another: runs of the input order
+    when it is already cache-optimized (`cache_ordered`), so most vertex
+    reuse survives, otherwise runs along the Morton curve of the centroids.
+    The main order puts outward-facing clusters first, which cuts overdraw
+    from every side (meshoptimizer's overdraw heuristic), unless the input
+    order already has less overdraw; each SORT_VIEWS
+    order draws the clusters back to front for that view. Prints the
+    overdraw estimate for every order. Returns (main indices, {view name:
+    indices}).
+    """
+    positions = np.asarray(vertices, np.float64).reshape(-1, 3)
+    triangles = np.asarray(indices, np.int64).reshape(-1, 3)
+    if not len(triangles):
+        return np.asarray(indices, np.int32), {name: np.asarray(indices, np.int32) for name in SORT_VIEWS}
+    
+    centroids = positions[triangles].mean(axis=1)
+    cluster = _triangle_clusters(centroids, _connected_pieces(triangles, len(positions)), cache_ordered)
+    n_clusters = int(cluster.max()) + 1
+    
+    # Cluster centroid and average normal, both weighted by triangle area
+    p = positions[triangles]
+    area = np.linalg.norm(np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0]), axis=1)
+    weight = np.bincount(cluster, weights=area, minlength=n_clusters)
+    weight[weight == 0] = 1
+    center = np.stack([np.bincount(cluster, weights=centroids[:, c] * area, minlength=n_clusters)
+                       for c in range(3)], axis=1) / weight[:, None]
+    # Vertex normals rather than the winding, which differs between exporters
+    face_normals = np.asarray(normals, np.float64).reshape(-1, 3)[triangles].sum(axis=1)
+    direction = np.stack([np.bincount(cluster, weights=face_normals[:, c] * area, minlength=n_clusters)
+                          for c in range(3)], axis=1)
+    direction /= np.maximum(np.linalg.norm(direction, axis=1, keepdims=True), 1e-30)
+    
+    def ordered(cluster_key):
+        """Triangle ids with whole clusters ordered by ascending `cluster_key`."""
+        rank = np.empty(n_clusters, np.int64)
+        rank[np.argsort(cluster_key, kind='stable')] = np.arange(n_clusters)
+        return np.argsort(rank[cluster], kind='stable')
+    
+    outward = ((center - centroids.mean(axis=0)) * direction).sum(axis=1)
+    main = ordered(-outward)
+    views = {name: ordered(-(center @ np.asarray(view))) for name, view in SORT_VIEWS.items()}
+    
+    # Rasterize once per view, then replay each order over the same fragments
+    fragments = {name: _rasterize(positions, triangles, np.asarray(view)) for name, view in SORT_VIEWS.items()}
+    
+    def stats(order, names):
+        results = [overdraw_stats(fragments[name], order) for name in names]
+        return tuple(sum(r[i] for r in results) / len(results) for i in range(2))
+    
+    identity = np.arange(len(triangles))
+    before, after = stats(identity, SORT_VIEWS), stats(main, SORT_VIEWS)
+    print(f"   🪟 Translucency sort: {n_clusters} clusters of up to {SORT_CLUSTER_SIZE} triangles")
+    print(f"      main order: overdraw {before[0]:.2f}x -> {after[0]:.2f}x, out of order "
+          f"{100 * before[1]:.1f}% -> {100 * after[1]:.1f}% (average of {len(SORT_VIEWS)} views)")
+    if after[0] >= before[0]:
+        # The input (e.g. a cache-optimized order) already draws with less overdraw
+        print("      main order: kept the input order")
+        main = identity
+    for name, order in views.items():
+        before, after = stats(identity, [name]), stats(order, [name])
+        print(f"      view {name}: overdraw {before[0]:.2f}x -> {after[0]:.2f}x, out of order "
+              f"{100 * before[1]:.1f}% -> {100 * after[1]:.1f}%")
+    
+    def flat(order):
+        return triangles[order].reshape(-1).astype(np.int32)
+    return flat(main), {name: flat(order) for name, order in views.items()}
+
+
+def _triangle_clusters(centroids, pieces, keep_order=False):
+    """Cluster id per triangle: runs of SORT_CLUSTER_SIZE within each piece.
+    
+    Runs follow the input order with `keep_order`, the Morton curve otherwise.
+    """
+    if keep_order:
+        order = np.argsort(pieces, kind='stable')
+    else:
+        order = np.lexsort((_morton_codes(centroids), pieces))
+    piece = pieces[order]
+    start = np.ones(len(order), bool)
+    start[1:] = piece[1:] != piece[:-1]
+    first = np.maximum.accumulate(np.where(start, np.arange(len(order)), 0))
+    new_cluster = start | ((np.arange(len(order)) - first) % SORT_CLUSTER_SIZE == 0)
+    cluster = np.empty(len(order), np.int64)
+    cluster[order] = np.cumsum(new_cluster) - 1
+    return cluster
+
+
+def _morton_codes(centroids):
+    """30-bit Morton code of each point on a 1024^3 grid over the bounds."""
+    lo = centroids.min(axis=0)
+    span = np.maximum(centroids.max(axis=0) - lo, 1e-30)
+    cells = np.minimum((centroids - lo) / span * 1024, 1023).astype(np.int64)
+    code = np.zeros(len(centroids), np.int64)
+    for bit in range(10):
+        for axis in range(3):
+            code |= ((cells[:, axis] >> bit) & 1) << (3 * bit + axis)
+    return code
+
+
+def _connected_pieces(triangles, n_vertices):
+    """Connected component id per triangle (triangles sharing a vertex are connected)."""
+    return _component_labels(triangles, n_vertices)[triangles[:, 0]]
+
+
+def _rasterize(positions, triangles, view, grid=OVERDRAW_GRID):
+    """Fragments of an orthographic render along `view`.
+    
+    Back faces are culled like Unity's default (counter-clockwise OBJ
+    winding faces the camera). Returns (triangle, pixel, depth) arrays;
+    depth grows away from the camera. Pixel centers inside or on a
+    triangle's edge count.
+    """
+    # Screen axes perpendicular to the view
+    side = np.cross(view, (0.0, 1.0, 0.0) if abs(view[1]) < 0.9 else (1.0, 0.0, 0.0))
+    side /= np.linalg.norm(side)
+    up = np.cross(side, view)
+    projected = positions @ np.stack([side, up, view]).T
+    lo = projected[:, :2].min(axis=0)
+    scale = grid / max(float((projected[:, :2].max(axis=0) - lo).max()), 1e-30)
+    xy = (projected[:, :2] - lo) * scale
+    
+    a, b, c = (xy[triangles[:, k]] for k in range(3))
+    za, zb, zc = (projected[triangles[:, k], 2] for k in range(3))
+    area = (b[:, 0] - a[:, 0]) * (c[:, 1] - a[:, 1]) - (b[:, 1] - a[:, 1]) * (c[:, 0] - a[:, 0])
+    corner_min = np.minimum(np.minimum(a, b), c)
+    corner_max = np.maximum(np.maximum(a, b), c)
+    x0, y0 = np.ceil(corner_min - 0.5).astype(np.int64).T
+    x1, y1 = np.minimum(np.floor(corner_max - 0.5), grid - 1).astype(np.int64).T
+    p = positions[triangles]
+    facing = np.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0]) @ view < 0
+    width = np.where(facing & (area != 0), np.maximum(x1 - x0 + 1, 0), 0)
+    count = width * np.maximum(y1 - y0 + 1, 0)
+    
+    out = ([], [], [])
+    ends = np.cumsum(count)
+    start = 0
+    while start < len(triangles):
+        # Batch triangles so the candidate pixels stay around OVERDRAW_CHUNK
+        base = ends[start - 1] if start else 0
+        stop = max(int(np.searchsorted(ends, base + OVERDRAW_CHUNK, side='right')), start + 1)
+        tri = np.repeat(np.arange(start, stop), count[start:stop])
+        local = np.arange(len(tri)) - np.repeat(ends[start:stop] - count[start:stop] - base, count[start:stop])
+        px = x0[tri] + local % width[tri]
+        py = y0[tri] + local // width[tri]
+        sx, sy = px + 0.5, py + 0.5
+        # Barycentric weights from edge functions, signed like the triangle
+        w0 = ((c[tri, 0] - b[tri, 0]) * (sy - b[tri, 1]) - (c[tri, 1] - b[tri, 1]) * (sx - b[tri, 0])) / area[tri]
+        w1 = ((a[tri, 0] - c[tri, 0]) * (sy - c[tri, 1]) - (a[tri, 1] - c[tri, 1]) * (sx - c[tri, 0])) / area[tri]
+        w2 = 1 - w0 - w1
+        inside = (w0 >= 0) & (w1 >= 0) & (w2 >= 0)
+        tri = tri[inside]
+        out[0].append(tri)
+        out[1].append(py[inside] * grid + px[inside])
+        out[2].append(w0[inside] * za[tri] + w1[inside] * zb[tri] + w2[inside] * zc[tri])
+        start = stop
+    return tuple(np.concatenate(parts) for parts in out)
+
+
+def overdraw_stats(fragments, order):
+    """(overdraw, out-of-order share) of drawing the triangles in `order`.
+    
+    `fragments` come from _rasterize and `order` lists triangle ids in draw
+    order. Overdraw is fragments passing a depth test per covered pixel
+    (front to back is cheapest); out of order is the share of fragments
+    drawn after a nearer one on the same pixel, i.e. blended wrongly or
+    depth-rejected (back to front avoids it).
+    """
+    tri, pixel, depth = fragments
+    if not len(tri):
+        return 1.0, 0.0
+    rank = np.empty(len(order), np.int64)
+    rank[order] = np.arange(len(order))
+    order = np.lexsort((rank[tri], pixel))
+    pixel, depth = pixel[order], depth[order]
+    
+    # Running minimum depth per pixel in one pass: later pixels are shifted below earlier ones
+    span = max(float(depth.max() - depth.min()), 1e-30)
+    shifted = (depth - depth.min()) / span - 2.0 * pixel
+    nearest = np.minimum.accumulate(shifted)
+    first = np.ones(len(pixel), bool)
+    first[1:] = pixel[1:] != pixel[:-1]
+    behind = np.zeros(len(pixel), bool)
+    behind[1:] = nearest[:-1] < shifted[1:] - 1e-9
+    behind &= ~first
+    covered = int(first.sum())
+    return (len(pixel) - int(behind.sum())) / covered, float(behind.mean())
+
+
+# Quadric LOD simplification
+LOD_BORDER_WEIGHT = 10.0     # weight of the planes that pin open edges in place
+LOD_MIN_NORMAL_COS = 0.25    # reject collapses that turn a triangle more than ~75 degrees
+LOD_FLIP_RETRIES = 3
+LOD_MATCH_ROUNDS = 4
+
+
+def simplify_mesh(vertices, indices, targets):
+    """Quadric-error edge collapse down to each triangle count in `targets`.
+    
+    Works in passes: every vertex picks its cheapest collapse onto a
+    neighbour, and all collapses whose cost is the lowest among the
+    triangles around them are applied at once, so a pass is a handful of
+    array operations instead of one heap update per edge. Vertices move
+    onto the neighbour they collapse into, so UVs and normals stay valid.
     
-    with open(filepath, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            parts = line.split()
-            cmd = parts[0]
+    Collapses are chosen between positions, not vertices: the copies of a
+    position split by a UV seam or hard edge all move together, each onto
+    the copy of the destination it shares an edge with, and a collapse
+    only goes ahead when every copy has one, so seams stay seams. Vertices
+    on non-manifold edges never move; open boundary vertices only slide
+    along the boundary. Targets must be descending; each level
+    continues from the previous one. Returns one (indices, max error) pair
+    per target, where the error is the RMS distance to the original
+    surface around the worst collapse.
+    """
+    vertices = np.asarray(vertices, np.float64).reshape(-1, 3)
+    triangles = np.asarray(indices, np.int64).reshape(-1, 3)
+    
+    # The collapse search runs on positions; seam copies of one position are one point there
+    # (adding 0 folds -0.0 into 0.0, which the byte-wise row keys would tell apart)
+    _, first, position_ids = np.unique(_row_keys(vertices + 0.0), return_index=True, return_inverse=True)
+    positions, position_ids = vertices[first], position_ids.reshape(-1)
+    n = len(positions)
+    quadrics, weights = _vertex_quadrics(positions, position_ids[triangles])
+    
+    results = []
+    error = 0.0
+    for target in targets:
+        while len(triangles) > target:
+            collapse = _select_collapses(positions, position_ids[triangles], quadrics, weights,
+                                         _followable_collapses(triangles, position_ids, n), len(triangles) - target)
+            if collapse is None:
+                break
+            sources, destinations, costs = collapse
+            np.add.at(quadrics, destinations, quadrics[sources])
+            np.add.at(weights, destinations, weights[sources])
             
-            try:
-                if cmd == 'v':
-                    vertices.append((float(parts[1]), float(parts[2]), float(parts[3])))
-                elif cmd == 'vn':
-                    normals.append((float(parts[1]), float(parts[2]), float(parts[3])))
-                elif cmd == 'vt':
-                    uvs.append((float(parts[1]), float(parts[2])))
-                elif cmd == 'f':
-                    face = []
-                    for part in parts[1:]:
-                        idx = int(part.split('/')[0]) - 1
-                        face.append(idx)
-                    faces.append(face)
-            except (ValueError, IndexError) as e:
-                print(f"⚠️  Warning: Line {line_num} malformed: {line[:50]}...")
-                continue
+            # Every copy of a source position moves onto a neighbouring copy of its destination
+            moved = np.full(n, -1)
+            moved[sources] = destinations
+            starts = triangles.reshape(-1)
+            ends = triangles[:, [1, 2, 0]].reshape(-1)
+            starts, ends = np.concatenate([starts, ends]), np.concatenate([ends, starts])
+            follow = moved[position_ids[starts]] == position_ids[ends]
+            copies, first = np.unique(starts[follow], return_index=True)
+            remap = np.arange(len(vertices))
+            remap[copies] = ends[follow][first]
+            triangles = remap[triangles]
+            
+            corners = position_ids[triangles]
+            keep = ((corners[:, 0] != corners[:, 1]) & (corners[:, 1] != corners[:, 2])
+                    & (corners[:, 2] != corners[:, 0]))
+            triangles = triangles[keep]
+            error = max(error, float(np.sqrt(max(costs.max(), 0.0))))
+        results.append((triangles.reshape(-1).astype(np.int32), error))
+    return results
+
+
+def _followable_collapses(triangles, position_ids, n):
+    """Keys (source * n + destination) of position collapses every copy of the source can follow.
     
-    print(f"   ✅ Loaded {len(vertices)} vertices, {len(normals)} normals, {len(uvs)} UVs, {len(faces)} faces")
-    return vertices, normals, uvs, faces
+    A copy follows when it shares an edge with a copy of the destination;
+    copies no triangle uses any more do not count.
+    """
+    starts = triangles.reshape(-1)
+    ends = triangles[:, [1, 2, 0]].reshape(-1)
+    starts, ends = np.concatenate([starts, ends]), np.concatenate([ends, starts])
+    
+    # Distinct (copy, destination position) pairs, then how many copies reach each destination
+    pairs = np.unique(starts * n + position_ids[ends])
+    copies, destinations = pairs // n, pairs % n
+    keys, reached = np.unique(position_ids[copies] * n + destinations, return_counts=True)
+    live = np.bincount(position_ids[np.unique(starts)], minlength=n)
+    return keys[reached == live[keys // n]]
 
 
-def triangulate_faces(faces):
-    """Convert polygons to triangles."""
-    triangles = []
-    for face in faces:
-        if len(face) == 3:
-            triangles.extend(face)
-        elif len(face) == 4:
-            triangles.extend([face[0], face[1], face[2], face[0], face[2], face[3]])
-        elif len(face) > 4:
-            for i in range(1, len(face) - 1):
-                triangles.extend([face[0], face[i], face[i + 1]])
-    return triangles
+def _row_keys(rows):
+    """One hashable void scalar per row, for np.unique over whole rows."""
+    rows = np.ascontiguousarray(rows)
+    return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel()
 
 
-def generate_normals(vertices, triangles):
-    """Generate normals from geometry."""
-    import math
-    normals = [(0.0, 0.0, 0.0) for _ in vertices]
-    counts = [0 for _ in vertices]
+def _vertex_quadrics(positions, triangles):
+    """Area-weighted plane quadrics per vertex plus open-edge penalty planes.
     
-    for i in range(0, len(triangles), 3):
-        i0, i1, i2 = triangles[i], triangles[i+1], triangles[i+2]
-        v0 = vertices[i0]
-        v1 = vertices[i1]
-        v2 = vertices[i2]
-        
-        # Cross product
-        ax, ay, az = v1[0]-v0[0], v1[1]-v0[1], v1[2]-v0[2]
-        bx, by, bz = v2[0]-v0[0], v2[1]-v0[1], v2[2]-v0[2]
-        nx, ny, nz = ay*bz-az*by, az*bx-ax*bz, ax*by-ay*bx
+    A quadric is stored as its 10 unique coefficients (a2 ab ac ad b2 bc bd
+    c2 cd d2); `weights` holds the summed area so costs can be normalized
+    to squared distances.
+    """
+    n = len(positions)
+    a, b, c = (positions[triangles[:, i]] for i in range(3))
+    normals = np.cross(b - a, c - a)
+    double_area = np.linalg.norm(normals, axis=1)
+    normals /= np.where(double_area > 0, double_area, 1)[:, None]
+    area = double_area / 2
+    
+    quadrics = np.zeros((n, 10))
+    weights = np.zeros(n)
+    plane_q = _plane_quadrics(normals, -(normals * a).sum(axis=1), area)
+    for i in range(3):
+        np.add.at(quadrics, triangles[:, i], plane_q)
+        np.add.at(weights, triangles[:, i], area)
+    
+    # Planes through each open edge, perpendicular to its triangle
+    starts = triangles.reshape(-1)
+    ends = triangles[:, [1, 2, 0]].reshape(-1)
+    border = _edge_counts(starts, ends, n) == 1
+    faces = np.repeat(np.arange(len(triangles)), 3)[border]
+    starts, ends = starts[border], ends[border]
+    edge = positions[ends] - positions[starts]
+    planes = np.cross(edge, normals[faces])
+    length = np.linalg.norm(planes, axis=1)
+    planes /= np.where(length > 0, length, 1)[:, None]
+    penalty = _plane_quadrics(planes, -(planes * positions[starts]).sum(axis=1),
+                              LOD_BORDER_WEIGHT * (edge * edge).sum(axis=1))
+    np.add.at(quadrics, starts, penalty)
+    np.add.at(quadrics, ends, penalty)
+    return quadrics, weights
+
+
+def _plane_quadrics(normals, d, weight):
+    """Weighted quadric coefficients of planes n.x + d = 0."""
+    x, y, z = normals[:, 0], normals[:, 1], normals[:, 2]
+    q = np.stack([x * x, x * y, x * z, x * d, y * y, y * z, y * d, z * z, z * d, d * d], axis=1)
+    return q * weight[:, None]
+
+
+def _quadric_cost(q, p):
+    """Evaluate quadrics `q` at points `p` (row by row)."""
+    x, y, z = p[:, 0], p[:, 1], p[:, 2]
+    return (q[:, 0] * x * x + 2 * q[:, 1] * x * y + 2 * q[:, 2] * x * z + 2 * q[:, 3] * x
+            + q[:, 4] * y * y + 2 * q[:, 5] * y * z + 2 * q[:, 6] * y
+            + q[:, 7] * z * z + 2 * q[:, 8] * z + q[:, 9])
+
+
+def _edge_counts(starts, ends, n):
+    """How many triangles share the undirected edge of each half-edge."""
+    keys = np.minimum(starts, ends) * n + np.maximum(starts, ends)
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    return counts[inverse.reshape(-1)]
+
+
+def _select_collapses(positions, triangles, quadrics, weights, followable, needed):
+    """Pick one pass of non-overlapping collapses; None when nothing can collapse.
+    
+    Only collapses in `followable` (sorted source * n + destination keys)
+    are considered.
+    """
+    n = len(positions)
+    starts = triangles.reshape(-1)
+    ends = triangles[:, [1, 2, 0]].reshape(-1)
+    edges, counts = np.unique(np.minimum(starts, ends) * n + np.maximum(starts, ends), return_counts=True)
+    first, second = edges // n, edges % n
+    
+    # Open-edge vertices may only slide along open edges; non-manifold ones stay put
+    fixed = np.zeros(n, bool)
+    fixed[first[counts > 2]] = True
+    fixed[second[counts > 2]] = True
+    border = np.zeros(n, bool)
+    border[first[counts == 1]] = True
+    border[second[counts == 1]] = True
+    
+    sources = np.concatenate([first, second])
+    destinations = np.concatenate([second, first])
+    along_border = np.concatenate([counts == 1, counts == 1])
+    allowed = ~fixed[sources] & (~border[sources] | along_border)
+    allowed &= np.isin(sources * n + destinations, followable, assume_unique=True)
+    sources, destinations = sources[allowed], destinations[allowed]
+    if not len(sources):
+        return None
+    # The destination does not move, so its own quadric only needs evaluating once per vertex
+    resting = _quadric_cost(quadrics, positions)
+    costs = ((_quadric_cost(quadrics[sources], positions[destinations]) + resting[destinations])
+             / np.maximum(weights[sources] + weights[destinations], 1e-30))
+    
+    # Cheapest collapse per source vertex, skipping ones that would flip a triangle
+    for _ in range(LOD_FLIP_RETRIES):
+        order = np.lexsort((costs, sources))
+        lowest = np.ones(len(order), bool)
+        lowest[1:] = sources[order[1:]] != sources[order[:-1]]
+        best = order[lowest & np.isfinite(costs[order])]
+        target = np.full(n, -1)
+        target[sources[best]] = destinations[best]
+        flipped = _flipped_sources(positions, triangles, target)
+        if not flipped.any():
+            break
+        costs[flipped[sources] & (destinations == target[sources])] = np.inf
+    else:
+        best = best[~flipped[sources[best]]]
+    if not len(best):
+        return None
+    
+    # Greedy matching over the cheapest candidates: a collapse goes ahead when
+    # it is the cheapest one left touching either of its endpoints
+    best = best[np.argsort(costs[best], kind='stable')][:needed]
+    rank = np.arange(len(best))
+    src, dst = sources[best], destinations[best]
+    free = np.ones(n, bool)
+    chosen = np.zeros(len(best), bool)
+    for _ in range(LOD_MATCH_ROUNDS):
+        live = ~chosen & free[src] & free[dst]
+        if not live.any():
+            break
+        cheapest = np.full(n, len(best))
+        np.minimum.at(cheapest, src[live], rank[live])
+        np.minimum.at(cheapest, dst[live], rank[live])
+        won = live & (cheapest[src] == rank) & (cheapest[dst] == rank)
+        chosen |= won
+        free[src[won]] = False
+        free[dst[won]] = False
+    chosen = best[chosen]
+    
+    # Stop once enough triangles are gone to reach the target
+    target = np.full(n, -1)
+    target[sources[chosen]] = destinations[chosen]
+    removed = np.zeros(n, np.int64)
+    for i in range(3):
+        corner_target = target[triangles[:, i]]
+        hit = (corner_target >= 0) & (triangles == corner_target[:, None]).any(axis=1)
+        np.add.at(removed, triangles[hit, i], 1)
+    total = np.cumsum(removed[sources[chosen]])
+    chosen = chosen[:np.searchsorted(total, needed) + 1]
+    return sources[chosen], destinations[chosen], costs[chosen]
+
+
+def _flipped_sources(positions, triangles, target):
+    """Mark source vertices whose collapse would fold one of their triangles over."""
+    flipped = np.zeros(len(positions), bool)
+    a, b, c = (positions[triangles[:, i]] for i in range(3))
+    before = np.cross(b - a, c - a)
+    for i in range(3):
+        corner_target = target[triangles[:, i]]
+        moving = (corner_target >= 0) & ~(triangles == corner_target[:, None]).any(axis=1)
+        if not moving.any():
+            continue
+        moved = [a[moving], b[moving], c[moving]]
+        moved[i] = positions[corner_target[moving]]
+        after = np.cross(moved[1] - moved[0], moved[2] - moved[0])
+        old = before[moving]
+        dot = (old * after).sum(axis=1)
+        bad = dot < LOD_MIN_NORMAL_COS * np.linalg.norm(old, axis=1) * np.linalg.norm(after, axis=1)
+        flipped[triangles[moving, i][bad]] = True
+    return flipped
+
+
+def _pack_stream(data, typecode, width=1):
+    """Pack rows of values into one contiguous little-endian buffer.
+    
+    Returns (buffer, element count). `typecode` is 'f' for float32 or 'i'
+    for int32.
+    """
+    if np is not None:
+        payload = np.ascontiguousarray(data, '<f4' if typecode == 'f' else '<i4').reshape(-1, width)
+        return payload, len(payload)
+    payload = array(typecode, chain.from_iterable(data) if width > 1 else data)
+    if sys.byteorder == 'big':
+        payload.byteswap()
+    return payload, len(payload) // width
+
+
+def write_stream(data, filepath, typecode, width=1):
+    """Write a KSP mesh stream: uint32 count header plus the packed payload.
+    
+    `data` is a sequence of `width`-tuples (or a flat sequence when width is
+    1). Everything is written little-endian, the layout
+    HairConfigs.LoadVector3Array and friends read, in two write calls.
+    Returns the element count stored in the header.
+    """
+    payload, count = _pack_stream(data, typecode, width)
+    with open(filepath, 'wb') as f:
+        f.write(struct.pack('<I', count))
+        f.write(payload)
+    return count
+
+
+def compute_bounds(vertices):
+    """Axis-aligned (min, max) corners of the vertex positions."""
+    if len(vertices) == 0:
+        return (0.0, 0.0, 0.0), (0.0, 0.0, 0.0)
+    if np is not None:
+        positions = np.asarray(vertices, np.float32).reshape(-1, 3)
+        return tuple(positions.min(axis=0).tolist()), tuple(positions.max(axis=0).tolist())
+    return tuple(min(v[i] for v in vertices) for i in range(3)), tuple(max(v[i] for v in vertices) for i in range(3))
+
+
+def write_krm(filepath, vertices, uvs, normals, indices, bounds=True, compact=None, tangents=None, sorted_indices=None):
+    """Write all streams of a mesh into one packed .krm container.
+    
+    See KRM_HEADER/KRM_STREAM for the layout. Every section starts on a
+    16-byte boundary so readers can map it straight into typed arrays.
+    `compact` picks a 16-bit attribute encoding (see encode_compact).
+    `tangents` (x, y, z, w rows) are stored as an optional TAN section and
+    `sorted_indices` (see sort_for_translucency) as an optional SRT one.
+    """
+    if tangents is None:
+        tangents = []
+    if sorted_indices is None:
+        sorted_indices = []
+    if compact:
+        packed, vertices = encode_compact(vertices, uvs, normals, indices, compact, tangents, sorted_indices)
+    else:
+        streams = [(KRM_TAG_POSITION, KRM_FLOAT32, 3, vertices)]
+        if len(uvs):
+            streams.append((KRM_TAG_UV, KRM_FLOAT32, 2, uvs))
+        if len(normals):
+            streams.append((KRM_TAG_NORMAL, KRM_FLOAT32, 3, normals))
+        if len(tangents):
+            streams.append((KRM_TAG_TANGENT, KRM_FLOAT32, 4, tangents))
+        if len(sorted_indices):
+            streams.append((KRM_TAG_SORTED, KRM_INT32, 1, sorted_indices))
+        streams.append((KRM_TAG_INDEX, KRM_INT32, 1, indices))
         
-        for idx in (i0, i1, i2):
-            normals[idx] = (normals[idx][0]+nx, normals[idx][1]+ny, normals[idx][2]+nz)
-            counts[idx] += 1
+        packed = []
+        for tag, fmt, width, data in streams:
+            payload, count = _pack_stream(data, 'f' if fmt == KRM_FLOAT32 else 'i', width)
+            packed.append((tag, fmt, width, count, payload, KRM_IDENTITY_DECODE))
     
-    # Average and normalize
-    result = []
-    for i, (n, c) in enumerate(zip(normals, counts)):
-        if c > 0:
-            x, y, z = n[0]/c, n[1]/c, n[2]/c
-            length = math.sqrt(x*x + y*y + z*z)
-            if length > 0:
-                result.append((x/length, y/length, z/length))
-            else:
-                result.append((0, 1, 0))
-        else:
-            result.append((0, 1, 0))
-    return result
+    table_end = KRM_HEADER.size + KRM_STREAM.size * len(packed)
+    offset = _align(table_end)
+    entries = []
+    for tag, fmt, width, count, payload, decode in packed:
+        size = memoryview(payload).nbytes
+        entries.append(KRM_STREAM.pack(tag, fmt, width, 0, count, offset, size, *decode))
+        offset = _align(offset + size)
+    
+    flags = 0
+    lo, hi = (0.0, 0.0, 0.0), (0.0, 0.0, 0.0)
+    if bounds:
+        flags |= KRM_FLAG_BOUNDS
+        lo, hi = compute_bounds(vertices)
+    header = KRM_HEADER.pack(KRM_MAGIC, KRM_VERSION, flags, len(packed),
+                             packed[0][3], packed[-1][3], 0, *lo, *hi)
+    
+    with open(filepath, 'wb') as f:
+        f.write(header)
+        f.write(b''.join(entries))
+        position = table_end
+        for payload in (p[4] for p in packed):
+            f.write(b'\0' * (_align(position) - position))
+            position = _align(position)
+            f.write(payload)
+            position += memoryview(payload).nbytes
+    
+    total = Path(filepath).stat().st_size
+    note = ''
+    if compact:
+        full = sum(count * width * 4 for _, _, width, count, _, _ in packed)
+        note = f", {100 * sum(memoryview(p[4]).nbytes for p in packed) // max(full, 1)}% of 32-bit"
+    print(f"   📦 Packed {len(packed)} streams -> {Path(filepath).name} ({total//1024}KB{note})")
+    return total
+
+
+def encode_compact(vertices, uvs, normals, indices, encoding='snorm16', tangents=(), sorted_indices=()):
+    """Quantize mesh streams to 16 bits for a compact .krm container.
+    
+    Positions are stored as snorm16 scaled to the mesh bounds, UVs, normals
+    and tangents with `encoding` ('snorm16' or 'float16'), and indices as uint16
+    when every vertex fits. Prints the error each encoding introduces.
+    Returns (packed streams for write_krm, decoded positions).
+    """
+    packed = []
+    
+    payload, fmt, decode, positions = quantize_stream(vertices, 3, 'snorm16')
+    packed.append((KRM_TAG_POSITION, fmt, 3, len(payload), payload, decode))
+    original = np.asarray(vertices, np.float32).reshape(-1, 3)
+    error = np.abs(positions - original).max() if len(original) else 0.0
+    extent = (original.max(axis=0) - original.min(axis=0)).max() if len(original) else 0.0
+    print(f"   🗜️  Positions snorm16: max error {error:.3g} ({100 * error / max(extent, 1e-30):.4f}% of extent)")
+    
+    if len(uvs):
+        payload, fmt, decode, decoded = quantize_stream(uvs, 2, encoding)
+        packed.append((KRM_TAG_UV, fmt, 2, len(payload), payload, decode))
+        error = np.abs(decoded - np.asarray(uvs, np.float32).reshape(-1, 2)).max()
+        print(f"   🗜️  UVs {encoding}: max error {error:.3g} ({error * 2048:.2f} texels at 2048px)")
+    
+    if len(normals):
+        original = np.asarray(normals, np.float32).reshape(-1, 3)
+        # Unit normals fit snorm16 directly; anything longer gets fitted like positions
+        fit = len(original) > 0 and np.abs(original).max() > 1
+        payload, fmt, decode, decoded = quantize_stream(normals, 3, encoding, fit)
+        packed.append((KRM_TAG_NORMAL, fmt, 3, len(payload), payload, decode))
+        print(f"   🗜️  Normals {encoding}: max error {_max_angle_error(original, decoded):.3g}°")
+    
+    if len(tangents):
+        # Unit xyz and a +-1 sign are already in snorm16 range
+        original = np.asarray(tangents, np.float32).reshape(-1, 4)
+        payload, fmt, decode, decoded = quantize_stream(original, 4, encoding, fit=False)
+        packed.append((KRM_TAG_TANGENT, fmt, 4, len(payload), payload, decode))
+        print(f"   🗜️  Tangents {encoding}: max error {_max_angle_error(original[:, :3], decoded[:, :3]):.3g}°")
+    
+    # Sorted orders use the same index width as the main one, just before it (IDX stays last)
+    fmt, dtype = (KRM_UINT16, '<u2') if len(positions) <= MAX_UNITY_VERTICES else (KRM_INT32, '<i4')
+    if len(sorted_indices):
+        payload = np.ascontiguousarray(sorted_indices, dtype)
+        packed.append((KRM_TAG_SORTED, fmt, 1, len(payload), payload, KRM_IDENTITY_DECODE))
+    
+    payload = np.ascontiguousarray(indices, dtype)
+    packed.append((KRM_TAG_INDEX, fmt, 1, len(payload), payload, KRM_IDENTITY_DECODE))
+    if fmt == KRM_UINT16:
+        print("   🗜️  Indices uint16: lossless")
+    else:
+        print(f"   ⚠️  Indices kept int32: {len(positions)} vertices do not fit uint16")
+    
+    return packed, positions
+
+
+def quantize_stream(values, width, encoding, fit=True):
+    """Encode float rows as 16-bit components.
+    
+    snorm16 maps each component's range onto -32767..32767 when `fit` is
+    set (offset/scale go into the stream's decode fields), otherwise it
+    stores values already in -1..1 as they are. float16 is a plain cast.
+    Returns (payload, format, decode, decoded values as readers see them).
+    """
+    values = np.asarray(values, np.float32).reshape(-1, width)
+    offset = np.zeros(4, np.float32)
+    scale = np.ones(4, np.float32)
+    
+    if encoding == 'float16':
+        payload = values.astype('<f2')
+        fmt = KRM_FLOAT16
+    else:
+        if fit and len(values):
+            lo = values.min(axis=0).astype(np.float64)
+            hi = values.max(axis=0).astype(np.float64)
+            offset[:width] = (lo + hi) / 2
+            span = (hi - lo) / 2
+            scale[:width] = np.where(span > 0, span, 1)
+        normalized = (values - offset[:width].astype(np.float64)) / scale[:width].astype(np.float64)
+        payload = np.clip(np.rint(normalized * 32767), -32767, 32767).astype('<i2')
+        fmt = KRM_SNORM16
+    
+    decode = tuple(offset.tolist() + scale.tolist())
+    return payload, fmt, decode, decode_stream(payload, fmt, decode)
+
+
+def decode_stream(stored, fmt, decode=KRM_IDENTITY_DECODE):
+    """Decode a .krm stream payload back to float32 (or integer indices).
+    
+    Mirrors PackedMesh.DecodeStream: offset + scale * value, with the math
+    done in float32 so the result matches what KSP loads.
+    """
+    if fmt in (KRM_INT32, KRM_UINT16):
+        return np.asarray(stored).astype(np.int32)
+    width = stored.shape[1] if stored.ndim > 1 else 1
+    offset = np.asarray(decode[:width], np.float32)
+    scale = np.asarray(decode[4:4 + width], np.float32)
+    if fmt == KRM_SNORM16:
+        values = np.maximum(stored.astype(np.float32) / np.float32(32767), np.float32(-1))
+    elif fmt in (KRM_FLOAT16, KRM_FLOAT32):
+        values = stored.astype(np.float32)
+    else:
+        raise ValueError(f"unknown .krm stream format {fmt}")
+    if fmt == KRM_FLOAT32 and decode == KRM_IDENTITY_DECODE:
+        return values
+    return (offset + scale * values).reshape(stored.shape)
+
+
+def _max_angle_error(original, decoded):
+    """Largest angle in degrees between matching original and decoded normals."""
+    lengths = np.linalg.norm(original, axis=1) * np.linalg.norm(decoded, axis=1)
+    valid = lengths > 0
+    if not valid.any():
+        return 0.0
+    cosines = (original[valid] * decoded[valid]).sum(axis=1, dtype=np.float64) / lengths[valid]
+    return float(np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0))).max())
+
+
+def _align(offset, alignment=16):
+    """Round `offset` up to the next multiple of `alignment`."""
+    return (offset + alignment - 1) // alignment * alignment
 
 
 def write_vector3_array(data, filepath, name):
     """Write Vector3 array to binary file."""
-    with open(filepath, 'wb') as f:
-        f.write(struct.pack('I', len(data)))
-        for v in data:
-            f.write(struct.pack('fff', v[0], v[1], v[2]))
-    print(f"   📝 {name}: {len(data)} entries -> {filepath.name} ({Path(filepath).stat().st_size//1024}KB)")
+    count = write_stream(data, filepath, 'f', 3)
+    print(f"   📝 {name}: {count} entries -> {Path(filepath).name} ({Path(filepath).stat().st_size//1024}KB)")
 
 
 def write_vector2_array(data, filepath, name):
     """Write Vector2 array to binary file."""
-    with open(filepath, 'wb') as f:
-        f.write(struct.pack('I', len(data)))
-        for v in data:
-            f.write(struct.pack('ff', v[0], v[1]))
-    print(f"   📝 {name}: {len(data)} entries -> {filepath.name} ({Path(filepath).stat().st_size//1024}KB)")
+    count = write_stream(data, filepath, 'f', 2)
+    print(f"   📝 {name}: {count} entries -> {Path(filepath).name} ({Path(filepath).stat().st_size//1024}KB)")
+
+
+def write_vector4_array(data, filepath, name):
+    """Write Vector4 array to binary file."""
+    count = write_stream(data, filepath, 'f', 4)
+    print(f"   📝 {name}: {count} entries -> {Path(filepath).name} ({Path(filepath).stat().st_size//1024}KB)")
 
 
 def write_int_array(data, filepath, name):
     """Write int array to binary file."""
-    with open(filepath, 'wb') as f:
-        f.write(struct.pack('I', len(data)))
-        for idx in data:
-            f.write(struct.pack('i', idx))
-    print(f"   📝 {name}: {len(data)//3} triangles -> {filepath.name} ({Path(filepath).stat().st_size//1024}KB)")
+    count = write_stream(data, filepath, 'i')
+    print(f"   📝 {name}: {count//3} triangles -> {Path(filepath).name} ({Path(filepath).stat().st_size//1024}KB)")
+
+
+def write_mesh(base_path, vertices, uvs, normals, indices, mesh_format='streams', compact=None, optimize_cache=False,
+               tangents=None, sort_views=False):
+    """Write one mesh as separate streams or a .krm next to `base_path`.
+    
+    `sort_views` reorders the triangles for translucent shaders and adds
+    the per-view back-to-front orders (see sort_for_translucency).
+    """
+    # Reorder triangles and vertices for the GPU vertex cache
+    if optimize_cache:
+        indices, order = optimize_vertex_order(indices, len(vertices))
+        vertices = gather_attribute(vertices, order, 3)
+        normals = gather_attribute(normals, order, 3)
+        if len(uvs):
+            uvs = gather_attribute(uvs, order, 2)
+        if tangents is not None:
+            tangents = gather_attribute(tangents, order, 4)
+    
+    # Whole clusters move, so most of the vertex cache order above survives
+    sorted_indices = None
+    if sort_views:
+        indices, views = sort_for_translucency(vertices, normals, indices, cache_ordered=optimize_cache)
+        sorted_indices = np.concatenate(list(views.values()))
+    
+    if mesh_format == 'krm':
+        write_krm(f"{base_path}.krm", vertices, uvs, normals, indices, compact=compact, tangents=tangents,
+                  sorted_indices=sorted_indices)
+    else:
+        write_vector3_array(vertices, f"{base_path}.vtx", "Vertices")
+        if len(uvs):
+            write_vector2_array(uvs, f"{base_path}.tex", "UVs")
+        write_vector3_array(normals, f"{base_path}.nml", "Normals")
+        if tangents is not None:
+            write_vector4_array(tangents, f"{base_path}.tan", "Tangents")
+        write_int_array(indices, f"{base_path}.idx", "Indices")
+        if sorted_indices is not None:
+            path = Path(f"{base_path}.srt")
+            write_stream(sorted_indices, path, 'i')
+            print(f"   📝 Sorted orders: {len(SORT_VIEWS)} views x {len(indices)//3} triangles -> {path.name} "
+                  f"({path.stat().st_size//1024}KB)")
+
+
+# Streaming conversion: working arrays stay around this many corners whatever the file size
+STREAM_CHUNK_CORNERS = 3 * 2 ** 19
+STREAM_BUCKET_CORNERS = 2 ** 20
 
 
-def convert_mesh(input_path, output_name=None, output_dir=None):
-    """Convert OBJ to KSP mesh format."""
+def convert_obj_streaming(input_path, base_path, normal_weighting='area'):
+    """Convert an OBJ to .vtx/.tex/.nml/.idx streams in bounded memory.
+
+    The OBJ is read block by block into spill files next to the output:
+    positions, UVs, normals and fan-triangulated face corners. Corners are
+    then split by position index into buckets small enough to weld with
+    np.unique, and each bucket's vertices are appended to the output
+    streams as it is done; the count headers are patched at the end. The
+    welded ids go through a second set of buckets split by corner position
+    so the index stream is written front to back as well. Output vertices
+    are numbered in position order rather than first use.
+    Raises ValueError for meshes the in-memory path would also reject.
+    Returns (vertex count, triangle count).
+    """
+    base_path = Path(base_path)
+    with tempfile.TemporaryDirectory(prefix='.kr_spill_', dir=base_path.parent) as spill_dir:
+        spill_dir = Path(spill_dir)
+        counts, missing = _spill_obj(input_path, spill_dir)
+        n_vertices, n_uvs, n_normals, n_corners = counts
+        print(f"   ✅ Spilled {n_vertices} vertices, {n_normals} normals, {n_uvs} UVs, {n_corners//3} triangles")
+        if n_vertices == 0:
+            raise ValueError("No vertices found!")
+        
+        # One pass over the corners: check them, bucket them and accumulate normals
+        generate = n_normals == 0 or missing[1]
+        if generate:
+            with open(spill_dir / 'nsum.bin', 'wb') as f:
+                f.truncate(n_vertices * 3 * 8)
+        n_buckets = max(-(-n_corners // STREAM_BUCKET_CORNERS), 1)
+        corner_record = np.dtype([('corner', '<i4', 3), ('position', '<i8')])
+        for start in range(0, n_corners, STREAM_CHUNK_CORNERS):
+            chunk = _read_rows(spill_dir / 'f.bin', start, STREAM_CHUNK_CORNERS, 3, '<i4')
+            error = check_corner_indices(chunk, n_vertices, n_uvs, n_normals)
+            if error:
+                raise ValueError(error)
+            if generate:
+                _accumulate_normals(spill_dir, n_vertices, chunk[:, 0], normal_weighting)
+            
+            rows = np.empty(len(chunk), corner_record)
+            rows['corner'] = chunk
+            rows['position'] = np.arange(start, start + len(chunk))
+            _append_buckets(spill_dir, 'bucket', rows, chunk[:, 0].astype(np.int64) * n_buckets // n_vertices, n_buckets)
+        
+        if generate:
+            print("   🔄 Generated normals")
+            with open(spill_dir / 'smooth.bin', 'wb') as f:
+                for start in range(0, n_vertices, STREAM_CHUNK_CORNERS):
+                    f.write(_normalize_rows(_read_rows(spill_dir / 'nsum.bin', start, STREAM_CHUNK_CORNERS, 3, '<f8')))
+        
+        # Weld bucket by bucket; ids are handed out in bucket (= position) order
+        streams = [Path(f"{base_path}.vtx"), Path(f"{base_path}.nml")]
+        if n_uvs:
+            streams.append(Path(f"{base_path}.tex"))
+        outputs = [open(path, 'wb') for path in streams]
+        id_record = np.dtype([('position', '<i8'), ('id', '<i4')])
+        welded = 0
+        try:
+            for f in outputs:
+                f.write(struct.pack('<I', 0))
+            for b in range(n_buckets):
+                bucket = spill_dir / f"bucket{b}.bin"
+                if not bucket.exists():
+                    continue
+                rows = np.fromfile(bucket, corner_record)
+                _, first, inverse = np.unique(_corner_keys(rows['corner']), return_index=True, return_inverse=True)
+                unique = rows['corner'][first]
+                ids = np.empty(len(rows), id_record)
+                ids['position'] = rows['position']
+                ids['id'] = welded + inverse.reshape(-1)
+                _append_buckets(spill_dir, 'ids', ids, ids['position'] * n_buckets // n_corners, n_buckets)
+                
+                # This bucket's positions are one contiguous slice of the spill
+                lowest = -(-b * n_vertices // n_buckets)
+                local = unique[:, 0] - lowest
+                span = int(local.max()) + 1
+                outputs[0].write(_read_rows(spill_dir / 'v.bin', lowest, span, 3)[local])
+                if generate:
+                    outputs[1].write(_read_rows(spill_dir / 'smooth.bin', lowest, span, 3)[local])
+                else:
+                    outputs[1].write(gather_attribute(_open_spill(spill_dir / 'vn.bin', n_normals, 3), unique[:, 2], 3))
+                if n_uvs:
+                    outputs[2].write(gather_attribute(_open_spill(spill_dir / 'vt.bin', n_uvs, 2), unique[:, 1], 2))
+                welded += len(unique)
+            
+            # Counts are only known now; patch them into the headers
+            for f in outputs:
+                f.seek(0)
+                f.write(struct.pack('<I', welded))
+        finally:
+            for f in outputs:
+                f.close()
+        
+        idx_path = Path(f"{base_path}.idx")
+        streams.append(idx_path)
+        with open(idx_path, 'wb') as f:
+            f.write(struct.pack('<I', n_corners))
+            for p in range(n_buckets if n_corners else 0):
+                ids = np.fromfile(spill_dir / f"ids{p}.bin", id_record)
+                lowest = -(-p * n_corners // n_buckets)
+                indices = np.empty(len(ids), '<i4')
+                indices[ids['position'] - lowest] = ids['id']
+                f.write(indices)
+    
+    print(f"   🔗 Welded {n_corners} corners into {welded} vertices")
+    for path in streams:
+        print(f"   📝 {path.name} ({path.stat().st_size//1024}KB)")
+    return welded, n_corners // 3
+
+
+def _spill_obj(filepath, spill_dir):
+    """Parse an OBJ block by block into raw float32/int32 spill files.
+
+    Faces are fan-triangulated on the way, so f.bin holds triangle corners.
+    Returns ((vertex, UV, normal, corner) counts, (any corner without a UV,
+    any corner without a normal)).
+    """
+    kinds = ('v', 'vt', 'vn', 'f')
+    files = {kind: open(spill_dir / f"{kind}.bin", 'wb') for kind in kinds}
+    counts = dict.fromkeys(kinds, 0)
+    missing = [False, False]
+    line_num = 1
+    try:
+        with open(filepath, 'rb') as f:
+            for block in _read_obj_blocks(f):
+                records = {kind: [] for kind in OBJ_RECORDS}
+                if not _parse_obj_block(block, records):
+                    records = _parse_obj_block_python(block, line_num)
+                line_num += block.count(b'\n')
+
+                for kind in ('v', 'vt', 'vn'):
+                    for rows in records[kind]:
+                        files[kind].write(np.ascontiguousarray(rows, '<f4'))
+                        counts[kind] += len(rows)
+                for corners, arity in records['f']:
+                    triangles = triangulate_faces(FaceArrays.from_counts(corners, arity))
+                    files['f'].write(np.ascontiguousarray(triangles, '<i4'))
+                    counts['f'] += len(triangles)
+                    missing[0] |= bool((triangles[:, 1] < 0).any())
+                    missing[1] |= bool((triangles[:, 2] < 0).any())
+    finally:
+        for f in files.values():
+            f.close()
+    return tuple(counts[kind] for kind in kinds), tuple(missing)
+
+
+def _parse_obj_block_python(block, first_line):
+    """Line-by-line parse of one block into the records _parse_obj_block builds."""
+    vertices, normals, uvs, faces = _parse_obj_lines(block.decode('utf-8', 'replace').splitlines(), first_line)
+    corners = [c for face in faces for c in face]
+    return {
+        'v': [np.array(vertices, np.float32).reshape(-1, 3)],
+        'vt': [np.array(uvs, np.float32).reshape(-1, 2)],
+        'vn': [np.array(normals, np.float32).reshape(-1, 3)],
+        'f': [(np.array(corners, np.int32).reshape(-1, 3), np.array([len(face) for face in faces], np.int64))],
+    }
+
+
+def _open_spill(path, rows, width, dtype='<f4'):
+    """Map a spill file read-only as a (rows, width) array.
+    
+    Maps are opened per use and dropped again, so random reads do not keep
+    the whole file resident.
+    """
+    if rows == 0:
+        return np.zeros((0, width), dtype)
+    return np.memmap(path, dtype, 'r', shape=(rows, width))
+
+
+def _read_rows(path, start, count, width, dtype='<f4'):
+    """Read up to `count` rows of a spill file starting at row `start`."""
+    itemsize = np.dtype(dtype).itemsize * width
+    return np.fromfile(path, dtype, count * width, offset=start * itemsize).reshape(-1, width)
+
+
+def _append_buckets(spill_dir, prefix, rows, bucket_ids, n_buckets):
+    """Append each row to spill file `<prefix><bucket id>.bin`."""
+    order = np.argsort(bucket_ids, kind='stable')
+    ends = np.cumsum(np.bincount(bucket_ids, minlength=n_buckets))
+    for b, part in enumerate(np.split(rows[order], ends[:-1])):
+        if len(part):
+            with open(spill_dir / f"{prefix}{b}.bin", 'ab') as f:
+                f.write(part)
+
+
+def _accumulate_normals(spill_dir, n_vertices, vertex_ids, weighting):
+    """Add the face normals of one chunk of triangle corners onto nsum.bin."""
+    ids = np.asarray(vertex_ids, np.int64)
+    positions = _open_spill(spill_dir / 'v.bin', n_vertices, 3)
+    p0, p1, p2 = (positions[ids[i::3]].astype(np.float64) for i in range(3))
+    del positions
+    face = np.cross(p1 - p0, p2 - p0)
+    if weighting != 'area':
+        face = _normalize_rows(face, '<f8', default=(0, 0, 0))
+    if weighting == 'angle':
+        weights = np.stack([_corner_angles(p0, p1, p2), _corner_angles(p1, p2, p0), _corner_angles(p2, p0, p1)], axis=1)
+        contributions = (face[:, None, :] * weights[:, :, None]).reshape(-1, 3)
+    else:
+        contributions = np.repeat(face, 3, axis=0)
+    
+    # Sum per vertex within the chunk, then one read-modify-write per touched vertex
+    order = np.argsort(ids, kind='stable')
+    touched, first = np.unique(ids[order], return_index=True)
+    sums = np.memmap(spill_dir / 'nsum.bin', '<f8', 'r+', shape=(n_vertices, 3))
+    sums[touched] += np.add.reduceat(contributions[order], first, axis=0)
+    sums.flush()
+
+
+def _normalize_rows(rows, dtype='<f4', default=(0, 1, 0)):
+    """Unit-length copies of 3D rows; zero-length rows become `default`."""
+    rows = np.asarray(rows, np.float64)
+    length = np.linalg.norm(rows, axis=1)
+    result = np.empty(rows.shape, dtype)
+    result[:] = default
+    valid = length > 0
+    result[valid] = rows[valid] / length[valid, None]
+    return result
+
+
+# Parsed mesh cache: parse + triangulate + weld results, one .npz per input
+MESH_CACHE_VERSION = 2       # bump whenever parsing, triangulation or welding output changes
+MESH_CACHE_SIZE_MB = 1024
+MESH_CACHE_ARRAYS = ('vertices', 'uvs', 'normals', 'corners', 'welded', 'triangles', 'triangle_parts', 'part_names')
+
+
+def mesh_cache_dir():
+    """Per-user cache directory: $KR_MESH_CACHE, else the platform's cache folder."""
+    override = os.environ.get('KR_MESH_CACHE')
+    if override:
+        return Path(override)
+    if sys.platform == 'win32':
+        base = Path(os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local')
+    elif sys.platform == 'darwin':
+        base = Path.home() / 'Library' / 'Caches'
+    else:
+        base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    return base / 'KerbalRedux' / 'meshes'
+
+
+def mesh_cache_key(input_path):
+    """Hash of the input's bytes, its format and MESH_CACHE_VERSION."""
+    input_path = Path(input_path)
+    digest = hashlib.sha256(f"{MESH_CACHE_VERSION}:{input_path.suffix.lower()}:".encode())
+    with open(input_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_cached_mesh(cache_dir, key):
+    """Return the cached MESH_CACHE_ARRAYS for `key`, or None on a miss.
+
+    A hit bumps the entry's mtime, which is what LRU eviction orders by.
+    Unreadable entries are deleted and treated as a miss.
+    """
+    path = Path(cache_dir) / f"{key}.npz"
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            arrays = tuple(data[name] for name in MESH_CACHE_ARRAYS)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+        print(f"   ⚠️  Discarding unreadable cache entry {path.name}: {e}")
+        with contextlib.suppress(OSError):
+            path.unlink()
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return arrays
+
+
+def store_cached_mesh(cache_dir, key, arrays, size_mb=MESH_CACHE_SIZE_MB):
+    """Save `arrays` (MESH_CACHE_ARRAYS order) under `key`, then evict down to `size_mb`.
+
+    Entries are written to a temporary file and renamed into place, so
+    parallel converters never read a partial entry. Failures only warn.
+    """
+    cache_dir = Path(cache_dir)
+    limit = size_mb * 1024 * 1024
+    if sum(np.asarray(a).nbytes for a in arrays) > limit:
+        print(f"   ℹ️  Mesh is larger than the {size_mb:g} MB cache; not cached")
+        return
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{key}.", suffix='.part', dir=cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **dict(zip(MESH_CACHE_ARRAYS, arrays)))
+            os.replace(tmp, cache_dir / f"{key}.npz")
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        evict_mesh_cache(cache_dir, limit)
+    except OSError as e:
+        print(f"   ⚠️  Could not write mesh cache in {cache_dir}: {e}")
+
+
+def evict_mesh_cache(cache_dir, limit):
+    """Delete least recently used entries until the cache holds at most `limit` bytes."""
+    entries = []
+    for path in Path(cache_dir).glob('*.npz'):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue    # evicted by another converter meanwhile
+        entries.append((st.st_mtime_ns, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+        total -= size
+
+
+def parse_and_weld(input_path):
+    """Load, triangulate and weld a mesh file.
+
+    Returns the MESH_CACHE_ARRAYS tuple: source vertices, uvs and normals,
+    the (v, vt, vn) triangle corners, the welded output vertices, the
+    triangle indices into them, and for OBJs with several parts the part
+    id of every triangle and the part names (both empty otherwise). Raises
+    ValueError for unreadable input.
+    """
+    try:
+        vertices, normals, uvs, faces = load_mesh(input_path)
+    except (ValueError, KeyError, IndexError, struct.error) as e:
+        raise ValueError(f"Cannot read {Path(input_path).name}: {e}") from e
+    
+    if len(vertices) == 0:
+        raise ValueError("No vertices found!")
+    
+    # Triangulate
+    corners = triangulate_faces(faces)
+    print(f"   📐 Triangulated to {len(corners)//3} triangles")
+    
+    error = check_corner_indices(corners, len(vertices), len(uvs), len(normals))
+    if error:
+        raise ValueError(error)
+    
+    # Weld (v, vt, vn) triplets into output vertices
+    if getattr(faces, 'shared_index', False):
+        # Indexed inputs already use one index for every attribute
+        welded = FaceArrays.from_indices(np.arange(len(vertices)), len(uvs) > 0, len(normals) > 0).corners
+        triangles = np.ascontiguousarray(corners[:, 0])
+        print(f"   🔗 Indexed input: {len(welded)} vertices shared by {len(corners)} corners")
+    else:
+        welded, triangles = weld_vertices(corners)
+        print(f"   🔗 Welded {len(corners)} corners into {len(welded)} vertices")
+    
+    triangle_parts, part_names = [], []
+    if getattr(faces, 'parts', None) is not None:
+        triangle_parts = np.repeat(faces.parts, np.maximum(faces.arities() - 2, 0))
+        part_names = obj_part_names(faces.part_keys)
+    return vertices, uvs, normals, corners, welded, triangles, triangle_parts, part_names
+
+
+def obj_part_names(keys):
+    """File-name-safe, unique names for (object, group, material) part keys.
+    
+    Uses the fewest of the three names that still tell the parts apart,
+    e.g. just the object names for a Blender export with one material per
+    object; falls back to part1, part2, ...
+    """
+    for fields in ((0,), (1,), (2,), (0, 1), (0, 2), (1, 2), (0, 1, 2)):
+        # Faces before any o/g/usemtl belong to OBJ's "default" group
+        names = ['_'.join(key[i] for i in fields if key[i]) or 'default' for key in keys]
+        names = [''.join(c if c.isalnum() or c in '-_' else '_' for c in name) for name in names]
+        if len(set(names)) == len(names):
+            return names
+    return [f"part{i}" for i in range(1, len(keys) + 1)]
+
+
+def convert_mesh(input_path, output_name=None, output_dir=None, normal_weighting='area', mesh_format='streams',
+                 compact=None, optimize_cache=False, lods=None, stream=False, cache=True,
+                 cache_size=MESH_CACHE_SIZE_MB, tangents=False, sort_views=False, clean=None, split=False):
+    """Convert OBJ (or GLB/glTF, binary PLY, binary STL) to KSP mesh format.
+    
+    `lods` is a list of triangle percentages (e.g. [50, 25]); each one is
+    written as `<name>_LOD1`, `<name>_LOD2`, ... next to the full mesh.
+    `stream` converts in bounded memory (see convert_obj_streaming).
+    `cache` reuses parsed arrays from mesh_cache_dir() (capped at
+    `cache_size` MB) when the same input was converted before.
+    `tangents` also writes per-vertex tangents for normal-mapped shaders.
+    `sort_views` orders triangles for translucent shaders (write_mesh).
+    `clean` is a weld epsilon for clean_mesh, or None to skip cleaning.
+    `split` writes every o/g/usemtl part of an OBJ as `<name>_<part>`,
+    from a single parse.
+    """
     input_path = Path(input_path)
     
     if not input_path.exists():
         print(f"❌ Error: File not found: {input_path}")
         return False
     
+    # Quantized streams only exist inside the .krm container
+    if compact:
+        if np is None:
+            print("❌ Error: Compact encoding needs NumPy (pip install numpy)")
+            return False
+        mesh_format = 'krm'
+    
+    if lods:
+        if np is None:
+            print("❌ Error: LOD generation needs NumPy (pip install numpy)")
+            return False
+        lods = sorted(lods, reverse=True)
+    
+    if tangents and np is None:
+        print("❌ Error: Tangent generation needs NumPy (pip install numpy)")
+        return False
+    
+    if sort_views and np is None:
+        print("❌ Error: Translucency sorting needs NumPy (pip install numpy)")
+        return False
+    
+    if clean is not None and np is None:
+        print("❌ Error: Mesh cleaning needs NumPy (pip install numpy)")
+        return False
+    
+    if split and np is None:
+        print("❌ Error: Splitting into parts needs NumPy (pip install numpy)")
+        return False
+    
+    # Binary inputs are memory-mapped already; only OBJ text needs the streaming path
+    if stream and input_path.suffix.lower() != '.obj':
+        print(f"   ℹ️  --stream only applies to OBJ input; reading {input_path.suffix} directly")
+        stream = False
+    
+    # Streaming writes plain streams only; everything else needs the whole mesh at once
+    if stream:
+        if np is None:
+            print("❌ Error: Streaming conversion needs NumPy (pip install numpy)")
+            return False
+        if mesh_format != 'streams' or lods or optimize_cache or tangents or sort_views or clean is not None or split:
+            print("❌ Error: --stream only writes .vtx/.tex/.nml/.idx streams (no --format krm, --compact, --lod, "
+                  "--optimize-cache, --tangents, --sort-views, --clean or --split)")
+            return False
+    
+    # Written anyway (e.g. for a plugin built locally), but the shipped DLL would skip the mesh
+    if mesh_format == 'krm' and plugin_supports('krm') is False:
+        print(f"   ⚠️  The {PLUGIN_DLL} shipped with this converter cannot load .krm files; KSP skips this mesh "
+              f"until the plugin is rebuilt from src/ (dotnet build src/KerbalRedux.csproj). "
+              f"Leave out --format krm/--compact to write .vtx/.tex/.nml/.idx instead.")
+    elif tangents and plugin_supports('tan') is False:
+        print(f"   ⚠️  The {PLUGIN_DLL} shipped with this converter does not read .tan files; KSP ignores them "
+              f"until the plugin is rebuilt from src/ (dotnet build src/KerbalRedux.csproj).")
+    
     # Determine output name
     if output_name is None:
         output_name = input_path.stem
@@ -165,46 +2700,302 @@ def convert_mesh(input_path, output_name=None, output_dir=None):
     
     print(f"\n🔄 Converting {input_path.name}...")
     print("=" * 50)
+    base_path = output_dir / output_name
     
-    # Parse OBJ
-    vertices, normals, uvs, faces = parse_obj(input_path)
+    if stream:
+        try:
+            convert_obj_streaming(input_path, base_path, normal_weighting)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            return False
+        _print_outputs(output_dir, [base_path])
+        return True
     
-    if not vertices:
-        print("❌ Error: No vertices found!")
-        return False
+    # Parse OBJ (or a binary format), unless an earlier run already did
+    cache_key = mesh_cache_key(input_path) if cache and np is not None else None
+    cached = load_cached_mesh(mesh_cache_dir(), cache_key) if cache_key else None
+    if cached:
+        vertices, uvs, normals, corners, welded, triangles, triangle_parts, part_names = cached
+        print(f"   ⚡ Cached parse: {len(triangles)//3} triangles, {len(welded)} vertices")
+    else:
+        try:
+            parsed = parse_and_weld(input_path)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            return False
+        if cache_key:
+            store_cached_mesh(mesh_cache_dir(), cache_key, parsed, cache_size)
+        vertices, uvs, normals, corners, welded, triangles, triangle_parts, part_names = parsed
     
-    # Triangulate
-    triangles = triangulate_faces(faces)
-    print(f"   📐 Triangulated to {len(triangles)//3} triangles")
+    vertex_ids, uv_ids, normal_ids = (_column(welded, i) for i in range(3))
     
     # Generate normals if missing
-    if not normals:
+    if len(normals) == 0 or _has_missing(normal_ids):
         print("   🔄 Generating normals...")
-        normals = generate_normals(vertices, triangles)
+        smooth = generate_normals(vertices, _column(corners, 0), normal_weighting)
+        out_normals = gather_attribute(smooth, vertex_ids, 3)
+    else:
+        out_normals = gather_attribute(normals, normal_ids, 3)
     
     # Write output files
-    base_path = output_dir / output_name
+    out_vertices = gather_attribute(vertices, vertex_ids, 3)
+    out_uvs = gather_attribute(uvs, uv_ids, 2) if len(uvs) else []
     
-    write_vector3_array(vertices, f"{base_path}.vtx", "Vertices")
+    if not len(uvs):
+        print("   ⚠️  Warning: No UV coordinates")
     
-    if uvs:
-        write_vector2_array(uvs, f"{base_path}.tex", "UVs")
+    # One mesh set per OBJ part, each with its own vertex numbering
+    if split and len(part_names):
+        outputs = []
+        triangles = np.asarray(triangles).reshape(-1, 3)
+        for part, name in enumerate(part_names):
+            used, local = np.unique(triangles[triangle_parts == part], return_inverse=True)
+            print(f"\n   🧩 Part {name}: {local.size//3} triangles, {len(used)} vertices")
+            outputs += _write_mesh_set(output_dir / f"{output_name}_{name}", out_vertices[used],
+                                       out_uvs[used] if len(out_uvs) else [], out_normals[used],
+                                       local.reshape(-1).astype(np.int32), mesh_format, compact, optimize_cache,
+                                       lods, tangents, sort_views, clean)
     else:
-        print("   ⚠️  Warning: No UV coordinates")
+        if split:
+            print("   ℹ️  No o/g/usemtl parts to split; writing one mesh")
+        outputs = _write_mesh_set(base_path, out_vertices, out_uvs, out_normals, triangles, mesh_format, compact,
+                                  optimize_cache, lods, tangents, sort_views, clean)
+    
+    _print_outputs(output_dir, outputs)
+    return True
+
+
+def _write_mesh_set(base_path, vertices, uvs, normals, triangles, mesh_format, compact, optimize_cache, lods,
+                    tangents, sort_views, clean):
+    """Clean, add tangents to and write one mesh plus its LOD chain (see convert_mesh).
     
-    write_vector3_array(normals, f"{base_path}.nml", "Normals")
-    write_int_array(triangles, f"{base_path}.idx", "Indices")
+    Returns the base path of every mesh written.
+    """
+    if clean is not None:
+        vertices, uvs, normals, triangles = clean_mesh(vertices, uvs, normals, triangles, clean)
     
+    # Tangents for bumped shaders, so KSP does not have to derive them
+    out_tangents = None
+    if tangents and not len(uvs):
+        print("   ⚠️  Warning: No UV coordinates to derive tangents from; skipping .tan")
+    elif tangents:
+        print("   🧭 Generating tangents...")
+        out_tangents = generate_tangents(vertices, uvs, normals, triangles)
+    
+    if len(vertices) > MAX_UNITY_VERTICES:
+        print(f"   ⚠️  {len(vertices)} vertices exceeds Unity's 16-bit index limit ({MAX_UNITY_VERTICES}); "
+              f"KSP will not load it, decimate or --split the mesh")
+    write_mesh(base_path, vertices, uvs, normals, triangles, mesh_format, compact, optimize_cache,
+               out_tangents, sort_views)
+    outputs = [base_path]
+    
+    # LOD chain, each level simplified further from the one before
+    if lods:
+        n_triangles = len(triangles) // 3
+        print(f"   🪜 Simplifying to {', '.join(f'{p:g}%' for p in lods)} of {n_triangles} triangles...")
+        levels = simplify_mesh(vertices, triangles, [int(n_triangles * p / 100) for p in lods])
+        extent = float((vertices.max(axis=0) - vertices.min(axis=0)).max())
+        for level, (lod_indices, lod_error) in enumerate(levels, 1):
+            used, lod_indices = np.unique(lod_indices, return_inverse=True)
+            print(f"   🪜 LOD{level}: {len(lod_indices)//3} triangles ({100 * len(lod_indices) / max(len(triangles), 1):.1f}%), "
+                  f"{len(used)} vertices, max error {lod_error:.3g} ({100 * lod_error / max(extent, 1e-30):.3f}% of extent)")
+            lod_path = base_path.parent / f"{base_path.name}_LOD{level}"
+            write_mesh(lod_path, vertices[used], uvs[used] if len(uvs) else [], normals[used],
+                       lod_indices.astype(np.int32), mesh_format, compact, optimize_cache,
+                       out_tangents[used] if out_tangents is not None else None, sort_views)
+            outputs.append(lod_path)
+    return outputs
+
+
+def _print_outputs(output_dir, outputs):
+    """Print the completion banner and every mesh file written for `outputs`."""
     print("=" * 50)
     print(f"✅ Conversion complete! Files written to {output_dir}/")
     print(f"\n   Output files:")
-    for ext in ['.vtx', '.tex', '.nml', '.idx']:
-        f = base_path.parent / (base_path.name + ext)
-        if f.exists():
-            size = f.stat().st_size
-            print(f"      • {f.name:<20} ({size:>6} bytes)")
+    for path in outputs:
+        for ext in MESH_EXTENSIONS:
+            f = path.parent / (path.name + ext)
+            if f.exists():
+                size = f.stat().st_size
+                print(f"      • {f.name:<20} ({size:>6} bytes)")
+
+
+# Batch conversion manifest, kept in the output directory
+MANIFEST_NAME = '.kr_manifest.json'
+MANIFEST_VERSION = 1
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def convert_directory(input_dir, output_dir=None, jobs=None, force=False, **options):
+    """Convert every mesh file (MESH_INPUT_EXTENSIONS) under `input_dir` across a process pool.
+
+    Outputs mirror the input tree under `output_dir` (default: next to each
+    input). A manifest records each input's hash, the options and converter
+    version used, and the hash of every file written, so later runs skip
+    meshes whose input, options and outputs are all unchanged (`force`
+    converts everything). `options` are passed on to convert_mesh; the
+    parse cache settings are not part of the manifest key. Inputs in one
+    folder that differ only in extension (hair.obj, hair.glb) would write
+    the same outputs, so they are reported as failed and not converted.
+    Returns True if every mesh converted or was already up to date.
+    """
+    input_dir = Path(input_dir)
+    output_dir = Path(output_dir) if output_dir is not None else input_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    inputs = sorted(p for p in input_dir.rglob('*')
+                    if p.suffix.lower() in MESH_INPUT_EXTENSIONS and p.is_file()
+                    and not any(part.startswith('.') for part in p.relative_to(input_dir).parts))
+    if not inputs:
+        print(f"📭 No mesh files ({', '.join(MESH_INPUT_EXTENSIONS)}) found in {input_dir}")
+        return True
+
+    manifest_path = output_dir / MANIFEST_NAME
+    manifest = _load_manifest(manifest_path)
+    cache_options = {k: options.pop(k) for k in ('cache', 'cache_size') if k in options}
+    options = dict(options, converter=_hash_file(__file__))
+
+    print(f"\n🔄 Converting {len(inputs)} mesh files from {input_dir}/ with {jobs or os.cpu_count()} workers...")
+    print("=" * 50)
+
+    counts = {'converted': 0, 'skipped': 0, 'failed': 0}
     
-    return True
+    # Outputs are named after the stem; compare case-insensitively for Windows installs
+    by_output = {}
+    for obj_path in inputs:
+        by_output.setdefault((obj_path.parent, obj_path.stem.casefold()), []).append(obj_path)
+    for clash in (group for group in by_output.values() if len(group) > 1):
+        counts['failed'] += len(clash)
+        names = ', '.join(p.relative_to(input_dir).as_posix() for p in clash)
+        print(f"   ❌ {names}: would overwrite each other's {clash[0].stem}.* outputs; rename all but one")
+    inputs = [p for p in inputs if len(by_output[p.parent, p.stem.casefold()]) == 1]
+    converted_bytes = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(jobs) as pool:
+        futures = {}
+        for obj_path in inputs:
+            rel = obj_path.relative_to(input_dir).as_posix()
+            target_dir = output_dir / obj_path.parent.relative_to(input_dir)
+            previous = None if force else manifest['entries'].get(rel)
+            futures[pool.submit(_convert_job, str(obj_path), str(target_dir), options, previous,
+                              cache_options)] = rel
+
+        for future in as_completed(futures):
+            rel = futures[future]
+            try:
+                status, entry, log, seconds = future.result()
+            except Exception as e:
+                status, entry, log, seconds = 'failed', None, f"   {type(e).__name__}: {e}\n", 0.0
+            counts[status] += 1
+            if status == 'skipped':
+                print(f"   ⏭️  {rel}: unchanged")
+            elif status == 'converted':
+                converted_bytes += entry['input_size']
+                manifest['entries'][rel] = entry
+                print(f"   ✅ {rel}: {len(entry['outputs'])} files in {seconds:.2f}s")
+            else:
+                manifest['entries'].pop(rel, None)
+                print(f"   ❌ {rel}: conversion failed")
+                print(log.rstrip())
+
+    # Forget inputs that no longer exist; their outputs are left alone
+    known = {p.relative_to(input_dir).as_posix() for p in inputs}
+    manifest['entries'] = {rel: e for rel, e in sorted(manifest['entries'].items()) if rel in known}
+    _write_atomic(manifest_path, json.dumps(manifest, indent=2).encode())
+
+    elapsed = time.perf_counter() - start
+    print("=" * 50)
+    print(f"{'✅' if not counts['failed'] else '⚠️ '} Batch done in {elapsed:.1f}s: {counts['converted']} converted, "
+          f"{counts['skipped']} unchanged (cache hits), {counts['failed']} failed")
+    if counts['converted']:
+        print(f"   ⚡ {counts['converted'] / elapsed:.1f} meshes/s, "
+              f"{converted_bytes / (1024 * 1024) / elapsed:.1f} MB/s of OBJ input")
+    print(f"   📒 Manifest: {manifest_path}")
+    return counts['failed'] == 0
+
+
+def _convert_job(obj_path, target_dir, options, previous, cache_options=None):
+    """Pool worker: convert one OBJ unless the manifest entry still matches.
+
+    Converts into a scratch directory inside `target_dir` and moves each
+    file into place with os.replace, so readers never see half-written
+    outputs. Returns (status, manifest entry, captured log, seconds).
+    """
+    obj_path, target_dir = Path(obj_path), Path(target_dir)
+    start = time.perf_counter()
+    input_hash = _hash_file(obj_path)
+    if (previous and previous['input_hash'] == input_hash and previous['options'] == options
+            and all(_hash_file(target_dir / name) == digest if (target_dir / name).exists() else False
+                    for name, digest in previous['outputs'].items())):
+        return 'skipped', previous, '', time.perf_counter() - start
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    log = io.StringIO()
+    scratch = Path(tempfile.mkdtemp(prefix='.kr_batch_', dir=target_dir))
+    try:
+        convert_options = dict({k: v for k, v in options.items() if k != 'converter'}, **(cache_options or {}))
+        with contextlib.redirect_stdout(log):
+            ok = convert_mesh(obj_path, obj_path.stem, scratch, **convert_options)
+        if not ok:
+            return 'failed', None, log.getvalue(), time.perf_counter() - start
+
+        outputs = {}
+        for f in sorted(scratch.iterdir()):
+            if f.is_file():
+                outputs[f.name] = _hash_file(f)
+                os.replace(f, target_dir / f.name)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    # Drop files an earlier run wrote with other options (e.g. .vtx after switching to .krm)
+    for name in (previous or {}).get('outputs', {}):
+        if name not in outputs and (target_dir / name).exists():
+            (target_dir / name).unlink()
+
+    entry = {
+        'input_hash': input_hash,
+        'input_size': obj_path.stat().st_size,
+        'options': options,
+        'outputs': outputs,
+    }
+    return 'converted', entry, log.getvalue(), time.perf_counter() - start
+
+
+def _hash_file(path):
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_manifest(path):
+    """Read a batch manifest; a missing or unreadable one starts empty."""
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+        print(f"   ⚠️  Ignoring manifest from another converter version: {path}")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"   ⚠️  Ignoring unreadable manifest {path}: {e}")
+    return {'version': MANIFEST_VERSION, 'entries': {}}
+
+
+def _write_atomic(path, data):
+    """Write `data` to a temporary file next to `path`, then swap it in."""
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
 
 def find_ksp_gamedata():
@@ -239,7 +3030,7 @@ def install_to_ksp(mesh_name):
     # Copy files
     src_dir = Path(".")
     copied = []
-    for ext in ['.vtx', '.tex', '.nml', '.idx']:
+    for ext in MESH_EXTENSIONS:
         src = src_dir / f"{mesh_name}{ext}"
         if src.exists():
             dst = mod_path / f"{mesh_name}{ext}"
@@ -270,6 +3061,7 @@ def interactive_mode():
         for i, f in enumerate(obj_files, 1):
             print(f"   {i}. {f.name}")
         print("   0. Enter path manually")
+        print("   a. Convert all OBJ files here and in subfolders")
     else:
         print("\n📂 No OBJ files found in current directory")
     
@@ -277,6 +3069,11 @@ def interactive_mode():
     while True:
         choice = input("\nSelect file (number or path): ").strip()
         
+        if obj_files and choice.lower() == 'a':
+            convert_directory(".")
+            print("\n✨ Done!")
+            return
+        
         if choice.isdigit():
             idx = int(choice)
             if idx == 0:
@@ -311,22 +3108,73 @@ def interactive_mode():
     print("\n✨ Done!")
 
 
+def _lod_percent(value):
+    """argparse type for --lod: a percentage strictly between 0 and 100."""
+    percent = float(value)
+    if not 0 < percent < 100:
+        raise argparse.ArgumentTypeError(f"LOD percentage must be between 0 and 100, got {value}")
+    return percent
+
+
 def main():
     parser = argparse.ArgumentParser(
-        description='Convert OBJ files to Kerbal Space Program mesh format',
+        description='Convert OBJ, GLB/glTF, PLY and STL files to Kerbal Space Program mesh format',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   %(prog)s ValentinaHair.obj
   %(prog)s hair.obj --name BetterHair --install
+  %(prog)s hair.obj --compact         # 16-bit packed .krm
+  %(prog)s hair.glb                   # binary glTF, PLY and STL work too
+  %(prog)s hair.obj --lod 50 25       # also write hair_LOD1, hair_LOD2
+  %(prog)s hair.obj --tangents        # .tan for KSP/Bumped shaders
+  %(prog)s hair.obj --clean           # weld and strip wasted geometry
+  %(prog)s hair.obj --split           # hair_Ponytail, hair_Clip, ... per o/g/usemtl
+  %(prog)s scan.obj --stream          # huge files in bounded memory
+  %(prog)s HairPack/ -o Models/ -j 8  # whole tree, unchanged meshes skipped
   %(prog)s                           # Interactive mode
         """
     )
     
-    parser.add_argument('input', nargs='?', help='Input OBJ file')
+    parser.add_argument('input', nargs='?',
+                        help='Input .obj/.glb/.gltf/.ply/.stl file, or a directory to convert every one under it')
     parser.add_argument('-n', '--name', help='Output name (default: input filename)')
     parser.add_argument('-o', '--output-dir', help='Output directory')
     parser.add_argument('-i', '--install', action='store_true', help='Install to KSP after conversion')
+    parser.add_argument('-f', '--format', choices=['streams', 'krm'], default='streams',
+                        help='streams: separate .vtx/.tex/.nml/.idx files (default); krm: one packed .krm container')
+    parser.add_argument('--normal-weighting', choices=NORMAL_WEIGHTINGS, default='area',
+                        help='How face normals are weighted when generating missing normals (default: area)')
+    parser.add_argument('--tangents', action='store_true',
+                        help='Also write per-vertex tangents (.tan / TAN section) for bumped shaders')
+    parser.add_argument('--sort-views', action='store_true',
+                        help='Translucent shaders: overdraw-minimizing triangle order plus back-to-front orders '
+                             'for the six axis views (.srt / SRT section)')
+    parser.add_argument('--split', action='store_true',
+                        help='Write every o/g/usemtl part of an OBJ as its own mesh, Name_<part>')
+    parser.add_argument('--clean', action='store_true',
+                        help='Weld near-coincident vertices and remove degenerate, duplicate and unused geometry')
+    parser.add_argument('--weld-epsilon', type=float, default=CLEAN_WELD_EPSILON, metavar='FRACTION',
+                        help=f'--clean weld distance as a fraction of the mesh size (default: {CLEAN_WELD_EPSILON:g})')
+    parser.add_argument('--lod', type=_lod_percent, nargs='+', metavar='PERCENT',
+                        help='Also write Name_LOD1, Name_LOD2, ... simplified to these percentages of the triangles')
+    parser.add_argument('--stream', action='store_true',
+                        help='Convert in bounded memory via spill files next to the output (streams format only)')
+    parser.add_argument('--optimize-cache', action='store_true',
+                        help='Reorder triangles (Tipsify) and vertices for GPU vertex cache reuse')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always reparse the input instead of reusing the parsed-mesh cache')
+    parser.add_argument('--cache-size', type=float, default=MESH_CACHE_SIZE_MB, metavar='MB',
+                        help=f'Parsed-mesh cache limit; least recently used entries are evicted '
+                             f'(default: {MESH_CACHE_SIZE_MB})')
+    parser.add_argument('-j', '--jobs', type=int, help='Worker processes for directory input (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Directory input: reconvert everything, ignoring the manifest')
+    parser.add_argument('--compact', action='store_true',
+                        help='Write a .krm with 16-bit streams: int16 positions scaled to the bounds, '
+                             'uint16 indices when they fit (implies --format krm)')
+    parser.add_argument('--compact-encoding', choices=COMPACT_ENCODINGS, default='snorm16',
+                        help='UV/normal encoding used by --compact (default: snorm16)')
     
     args = parser.parse_args()
     
@@ -335,8 +3183,29 @@ Examples:
         interactive_mode()
         return
     
+    # Directory mode: convert the whole tree in parallel
+    if Path(args.input).is_dir():
+        if args.name or args.install:
+            print("❌ Error: --name and --install work on single files, not directories")
+            sys.exit(1)
+        ok = convert_directory(args.input, args.output_dir, args.jobs, args.force,
+                               normal_weighting=args.normal_weighting, mesh_format=args.format,
+                               compact=args.compact_encoding if args.compact else None,
+                               optimize_cache=args.optimize_cache, lods=args.lod, stream=args.stream,
+                               cache=not args.no_cache, cache_size=args.cache_size, tangents=args.tangents,
+                               sort_views=args.sort_views, clean=args.weld_epsilon if args.clean else None,
+                               split=args.split)
+        sys.exit(0 if ok else 1)
+    
+    if args.split and args.install:
+        print("❌ Error: --install copies one mesh; copy the --split parts from the output folder")
+        sys.exit(1)
+    
     # Batch mode
-    if convert_mesh(args.input, args.name, args.output_dir):
+    if convert_mesh(args.input, args.name, args.output_dir, args.normal_weighting, args.format,
+                    args.compact_encoding if args.compact else None, args.optimize_cache, args.lod, args.stream,
+                    not args.no_cache, args.cache_size, args.tangents, args.sort_views,
+                    args.weld_epsilon if args.clean else None, args.split):
         output_name = args.name or Path(args.input).stem
         
         if args.install:
@@ -538,12 +538,36 @@ namespace KerbonautRedux
                 return;
             }
 
+            string[] krmFiles = Directory.GetFiles(MODELS_DIR, "*" + PackedMesh.Extension);
+            Debug.Log($"[KerbonautRedux] Found {krmFiles.Length} {PackedMesh.Extension} files in {MODELS_DIR}");
+
+            foreach (string krmPath in krmFiles)
+            {
+                string name = Path.GetFileNameWithoutExtension(krmPath);
+                try
+                {
+                    Mesh mesh = PackedMesh.Load(krmPath);
+                    if (mesh != null)
+                    {
+                        meshes[name] = mesh;
+                        Debug.Log($"[KerbonautRedux] Loaded packed mesh: {name}");
+                    }
+                }
+                catch (System.Exception ex)
+                {
+                    Debug.LogWarning($"[KerbonautRedux] Failed to load packed mesh {name}: {ex.Message}");
+                }
+            }
+
             string[] vtxFiles = Directory.GetFiles(MODELS_DIR, "*.vtx");
             Debug.Log($"[KerbonautRedux] Found {vtxFiles.Length} .vtx files in {MODELS_DIR}");
 
             foreach (string vtxPath in vtxFiles)
             {
                 string name = Path.GetFileNameWithoutExtension(vtxPath);
+                if (meshes.ContainsKey(name))
+                    continue;
+
                 try
                 {
                     Mesh mesh = LoadMesh(name);
@@ -603,6 +627,7 @@ namespace KerbonautRedux
             Vector3[] vertices = LoadVector3Array(basePath + ".vtx");
             Vector2[] uvs = LoadVector2Array(basePath + ".tex");
             Vector3[] normals = LoadVector3ArrayIfExists(basePath + ".nml");
+            Vector4[] tangents = File.Exists(basePath + ".tan") ? LoadVector4Array(basePath + ".tan") : null;
             int[] indices = LoadIntArray(basePath + ".idx");
 
             if (vertices == null || indices == null)
@@ -621,6 +646,10 @@ namespace KerbonautRedux
             else
                 mesh.RecalculateNormals();
 
+            // Optional: precomputed tangents for bumped shaders
+            if (tangents != null && tangents.Length == vertices.Length)
+                mesh.tangents = tangents;
+
             mesh.RecalculateBounds();
 
             return mesh;
@@ -655,6 +684,28 @@ namespace KerbonautRedux
             return File.Exists(path) ? LoadVector3Array(path) : null;
         }
 
+        private Vector4[] LoadVector4Array(string path)
+        {
+            using (FileStream fs = File.OpenRead(path))
+            using (BinaryReader reader = new BinaryReader(fs))
+            {
+                uint count = reader.ReadUInt32();
+                Vector4[] array = new Vector4[count];
+
+                for (int i = 0; i < count; i++)
+                {
+                    array[i] = new Vector4(
+                        reader.ReadSingle(),
+                        reader.ReadSingle(),
+                        reader.ReadSingle(),
+                        reader.ReadSingle()
+                    );
+                }
+
+                return array;
+            }
+        }
+
         private Vector2[] LoadVector2Array(string path)
         {
             if (!File.Exists(path))
@@ -0,0 +1,252 @@
+using System;
+using System.IO;
+using System.Text;
+using UnityEngine;
+
+namespace KerbonautRedux
+{
+
+    // Reader for the single-file .krm mesh container written by mesh_converter.py,
+    // the Blender exporter and `kr_manager.py migrate-meshes`. Little-endian layout:
+    //   header (48 bytes)  "KRM1", u16 version, u16 flags, u32 streamCount,
+    //                      u32 vertexCount, u32 indexCount, u32 reserved,
+    //                      f32[3] boundsMin, f32[3] boundsMax
+    //   table (64 bytes per stream)  char[4] tag, u8 format, u8 components, u16 reserved,
+    //                      u32 count, u32 offset, u32 size, f32[4] decodeOffset, f32[4] decodeScale
+    //   sections           payloads, 16-byte aligned
+    // 16-bit streams (uint16, float16, snorm16) decode to offset + scale * value;
+    // float32 and int32 streams are stored as-is.
+    public static class PackedMesh
+    {
+        public const string Extension = ".krm";
+
+        private const int HEADER_SIZE = 48;
+        private const int STREAM_SIZE = 64;
+        private const ushort VERSION = 1;
+        private const ushort FLAG_BOUNDS = 1;
+
+        private const byte FORMAT_FLOAT32 = 1;
+        private const byte FORMAT_INT32 = 2;
+        private const byte FORMAT_UINT16 = 3;
+        private const byte FORMAT_FLOAT16 = 4;
+        private const byte FORMAT_SNORM16 = 5;
+
+        private struct StreamInfo
+        {
+            public string Tag;
+            public byte Format;
+            public int Components;
+            public int Count;
+            public int Offset;
+            public int Size;
+            public float[] DecodeOffset;
+            public float[] DecodeScale;
+        }
+
+        public static Mesh Load(string path)
+        {
+            byte[] data = File.ReadAllBytes(path);
+
+            if (data.Length < HEADER_SIZE || Encoding.ASCII.GetString(data, 0, 4) != "KRM1")
+                throw new InvalidDataException("not a .krm file");
+
+            ushort version = BitConverter.ToUInt16(data, 4);
+            if (version > VERSION)
+                throw new InvalidDataException($"unsupported .krm version {version}");
+
+            ushort flags = BitConverter.ToUInt16(data, 6);
+            int streamCount = (int)BitConverter.ToUInt32(data, 8);
+            if (HEADER_SIZE + (long)streamCount * STREAM_SIZE > data.Length)
+                throw new InvalidDataException("truncated stream table");
+
+            Vector3[] vertices = null;
+            Vector2[] uvs = null;
+            Vector3[] normals = null;
+            Vector4[] tangents = null;
+            int[] indices = null;
+
+            for (int i = 0; i < streamCount; i++)
+            {
+                StreamInfo stream = ReadStreamInfo(data, HEADER_SIZE + i * STREAM_SIZE);
+
+                switch (stream.Tag)
+                {
+                    case "POS ":
+                        vertices = stream.Format == FORMAT_FLOAT32
+                            ? CopyStream<Vector3>(data, stream, FORMAT_FLOAT32, 3)
+                            : ToVector3(DecodeStream(data, stream, 3));
+                        break;
+                    case "UV0 ":
+                        uvs = stream.Format == FORMAT_FLOAT32
+                            ? CopyStream<Vector2>(data, stream, FORMAT_FLOAT32, 2)
+                            : ToVector2(DecodeStream(data, stream, 2));
+                        break;
+                    case "NRM ":
+                        normals = stream.Format == FORMAT_FLOAT32
+                            ? CopyStream<Vector3>(data, stream, FORMAT_FLOAT32, 3)
+                            : ToVector3(DecodeStream(data, stream, 3));
+                        break;
+                    case "TAN ":
+                        tangents = stream.Format == FORMAT_FLOAT32
+                            ? CopyStream<Vector4>(data, stream, FORMAT_FLOAT32, 4)
+                            : ToVector4(DecodeStream(data, stream, 4));
+                        break;
+                    case "IDX ":
+                        indices = stream.Format == FORMAT_UINT16
+                            ? ToInt(CopyStream<ushort>(data, stream, FORMAT_UINT16, 1))
+                            : CopyStream<int>(data, stream, FORMAT_INT32, 1);
+                        break;
+                }
+            }
+
+            if (vertices == null || indices == null)
+                return null;
+
+            Mesh mesh = new Mesh();
+            mesh.vertices = vertices;
+            if (uvs != null)
+                mesh.uv = uvs;
+            mesh.triangles = indices;
+
+            if (normals != null)
+                mesh.normals = normals;
+            else
+                mesh.RecalculateNormals();
+
+            // Optional: precomputed tangents for bumped shaders
+            if (tangents != null && tangents.Length == vertices.Length)
+                mesh.tangents = tangents;
+
+            if ((flags & FLAG_BOUNDS) != 0)
+            {
+                Bounds bounds = new Bounds();
+                bounds.SetMinMax(ReadVector3(data, 24), ReadVector3(data, 36));
+                mesh.bounds = bounds;
+            }
+            else
+            {
+                mesh.RecalculateBounds();
+            }
+
+            return mesh;
+        }
+
+        private static StreamInfo ReadStreamInfo(byte[] data, int offset)
+        {
+            return new StreamInfo
+            {
+                Tag = Encoding.ASCII.GetString(data, offset, 4),
+                Format = data[offset + 4],
+                Components = data[offset + 5],
+                Count = (int)BitConverter.ToUInt32(data, offset + 8),
+                Offset = (int)BitConverter.ToUInt32(data, offset + 12),
+                Size = (int)BitConverter.ToUInt32(data, offset + 16),
+                DecodeOffset = ReadFloats(data, offset + 20, 4),
+                DecodeScale = ReadFloats(data, offset + 36, 4),
+            };
+        }
+
+        private static float[] ReadFloats(byte[] data, int offset, int count)
+        {
+            float[] values = new float[count];
+            for (int i = 0; i < count; i++)
+                values[i] = BitConverter.ToSingle(data, offset + i * 4);
+            return values;
+        }
+
+        private static Vector3 ReadVector3(byte[] data, int offset)
+        {
+            return new Vector3(
+                BitConverter.ToSingle(data, offset),
+                BitConverter.ToSingle(data, offset + 4),
+                BitConverter.ToSingle(data, offset + 8)
+            );
+        }
+
+        private static float[] DecodeStream(byte[] data, StreamInfo stream, int components)
+        {
+            float[] values;
+            switch (stream.Format)
+            {
+                case FORMAT_SNORM16:
+                    short[] packed = CopyStream<short>(data, stream, FORMAT_SNORM16, components);
+                    values = new float[packed.Length];
+                    for (int i = 0; i < packed.Length; i++)
+                        values[i] = Math.Max(packed[i] / 32767f, -1f);
+                    break;
+                case FORMAT_FLOAT16:
+                    ushort[] halves = CopyStream<ushort>(data, stream, FORMAT_FLOAT16, components);
+                    values = new float[halves.Length];
+                    for (int i = 0; i < halves.Length; i++)
+                        values[i] = Mathf.HalfToFloat(halves[i]);
+                    break;
+                default:
+                    throw new InvalidDataException($"stream '{stream.Tag}' has format {stream.Format}x{stream.Components}");
+            }
+
+            for (int i = 0; i < values.Length; i++)
+            {
+                int c = i % components;
+                values[i] = stream.DecodeOffset[c] + stream.DecodeScale[c] * values[i];
+            }
+            return values;
+        }
+
+        private static Vector3[] ToVector3(float[] values)
+        {
+            Vector3[] result = new Vector3[values.Length / 3];
+            for (int i = 0; i < result.Length; i++)
+                result[i] = new Vector3(values[i * 3], values[i * 3 + 1], values[i * 3 + 2]);
+            return result;
+        }
+
+        private static Vector4[] ToVector4(float[] values)
+        {
+            Vector4[] result = new Vector4[values.Length / 4];
+            for (int i = 0; i < result.Length; i++)
+                result[i] = new Vector4(values[i * 4], values[i * 4 + 1], values[i * 4 + 2], values[i * 4 + 3]);
+            return result;
+        }
+
+        private static Vector2[] ToVector2(float[] values)
+        {
+            Vector2[] result = new Vector2[values.Length / 2];
+            for (int i = 0; i < result.Length; i++)
+                result[i] = new Vector2(values[i * 2], values[i * 2 + 1]);
+            return result;
+        }
+
+        private static int[] ToInt(ushort[] values)
+        {
+            int[] result = new int[values.Length];
+            for (int i = 0; i < values.Length; i++)
+                result[i] = values[i];
+            return result;
+        }
+
+        private static int ComponentSize(byte format)
+        {
+            return format == FORMAT_FLOAT32 || format == FORMAT_INT32 ? 4 : 2;
+        }
+
+        // T is either the whole element (Vector3, int) or a single component (short, ushort)
+        private static unsafe T[] CopyStream<T>(byte[] data, StreamInfo stream, byte format, int components) where T : unmanaged
+        {
+            if (stream.Format != format || stream.Components != components)
+                throw new InvalidDataException($"stream '{stream.Tag}' has format {stream.Format}x{stream.Components}");
+            if (stream.Size != (long)stream.Count * components * ComponentSize(format) || stream.Offset < 0 || (long)stream.Offset + stream.Size > data.Length)
+                throw new InvalidDataException($"stream '{stream.Tag}' is out of bounds");
+
+            T[] result = new T[stream.Size / sizeof(T)];
+            if (stream.Size == 0)
+                return result;
+
+            fixed (byte* src = &data[stream.Offset])
+            fixed (T* dst = result)
+            {
+                Buffer.MemoryCopy(src, dst, stream.Size, stream.Size);
+            }
+            return result;
+        }
+    }
+}
@@ -0,0 +1,294 @@
+"""Regression tests for mesh_converter.py and the kr_mesh reader it feeds.
+
+Run from the repository root with `python -m pytest KerbonautRedux-Mod/tests`.
+"""
+import ast
+import base64
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+ROOT = Path(__file__).resolve().parents[2]
+DIST = ROOT / "KerbonautRedux-Mod" / "dist"
+sys.path.insert(0, str(DIST))
+sys.path.insert(0, str(ROOT / "KerbonautRedux-CosmeticManager"))
+
+import mesh_converter as mc  # noqa: E402
+import kr_mesh  # noqa: E402
+
+
+OBJ_TEXT = """\
+o Hair
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+v 0.5 0.5 1
+vt 0 0
+vt 1 0
+vt 1 1
+vt 0 1
+vn 0 0 1
+vn 0 0.6 0.8
+f 1/1/1 2/2/1 3/3/1 4/4/1
+f 1/1/2 2/2/2 5/3/2
+f 2/2/2 3/3/2 5/3/2
+"""
+
+
+def write_obj(tmp_path, text, name="mesh.obj"):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def grid(n, shuffle=False):
+    """An n x n quad grid as (positions, uvs, flat triangle indices)."""
+    i, j = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    a = (i * (n + 1) + j).ravel()
+    b, c = a + 1, a + n + 1
+    triangles = np.stack([a, b, c + 1, a, c + 1, c], axis=1).reshape(-1, 3)
+    if shuffle:
+        triangles = triangles[np.random.default_rng(0).permutation(len(triangles))]
+    u, v = np.meshgrid(np.linspace(0, 1, n + 1), np.linspace(0, 1, n + 1), indexing="ij")
+    positions = np.stack([u.ravel(), v.ravel(), np.zeros(u.size)], axis=1).astype(np.float32)
+    return positions, np.stack([u.ravel(), v.ravel()], axis=1).astype(np.float32), triangles.reshape(-1).astype(np.int32)
+
+
+def uv_sphere(columns=48, rows=24):
+    """A UV sphere welded per (position, uv): the u = 0/1 column is a seam of split copies."""
+    u, v = np.meshgrid(np.linspace(0, 1, columns + 1), np.linspace(0, 1, rows + 1), indexing="ij")
+    theta, phi = u.ravel() * 2 * np.pi, v.ravel() * np.pi
+    positions = np.round(np.stack([np.sin(phi) * np.cos(theta), np.sin(phi) * np.sin(theta), np.cos(phi)], axis=1), 9)
+    uvs = np.stack([u.ravel(), v.ravel()], axis=1)
+    i, j = np.meshgrid(np.arange(columns), np.arange(rows), indexing="ij")
+    a = (i * (rows + 1) + j).ravel()
+    b, c = a + 1, a + rows + 1
+    triangles = np.stack([a, b, c + 1, a, c + 1, c], axis=1).reshape(-1, 3)
+
+    # Poles and seam columns: one vertex per distinct (position, uv)
+    _, first, inverse = np.unique(np.concatenate([positions, uvs], axis=1), axis=0,
+                                  return_index=True, return_inverse=True)
+    positions, uvs, triangles = positions[first], uvs[first], inverse.reshape(-1)[triangles]
+    position_ids = np.unique(positions, axis=0, return_inverse=True)[1].reshape(-1)
+    corners = position_ids[triangles]
+    keep = (corners[:, 0] != corners[:, 1]) & (corners[:, 1] != corners[:, 2]) & (corners[:, 2] != corners[:, 0])
+    return positions, uvs, triangles[keep].reshape(-1), position_ids
+
+
+def triangle_set(indices):
+    return sorted(map(tuple, np.asarray(indices).reshape(-1, 3).tolist()))
+
+
+# OBJ parsing
+
+def test_bulk_and_fallback_obj_parsers_agree(tmp_path, capsys):
+    bulk = mc.parse_obj(write_obj(tmp_path, OBJ_TEXT))
+    assert "falling back" not in capsys.readouterr().out
+
+    # An inline comment is something only the line parser handles
+    irregular = OBJ_TEXT.replace("f 1/1/2 2/2/2 5/3/2", "f 1/1/2 2/2/2 5/3/2  # tip")
+    fallback = mc.parse_obj(write_obj(tmp_path, irregular, "irregular.obj"))
+    assert "falling back" in capsys.readouterr().out
+
+    for bulk_values, fallback_values in zip(bulk[:3], fallback[:3]):
+        np.testing.assert_array_equal(np.asarray(bulk_values), np.asarray(fallback_values))
+    np.testing.assert_array_equal(bulk[3].offsets, fallback[3].offsets)
+    np.testing.assert_array_equal(bulk[3].corners, fallback[3].corners)
+
+
+def test_obj_faces_are_fanned_in_order(tmp_path):
+    _, _, _, faces = mc.parse_obj(write_obj(tmp_path, OBJ_TEXT))
+    assert faces.offsets.tolist() == [0, 4, 7, 10]
+    triangles = mc.triangulate_faces(faces)
+    # Zero-based (v, vt, vn); the quad fans from its first corner
+    assert triangles[:, 0].tolist() == [0, 1, 2, 0, 2, 3, 0, 1, 4, 1, 2, 4]
+    assert triangles[6].tolist() == [0, 0, 1]
+
+
+def test_python_parser_without_numpy(tmp_path, monkeypatch):
+    monkeypatch.setattr(mc, "np", None)
+    vertices, normals, uvs, faces = mc.parse_obj(write_obj(tmp_path, OBJ_TEXT))
+    assert len(vertices) == 5 and len(normals) == 2 and len(uvs) == 4
+    assert [len(face) for face in faces] == [4, 3, 3]
+
+
+# Welding
+
+def test_weld_vertices_matches_fallback():
+    corners = np.array([[0, 0, 0], [1, 1, 0], [2, 2, 0], [0, 0, 0], [2, 2, 0], [3, 3, -1],
+                        [0, 1, 0], [1, 1, 0]], np.int32)
+    unique, indices = mc.weld_vertices(corners)
+    assert unique.tolist() == [[0, 0, 0], [1, 1, 0], [2, 2, 0], [3, 3, -1], [0, 1, 0]]
+    assert indices.tolist() == [0, 1, 2, 0, 2, 3, 4, 1]
+
+    unique_py, indices_py = mc.weld_vertices([tuple(c) for c in corners.tolist()])
+    assert [list(c) for c in unique_py] == unique.tolist()
+    assert indices_py == indices.tolist()
+
+
+# Packed .krm output read back by the Cosmetic Manager
+
+def test_krm_round_trip(tmp_path):
+    positions, uvs, indices = grid(4)
+    normals = np.tile(np.float32([0, 0, 1]), (len(positions), 1))
+    tangents = np.tile(np.float32([1, 0, 0, 1]), (len(positions), 1))
+    path = tmp_path / "grid.krm"
+    mc.write_krm(path, positions, uvs, normals, indices, tangents=tangents)
+
+    mesh = kr_mesh.read_krm(path)
+    np.testing.assert_array_equal(mesh.vertices, positions)
+    np.testing.assert_array_equal(mesh.uvs, uvs)
+    np.testing.assert_array_equal(mesh.normals, normals)
+    np.testing.assert_array_equal(mesh.tangents, tangents)
+    np.testing.assert_array_equal(mesh.indices, indices)
+    assert kr_mesh.validate_mesh(mesh).ok
+
+
+@pytest.mark.parametrize("encoding", mc.COMPACT_ENCODINGS)
+def test_compact_krm_round_trip(tmp_path, encoding):
+    positions, uvs, indices = grid(8)
+    positions = positions * np.float32([2.0, 3.0, 1.0]) + np.float32([-1.0, 0.5, 0.25])
+    normals = np.tile(np.float32([0.6, 0.0, 0.8]), (len(positions), 1))
+    path = tmp_path / "grid.krm"
+    mc.write_krm(path, positions, uvs, normals, indices, compact=encoding)
+
+    mesh = kr_mesh.read_krm(path)
+    np.testing.assert_allclose(mesh.vertices, positions, atol=3.0 / 32767)
+    np.testing.assert_allclose(mesh.uvs, uvs, atol=1e-3)
+    np.testing.assert_allclose(mesh.normals, normals, atol=1e-3)
+    assert mesh.indices.dtype == np.uint16
+    np.testing.assert_array_equal(mesh.indices, indices)
+
+
+@pytest.mark.parametrize("vertex_count, dtype", [(mc.MAX_UNITY_VERTICES, np.uint16),
+                                                 (mc.MAX_UNITY_VERTICES + 1, np.int32)])
+def test_compact_index_width_follows_unity_limit(tmp_path, vertex_count, dtype):
+    positions = np.random.default_rng(0).random((vertex_count, 3)).astype(np.float32)
+    normals = np.tile(np.float32([0, 1, 0]), (vertex_count, 1))
+    indices = np.array([0, 1, vertex_count - 1], np.int32)
+    path = tmp_path / "big.krm"
+    mc.write_krm(path, positions, [], normals, indices, compact="snorm16")
+
+    mesh = kr_mesh.read_krm(path)
+    assert mesh.indices.dtype == dtype
+    assert mesh.indices.tolist() == indices.tolist()
+
+
+def test_converter_and_manager_share_limits():
+    assert mc.MAX_UNITY_VERTICES == kr_mesh.MAX_UNITY_VERTICES
+    assert mc.PLUGIN_FEATURES == kr_mesh.PLUGIN_FEATURES
+
+
+# Vertex cache optimization
+
+def test_optimize_vertex_cache_keeps_triangles():
+    positions, _, indices = grid(24, shuffle=True)
+    optimized = mc.optimize_vertex_cache(indices, len(positions))
+
+    # Same triangles with the same corner order (winding), only reordered
+    assert len(optimized) == len(indices)
+    assert triangle_set(optimized) == triangle_set(indices)
+    assert set(optimized.tolist()) == set(indices.tolist())
+    acmr_before, _ = mc.vertex_cache_stats(indices, len(positions))
+    acmr_after, _ = mc.vertex_cache_stats(optimized, len(positions))
+    assert acmr_after < 0.7 < acmr_before
+
+
+def test_optimize_vertex_cache_without_numpy(monkeypatch):
+    positions, _, indices = grid(12, shuffle=True)
+    expected = mc.optimize_vertex_cache(indices, len(positions)).tolist()
+    monkeypatch.setattr(mc, "np", None)
+    assert mc.optimize_vertex_cache(indices.tolist(), len(positions)) == expected
+
+
+def test_optimize_vertex_fetch_renumbers_consistently():
+    positions, _, indices = grid(6, shuffle=True)
+    remapped, order = mc.optimize_vertex_fetch(indices, len(positions))
+    assert sorted(order.tolist()) == list(range(len(positions)))
+    np.testing.assert_array_equal(order[remapped], indices)
+    # First-use order: every new id appears before any larger one
+    firsts = np.unique(remapped, return_index=True)[1]
+    assert (np.diff(firsts) > 0).all()
+
+
+# LOD simplification
+
+def test_simplify_mesh_levels_stay_valid():
+    positions, _, indices, position_ids = uv_sphere()
+    n_triangles = len(indices) // 3
+    targets = [n_triangles // 2, n_triangles // 4, n_triangles // 10]
+    levels = mc.simplify_mesh(positions, indices, targets)
+
+    assert len(levels) == len(targets)
+    previous_error = 0.0
+    for (level, error), target in zip(levels, targets):
+        triangles = level.reshape(-1, 3)
+        assert len(triangles) <= target
+        assert set(level.tolist()) <= set(indices.tolist())
+        assert error >= previous_error
+        previous_error = error
+
+        # No triangle collapsed to a point or line, and the seam did not tear open:
+        # every edge between positions is still shared by exactly two triangles
+        corners = position_ids[triangles]
+        assert ((corners[:, 0] != corners[:, 1]) & (corners[:, 1] != corners[:, 2])
+                & (corners[:, 2] != corners[:, 0])).all()
+        starts, ends = corners.reshape(-1), corners[:, [1, 2, 0]].reshape(-1)
+        _, counts = np.unique(np.minimum(starts, ends) * len(positions) + np.maximum(starts, ends),
+                              return_counts=True)
+        assert (counts == 2).all()
+
+
+def test_simplify_mesh_moves_seam_vertices():
+    positions, uvs, indices, position_ids = uv_sphere()
+    level, _ = mc.simplify_mesh(positions, indices, [len(indices) // 12])[0]
+
+    # Seam copies (u = 0 and u = 1) collapse along the seam instead of all staying put
+    seam = np.flatnonzero(np.isin(uvs[:, 0], (0.0, 1.0)) & (np.abs(positions[:, 2]) < 1))
+    assert 0 < len(set(level.tolist()) & set(seam.tolist())) < len(seam)
+
+    # ...and both sides of the seam keep matching positions
+    kept = set(level.tolist())
+    kept_positions = {tuple(positions[v]) for v in seam if v in kept and uvs[v, 0] == 0.0}
+    assert kept_positions == {tuple(positions[v]) for v in seam if v in kept and uvs[v, 0] == 1.0}
+
+
+# glTF input
+
+def test_gltf_mirrored_node_keeps_winding(tmp_path):
+    positions = np.float32([[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+    blob = positions.tobytes() + np.uint16([0, 1, 2]).tobytes()
+    gltf = {
+        "asset": {"version": "2.0"},
+        "buffers": [{"byteLength": len(blob),
+                     "uri": "data:application/octet-stream;base64," + base64.b64encode(blob).decode()}],
+        "bufferViews": [{"buffer": 0, "byteLength": 36}, {"buffer": 0, "byteOffset": 36, "byteLength": 6}],
+        "accessors": [{"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"},
+                      {"bufferView": 1, "componentType": 5123, "count": 3, "type": "SCALAR"}],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1}]}],
+        "nodes": [{"mesh": 0, "scale": [-1, 1, 1]}],
+        "scenes": [{"nodes": [0]}],
+    }
+    path = tmp_path / "mirrored.gltf"
+    path.write_text(json.dumps(gltf))
+
+    vertices, _, _, faces = mc.parse_gltf(path)
+    a, b, c = np.asarray(vertices)[faces.corners[:, 0]]
+    assert np.cross(b - a, c - a)[2] > 0
+
+
+# The Blender add-on carries copies of converter code (it installs as one file)
+
+@pytest.mark.parametrize("name", ["generate_tangents", "_cross_axes", "optimize_vertex_cache"])
+def test_addon_vendored_code_matches_converter(name):
+    def source(path):
+        text = path.read_text(encoding="utf-8")
+        node = next(n for n in ast.parse(text).body if isinstance(n, ast.FunctionDef) and n.name == name)
+        return ast.get_source_segment(text, node)
+
+    assert source(DIST / "kerbal_redux_export.py") == source(DIST / "mesh_converter.py")